@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the construction of ``SupersetResultSet`` from DB-API rows.
+
+Compares the columnar builder against the previous approach, which went through a
+structured NumPy array of objects, on synthetic rows with a mix of column types.
+
+    python scripts/benchmark_result_set.py --rows 1000000
+"""
+
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import (
+    ARROW_CONVERSION_ERRORS,
+    dedup,
+    stringify_values,
+    SupersetResultSet,
+)
+from superset.superset_typing import DbapiDescription, DbapiResult
+
+CURSOR_DESCRIPTION: DbapiDescription = [
+    ("id", "BIGINT", None, None, None, None, False),
+    ("name", "VARCHAR", None, None, None, None, True),
+    ("price", "DECIMAL", None, None, None, None, True),
+    ("ratio", "DOUBLE", None, None, None, None, True),
+    ("is_active", "BOOLEAN", None, None, None, None, True),
+    ("created_at", "TIMESTAMP", None, None, None, None, True),
+    ("tags", "ARRAY", None, None, None, None, True),
+]
+
+
+def generate_rows(count: int) -> DbapiResult:
+    start = datetime(2020, 1, 1)
+    return [
+        (
+            i,
+            f"name-{i % 1000}",
+            Decimal(i % 10_000) / 100,
+            random.random() if i % 10 else None,  # noqa: S311
+            bool(i % 2),
+            start + timedelta(minutes=i),
+            ["a", "b"] if i % 100 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_build(data: DbapiResult, cursor_description: DbapiDescription) -> pa.Table:
+    """
+    The previous construction path, through a structured array of objects.
+    """
+    column_names = dedup([col[0] for col in cursor_description])
+    array = np.array(data, dtype=[(name, "object") for name in column_names])
+    pa_data = []
+    for column in column_names:
+        try:
+            pa_data.append(pa.array(array[column].tolist()))
+        except ARROW_CONVERSION_ERRORS:
+            pa_data.append(pa.array(stringify_values(array[column]).tolist()))
+    for i, column in enumerate(column_names):
+        if pa.types.is_nested(pa_data[i].type):
+            pa_data[i] = pa.array(stringify_values(array[column]).tolist())
+        elif pa.types.is_temporal(pa_data[i].type):
+            sample = SupersetResultSet.first_nonempty(array[column])
+            if isinstance(sample, datetime) and sample.tzinfo:
+                series = pd.to_datetime(pd.Series(array[column]), utc=True)
+                pa_data[i] = pa.Array.from_pandas(
+                    series,
+                    type=pa.timestamp("ns", tz=sample.tzinfo),
+                )
+    return pa.Table.from_arrays(pa_data, names=column_names)
+
+
+def columnar_build(
+    data: DbapiResult,
+    cursor_description: DbapiDescription,
+) -> pa.Table:
+    return SupersetResultSet(data, cursor_description, BaseEngineSpec).pa_table
+
+
+def measure(func: Callable[..., Any], *args: Any) -> tuple[float, float]:
+    """
+    Return the duration in seconds and the peak memory in MiB of a function call.
+
+    Memory is traced in a separate call, since tracing slows down allocations.
+    """
+    start = time.perf_counter()
+    func(*args)
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak / 2**20
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows to generate")
+@click.option("--runs", default=3, help="Number of runs for each builder")
+def main(rows: int, runs: int) -> None:
+    print(f"Generating {rows} rows")
+    data = generate_rows(rows)
+
+    builders = {"legacy": legacy_build, "columnar": columnar_build}
+    if not legacy_build(data, CURSOR_DESCRIPTION).equals(
+        columnar_build(data, CURSOR_DESCRIPTION)
+    ):
+        raise Exception("Builders produced different tables")
+
+    print(f"\nResults (best of {runs}):\n")
+    for label, builder in builders.items():
+        results = [measure(builder, data, CURSOR_DESCRIPTION) for _ in range(runs)]
+        duration = min(result[0] for result in results)
+        peak = min(result[1] for result in results)
+        print(f"{label}: {duration:.2f} s, peak {peak:.1f} MiB")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,198 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the join of time comparison results to the result of a query.
+
+Compares the vectorized join against the previous approach, which built string join
+columns row by row and merged each offset in turn, on synthetic daily results with
+a dimension.
+
+    python scripts/benchmark_time_offsets.py --rows 1000000 --time-grain P1D
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.common.utils.dataframe_utils import left_join_offset_dfs
+from superset.constants import TimeGrain
+from superset.utils.date_parser import normalize_time_delta
+
+TIME_OFFSETS = [
+    "1 day ago",
+    "1 week ago",
+    "4 weeks ago",
+    "1 year ago",
+    "2 years ago",
+]
+
+
+def generate_df(
+    start: pd.Timestamp,
+    days: int,
+    categories: int,
+    metric: str,
+) -> pd.DataFrame:
+    dates = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame(
+        {
+            "__timestamp": np.repeat(dates, categories),
+            "category": np.tile([f"category-{i}" for i in range(categories)], days),
+            metric: np.random.randint(0, 1000, days * categories),
+        }
+    )
+
+
+def generate_dfs(
+    rows: int,
+    days: int,
+) -> tuple[pd.DataFrame, dict[str, pd.DataFrame]]:
+    """
+    Return the result of a query and of its time comparison queries.
+    """
+    categories = max(rows // days, 1)
+    start = pd.Timestamp("2020-01-01")
+    df = generate_df(start, days, categories, "count")
+    offset_dfs = {
+        offset: generate_df(
+            start + pd.DateOffset(**normalize_time_delta(offset)),
+            days,
+            categories,
+            f"count__{offset}",
+        )
+        for offset in TIME_OFFSETS
+    }
+    return df, offset_dfs
+
+
+def legacy_join(
+    df: pd.DataFrame,
+    offset_dfs: dict[str, pd.DataFrame],
+    time_grain: str,
+) -> pd.DataFrame:
+    """
+    The previous join, with string join columns and a merge per offset.
+    """
+    # the models can only be imported once the app is initialized
+    from superset.models.helpers import ExploreMixin
+
+    mixin = ExploreMixin()
+    join_keys = ["__timestamp", "category"]
+    df = df.copy()
+    for offset, offset_df in offset_dfs.items():
+        offset_df, actual_join_keys = mixin._determine_join_keys(
+            df,
+            offset_df.copy(),
+            offset,
+            time_grain,
+            join_keys,
+            False,
+            None,
+        )
+        df = mixin._perform_join(df, offset_df, actual_join_keys)
+        df = mixin._apply_cleanup_logic(df, offset, time_grain, join_keys, False)
+    return df
+
+
+def vectorized_join(
+    df: pd.DataFrame,
+    offset_dfs: dict[str, pd.DataFrame],
+    time_grain: str,
+) -> pd.DataFrame:
+    joined_df = left_join_offset_dfs(
+        df,
+        offset_dfs,
+        time_grain,
+        ["__timestamp", "category"],
+    )
+    if joined_df is None:
+        raise Exception("The results can't be joined on vectorized keys")
+    return joined_df
+
+
+def measure(func: Callable[..., Any], *args: Any) -> tuple[float, float]:
+    """
+    Return the duration in seconds and the peak memory in MiB of a function call.
+
+    Memory is traced in a separate call, since tracing slows down allocations.
+    """
+    start = time.perf_counter()
+    func(*args)
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak / 2**20
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows to generate")
+@click.option("--days", default=2_000, help="Number of days in the results")
+@click.option(
+    "--time-grain",
+    default=TimeGrain.DAY.value,
+    type=click.Choice(
+        [TimeGrain.DAY.value, TimeGrain.WEEK.value, TimeGrain.MONTH.value]
+    ),
+    help="Time grain of the join",
+)
+@click.option("--runs", default=1, help="Number of runs for each join")
+def main(rows: int, days: int, time_grain: str, runs: int) -> None:
+    print(f"Generating {rows} rows with {len(TIME_OFFSETS)} time offsets")
+    df, offset_dfs = generate_dfs(rows, days)
+    if time_grain != TimeGrain.DAY:
+        # keep a row per period, so that each row has a single match
+        df = df[df["__timestamp"].dt.day == 1]
+        offset_dfs = {
+            offset: offset_df[offset_df["__timestamp"].dt.day == 1]
+            for offset, offset_df in offset_dfs.items()
+        }
+
+    joins = {"legacy": legacy_join, "vectorized": vectorized_join}
+    # the legacy join doesn't always keep the order of the rows
+    pd.testing.assert_frame_equal(
+        legacy_join(df, offset_dfs, time_grain)
+        .sort_values(["__timestamp", "category"])
+        .reset_index(drop=True),
+        vectorized_join(df, offset_dfs, time_grain)
+        .sort_values(["__timestamp", "category"])
+        .reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    print(f"\nResults (best of {runs}):\n")
+    for label, join in joins.items():
+        results = [measure(join, df, offset_dfs, time_grain) for _ in range(runs)]
+        duration = min(result[0] for result in results)
+        peak = min(result[1] for result in results)
+        print(f"{label}: {duration:.2f} s, peak {peak:.1f} MiB")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
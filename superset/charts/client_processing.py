@@ -34,9 +34,11 @@ from flask import current_app
 from flask_babel import gettext as __
 
 from superset.common.chart_data import ChartDataResultFormat
+from superset.dataframe import df_to_columnar
 from superset.extensions import event_logger
 from superset.utils.core import (
     extract_dataframe_dtypes,
+    GenericDataType,
     get_column_names,
     get_metric_names,
 )
@@ -340,6 +342,14 @@ def apply_client_processing(  # noqa: C901
 
         if query["result_format"] == ChartDataResultFormat.JSON:
             df = pd.DataFrame.from_dict(data)
+        elif query["result_format"] == ChartDataResultFormat.JSON_COLUMNAR:
+            df = pd.DataFrame(data["data"], columns=data["columns"])
+            # datetimes are encoded as milliseconds since epoch
+            for column, coltype in zip(
+                query["colnames"], query["coltypes"], strict=False
+            ):
+                if coltype == GenericDataType.TEMPORAL and column in df:
+                    df[column] = pd.to_datetime(df[column], unit="ms")
         elif query["result_format"] == ChartDataResultFormat.CSV:
             # Use custom NA values configuration for
             # reports to avoid unwanted conversions
@@ -387,6 +397,8 @@ def apply_client_processing(  # noqa: C901
 
         if query["result_format"] == ChartDataResultFormat.JSON:
             query["data"] = processed_df.to_dict()
+        elif query["result_format"] == ChartDataResultFormat.JSON_COLUMNAR:
+            query["data"] = df_to_columnar(processed_df)
         elif query["result_format"] == ChartDataResultFormat.CSV:
             buf = StringIO()
             processed_df.to_csv(buf, index=show_default_index)
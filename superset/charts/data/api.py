@@ -19,7 +19,7 @@ from __future__ import annotations
 import contextlib
 import logging
 from datetime import datetime
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, Iterator, TYPE_CHECKING
 
 from flask import current_app as app, g, make_response, request, Response
 from flask_appbuilder.api import expose, protect
@@ -44,6 +44,10 @@ from superset.commands.chart.exceptions import (
     ChartDataCacheLoadError,
     ChartDataQueryFailedError,
 )
+from superset.commands.streaming_export.base import (
+    compress_stream,
+    get_stream_content_encoding,
+)
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
@@ -431,7 +435,7 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
-        if result_format == ChartDataResultFormat.JSON:
+        if result_format in ChartDataResultFormat.json_like():
             queries = result["queries"]
             if security_manager.is_guest_user():
                 for query in queries:
@@ -615,8 +619,7 @@ class ChartDataRestApi(ChartRestApi):
             logger.info("Using expected_rows from frontend: %d", expected_rows)
 
         # Execute streaming command
-        # TODO: Make chunk size configurable via SUPERSET_CONFIG
-        chunk_size = 1024
+        chunk_size = app.config["CSV_STREAMING_CHUNK_SIZE"]
         command = StreamingCSVExportCommand(query_context, chunk_size)
         command.validate()
 
@@ -626,15 +629,23 @@ class ChartDataRestApi(ChartRestApi):
         # Get encoding from config
         encoding = app.config.get("CSV_EXPORT", {}).get("encoding", "utf-8")
 
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+        csv_stream = csv_generator_callable()  # Call the callable to get generator
+        stream: Iterator[str] | Iterator[bytes] = csv_stream
+        if content_encoding := get_stream_content_encoding():
+            stream = compress_stream(csv_stream, content_encoding)
+            headers["Content-Encoding"] = content_encoding
+            headers["Vary"] = "Accept-Encoding"
+
         # Create response with streaming headers
         response = Response(
-            csv_generator_callable(),  # Call the callable to get generator
+            stream,
             mimetype=f"text/csv; charset={encoding}",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Cache-Control": "no-cache",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-            },
+            headers=headers,
             direct_passthrough=False,  # Flask must iterate generator
         )
 
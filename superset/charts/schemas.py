@@ -1488,6 +1488,20 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the cached result expired and being refreshed in the "
+            "background"
+        },
+        allow_none=True,
+    )
+    derived_from = fields.Dict(
+        metadata={
+            "description": "The finer time grain and cache timestamp of the cached "
+            "result the data was rolled up from, if any"
+        },
+        allow_none=True,
+    )
     query = fields.String(
         metadata={
             "description": "The executed query statement. May be absent when "
@@ -41,10 +41,14 @@ class ChartWarmUpCacheCommand(BaseCommand):
         chart_or_id: Union[int, Slice],
         dashboard_id: Optional[int],
         extra_filters: Optional[str],
+        force: bool = True,
     ):
         self._chart_or_id = chart_or_id
         self._dashboard_id = dashboard_id
         self._extra_filters = extra_filters
+        self._force = force
+        # whether every query of the chart was served from the cache
+        self.is_cached = False
 
     def _get_dashboard_filters(self, chart_id: int) -> list[dict[str, Any]]:
         """Retrieve dashboard filters from extra_filters or dashboard metadata."""
@@ -71,9 +75,10 @@ class ChartWarmUpCacheCommand(BaseCommand):
             datasource_type=chart.datasource.type,
             datasource_id=chart.datasource.id,
             form_data=form_data,
-            force=True,
+            force=self._force,
         ).get_payload()
         delattr(g, "form_data")
+        self.is_cached = bool(payload.get("is_cached"))
 
         return payload["errors"] or None, payload["status"]
 
@@ -91,13 +96,18 @@ class ChartWarmUpCacheCommand(BaseCommand):
                     cast(list[QueryObjectFilterClause], dashboard_filters)
                 )
 
-        query_context.force = True
+        query_context.force = self._force
         command = ChartDataCommand(query_context)
         command.validate()
         payload = command.run()
 
+        query_results = cast(list[dict[str, Any]], payload["queries"])
+        self.is_cached = bool(query_results) and all(
+            query_result.get("is_cached") for query_result in query_results
+        )
+
         # Report the first error.
-        for query_result in cast(list[dict[str, Any]], payload["queries"]):
+        for query_result in query_results:
             error = query_result.get("error")
             status = query_result.get("status")
             if error is not None:
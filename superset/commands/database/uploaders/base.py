@@ -16,10 +16,12 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterator
 from functools import partial
 from typing import Any, Optional, TypedDict
 
 import pandas as pd
+import sqlalchemy as sa
 from flask_babel import lazy_gettext as _
 from werkzeug.datastructures import FileStorage
 
@@ -83,6 +85,15 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into dataframes, which are uploaded one after the other.
+
+        Readers able to read a file in chunks override this, so that the file doesn't
+        need to fit in memory.
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
@@ -90,28 +101,73 @@ class BaseDataReader:
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+        if_exists = self._options.get("already_exists", "fail")
+        # a table replaced by the first chunk would be lost if a later chunk failed, so
+        # the file is read at once and the table replaced by a single upload
+        dataframes = (
+            iter([self.file_to_dataframe(file)])
+            if if_exists == "replace"
+            else self.file_to_dataframes(file)
         )
+        created_table = False
+        try:
+            for df in dataframes:
+                self._dataframe_to_database(
+                    df, database, table_name, schema_name, if_exists
+                )
+                # the following chunks are added to the table created by the first one
+                created_table = created_table or if_exists != "append"
+                if_exists = "append"
+        except Exception:
+            # don't leave a table with only the first chunks of the file behind; rows
+            # appended to an existing table are not removed
+            if created_table:
+                self._drop_table(database, table_name, schema_name)
+            raise
+
+    @staticmethod
+    def _drop_table(
+        database: Database,
+        table_name: str,
+        schema_name: Optional[str],
+    ) -> None:
+        """
+        Drop a table created by an upload that failed.
+        """
+        try:
+            with database.get_sqla_engine(schema=schema_name) as engine:
+                sa.Table(table_name, sa.MetaData(), schema=schema_name).drop(
+                    engine,
+                    checkfirst=True,
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Unable to drop the partially uploaded table %s",
+                table_name,
+                exc_info=True,
+            )
 
-    def _dataframe_to_database(
+    def _dataframe_to_database(  # pylint: disable=too-many-arguments
         self,
         df: pd.DataFrame,
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        if_exists: Optional[str] = None,
     ) -> None:
         """
         Upload DataFrame to database
 
         :param df:
+        :param if_exists: What to do if the table exists, defaults to the
+            `already_exists` option
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
                 "chunksize": READ_CHUNK_SIZE,
-                "if_exists": self._options.get("already_exists", "fail"),
+                "if_exists": if_exists or self._options.get("already_exists", "fail"),
                 "index": self._options.get("dataframe_index", False),
             }
             if self._options.get("index_label") and self._options.get(
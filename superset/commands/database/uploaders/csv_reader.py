@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterable, Iterator
 from importlib import util
 from typing import Any, Optional
 
@@ -346,6 +347,34 @@ class CSVReader(BaseDataReader):
         }
         return custom_types, pandas_types
 
+    @staticmethod
+    def _limit_rows(
+        chunks: Iterable[pd.DataFrame],
+        max_rows: Optional[int],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield chunks of a CSV file until the maximum number of rows is read.
+
+        :param chunks: The chunks read from the file
+        :param max_rows: The maximum number of rows to read, or None to read them all
+        :return: The chunks, the last one truncated to the maximum number of rows
+        """
+        total_rows = 0
+        for chunk in chunks:
+            # Check if adding this chunk would exceed the row limit
+            if max_rows is not None and total_rows + len(chunk) > max_rows:
+                # Only take the needed rows from this chunk
+                remaining_rows = max_rows - total_rows
+                yield chunk.iloc[:remaining_rows]
+                return
+
+            yield chunk
+            total_rows += len(chunk)
+
+            # Stop if we've reached the desired number of rows
+            if max_rows is not None and total_rows >= max_rows:
+                return
+
     @staticmethod
     def _read_csv(  # noqa: C901
         file: FileStorage,
@@ -389,29 +418,13 @@ class CSVReader(BaseDataReader):
                 types = custom_types if custom_types else None
 
             if "chunksize" in kwargs:
-                chunks = []
-                total_rows = 0
                 max_rows = kwargs.get("nrows")
                 chunk_iterator = pd.read_csv(
                     filepath_or_buffer=file.stream,
                     **kwargs,
                 )
 
-                for chunk in chunk_iterator:
-                    # Check if adding this chunk would exceed the row limit
-                    if max_rows is not None and total_rows + len(chunk) > max_rows:
-                        # Only take the needed rows from this chunk
-                        remaining_rows = max_rows - total_rows
-                        chunk = chunk.iloc[:remaining_rows]
-                        chunks.append(chunk)
-                        break
-
-                    chunks.append(chunk)
-                    total_rows += len(chunk)
-
-                    # Break if we've reached the desired number of rows
-                    if max_rows is not None and total_rows >= max_rows:
-                        break
+                chunks = list(CSVReader._limit_rows(chunk_iterator, max_rows))
 
                 if chunks:
                     try:
@@ -470,19 +483,114 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
-    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
+    @staticmethod
+    def _infer_types(
+        file: FileStorage,
+        kwargs: dict[str, Any],
+        excluded: Iterable[Any],
+    ) -> dict[str, Any]:
         """
-        Read CSV file into a DataFrame
+        Infer the types of the columns of a CSV file from its first chunk, to read all
+        the chunks with.
 
-        :return: pandas DataFrame
-        :throws DatabaseUploadFailed: if there is an error reading the file
+        Integers and booleans are read as nullable types, since a later chunk might
+        have missing values, and other columns as strings. Dates are left to
+        `parse_dates`.
+
+        :param file: The CSV file, read again from the start afterwards
+        :param kwargs: The `pandas.read_csv` kwargs, including `chunksize`
+        :param excluded: The columns whose types shouldn't be inferred
+        :return: The types of the columns
         """
-        rows_to_read = self._options.get("rows_to_read")
-        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+        with pd.read_csv(filepath_or_buffer=file.stream, **kwargs) as reader:
+            first_chunk = next(reader, pd.DataFrame())
+        file.seek(0)
 
-        use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
+        types: dict[str, Any] = {}
+        for column, dtype in first_chunk.dtypes.items():
+            if column in excluded:
+                continue
+            if dtype.kind in "iu":
+                types[column] = "Int64"
+            elif dtype.kind == "f":
+                types[column] = "float64"
+            elif dtype.kind == "b":
+                types[column] = "boolean"
+            elif dtype.kind == "O":
+                types[column] = "str"
+        return types
 
-        kwargs = {
+    @staticmethod
+    def _read_csv_chunks(
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks of `chunksize` rows, casting each chunk as it's read.
+
+        Unlike `_read_csv`, the file is never held in memory at once. The types of
+        the columns that aren't cast are inferred from the first chunk, and applied
+        to every chunk, so that a later chunk isn't inferred differently (eg, a
+        column of integers with a blank value read as floats).
+
+        :param file: The CSV file
+        :param kwargs: The `pandas.read_csv` kwargs, including `chunksize`
+        :return: The chunks of the file
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+        read_kwargs = {**kwargs, "engine": "c", "low_memory": False, "iterator": True}
+        types = None
+        if read_kwargs.get("dtype"):
+            custom_types, pandas_types = CSVReader._split_types(read_kwargs["dtype"])
+            read_kwargs["dtype"] = pandas_types or None
+            types = custom_types or None
+
+        has_read = False
+        try:
+            read_kwargs["dtype"] = {
+                **CSVReader._infer_types(
+                    file,
+                    read_kwargs,
+                    excluded={*(types or {}), *(read_kwargs.get("parse_dates") or [])},
+                ),
+                **(read_kwargs.get("dtype") or {}),
+            }
+
+            chunks = pd.read_csv(filepath_or_buffer=file.stream, **read_kwargs)
+            for chunk in CSVReader._limit_rows(chunks, read_kwargs.get("nrows")):
+                if types:
+                    chunk = CSVReader._cast_column_types(chunk, types, read_kwargs)
+                has_read = True
+                yield chunk
+        except DatabaseUploadFailed:
+            raise
+        except UnicodeDecodeError as ex:
+            # the encoding can only be changed before any chunk has been uploaded
+            if encoding == DEFAULT_ENCODING and not has_read:
+                file.seek(0)
+                detected_encoding = CSVReader._detect_encoding(file)
+                if detected_encoding != encoding:
+                    yield from CSVReader._read_csv_chunks(
+                        file, {**kwargs, "encoding": detected_encoding}
+                    )
+                    return
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except (
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
+
+    def _get_read_csv_kwargs(self) -> dict[str, Any]:
+        return {
             "encoding": self._options.get("encoding", DEFAULT_ENCODING),
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -499,7 +607,7 @@ class CSVReader(BaseDataReader):
                 if self._options.get("null_values")  # None if an empty list
                 else None
             ),
-            "nrows": rows_to_read,
+            "nrows": self._options.get("rows_to_read"),
             "parse_dates": self._options.get("column_dates"),
             "sep": self._options.get("delimiter", ","),
             "skip_blank_lines": self._options.get("skip_blank_lines", False),
@@ -513,12 +621,41 @@ class CSVReader(BaseDataReader):
             "cache_dates": True,
         }
 
+    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
+        """
+        Read CSV file into a DataFrame
+
+        :return: pandas DataFrame
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        rows_to_read = self._options.get("rows_to_read")
+        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+
+        use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
+
+        kwargs = self._get_read_csv_kwargs()
         if use_chunking:
             kwargs["chunksize"] = chunk_size
             kwargs["iterator"] = True
 
         return self._read_csv(file, kwargs)
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into DataFrames of `READ_CSV_CHUNK_SIZE` rows when
+        `CSV_UPLOAD_STREAMING` is enabled, or into a single DataFrame otherwise
+
+        :return: pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        if not current_app.config.get("CSV_UPLOAD_STREAMING", False):
+            yield self.file_to_dataframe(file)
+            return
+
+        kwargs = self._get_read_csv_kwargs()
+        kwargs["chunksize"] = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+        yield from self._read_csv_chunks(file, kwargs)
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
         Get metadata from a CSV file
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 from uuid import UUID
@@ -22,11 +23,19 @@ from uuid import UUID
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app
+from flask_appbuilder.security.sqla.models import User
 
 from superset import db, security_manager
+from superset.charts.client_processing import apply_client_processing
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
-from superset.commands.exceptions import CommandException, UpdateFailedError
+from superset.commands.exceptions import (
+    CommandException,
+    ForbiddenError,
+    UpdateFailedError,
+)
 from superset.commands.report.alert import AlertCommand
 from superset.commands.report.exceptions import (
     ReportScheduleAlertGracePeriodError,
@@ -74,10 +83,19 @@ from superset.reports.notifications.exceptions import (
 from superset.tasks.utils import get_executor
 from superset.utils import json
 from superset.utils.core import HeaderDataType, override_user, recipients_string_to_list
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.csv import (
+    build_chart_dataframe,
+    get_chart_csv_content,
+    get_chart_csv_data,
+    get_chart_dataframe,
+)
 from superset.utils.decorators import logs_context, transaction
 from superset.utils.pdf import build_pdf_from_screenshots
-from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
+from superset.utils.screenshots import (
+    BaseScreenshot,
+    ChartScreenshot,
+    DashboardScreenshot,
+)
 from superset.utils.slack import get_channels_with_search, SlackChannelTypes
 from superset.utils.urls import get_url_path
 
@@ -351,6 +369,14 @@ class BaseReportState:
         Get chart or dashboard screenshots
         :raises: ReportScheduleScreenshotFailedError
         """
+        return list(self._iter_screenshots())
+
+    def _iter_screenshots(self) -> Iterator[bytes]:
+        """
+        Get chart or dashboard screenshots, each one as soon as it's taken; the tabs
+        of a dashboard are rendered concurrently when the webdriver supports it
+        :raises: ReportScheduleScreenshotFailedError
+        """
         start_time = datetime.utcnow()
 
         _, username = get_executor(
@@ -393,11 +419,12 @@ class BaseReportState:
                 )
                 for url in urls
             ]
+        taken = 0
         try:
-            imges = []
-            for screenshot in screenshots:
-                if imge := screenshot.get_screenshot(user=user):
-                    imges.append(imge)
+            for imge in BaseScreenshot.get_screenshots(screenshots, user=user):
+                if imge:
+                    taken += 1
+                    yield imge
             elapsed_seconds = (datetime.utcnow() - start_time).total_seconds()
             logger.info(
                 "Screenshot capture took %.2fs - execution_id: %s",
@@ -422,20 +449,56 @@ class BaseReportState:
             raise ReportScheduleScreenshotFailedError(
                 f"Failed taking a screenshot {str(ex)}"
             ) from ex
-        if not imges:
+        if not taken:
             raise ReportScheduleScreenshotFailedError()
-        return imges
 
     def _get_pdf(self) -> bytes:
         """
         Get chart or dashboard pdf
         :raises: ReportSchedulePdfFailedError
         """
-        screenshots = self._get_screenshots()
-        pdf = build_pdf_from_screenshots(screenshots)
+        pdf = build_pdf_from_screenshots(self._iter_screenshots())
 
         return pdf
 
+    def _get_chart_data(
+        self,
+        result_format: ChartDataResultFormat,
+        user: User,
+    ) -> list[dict[str, Any]]:
+        """
+        Run the saved query context of the chart in the worker, as the executor,
+        and return its queries post-processed as the chart data API would.
+        """
+        chart = self._report_schedule.chart
+        json_body = json.loads(chart.query_context)
+        json_body["result_format"] = result_format.value
+        json_body["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        json_body["force"] = self._report_schedule.force_screenshot
+
+        with override_user(user):
+            if result_format in ChartDataResultFormat.table_like() and not (
+                security_manager.can_access("can_csv", "Superset")
+            ):
+                raise ForbiddenError()
+
+            query_context = ChartDataQueryContextSchema().load(json_body)
+            command = ChartDataCommand(query_context)
+            command.validate()
+            result = command.run()
+
+            try:
+                form_data = json.loads(chart.params)
+            except (TypeError, json.JSONDecodeError):
+                form_data = {}
+            result = apply_client_processing(
+                result,
+                form_data,
+                query_context.datasource,
+            )
+
+        return result["queries"]
+
     def _get_csv_data(self) -> bytes:
         start_time = datetime.utcnow()
         url = self._get_url(result_format=ChartDataResultFormat.CSV)
@@ -444,14 +507,21 @@ class BaseReportState:
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
+        in_process = app.config["ALERT_REPORTS_CHART_DATA_IN_PROCESS"]
+        if not in_process:
+            auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            if in_process:
+                csv_data = get_chart_csv_content(
+                    self._get_chart_data(ChartDataResultFormat.CSV, user)
+                )
+            else:
+                csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
             elapsed_seconds = (datetime.utcnow() - start_time).total_seconds()
             logger.info(
                 "CSV data generation from %s as user %s took %.2fs - execution_id: %s",
@@ -494,14 +564,20 @@ class BaseReportState:
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
+        in_process = app.config["ALERT_REPORTS_CHART_DATA_IN_PROCESS"]
+        if not in_process:
+            auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            if in_process:
+                queries = self._get_chart_data(ChartDataResultFormat.JSON, user)
+                dataframe = build_chart_dataframe(queries[0])
+            else:
+                dataframe = get_chart_dataframe(url, auth_cookies)
             elapsed_seconds = (datetime.utcnow() - start_time).total_seconds()
             logger.info(
                 "DataFrame generation from %s as user %s took %.2fs - execution_id: %s",
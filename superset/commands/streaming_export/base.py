@@ -22,11 +22,14 @@ import csv
 import io
 import logging
 import time
+import zlib
 from abc import abstractmethod
 from contextlib import contextmanager
-from typing import Any, Callable, Generator
+from typing import Any, Callable, Generator, Iterable, Sequence
 
-from flask import current_app as app, g, has_app_context
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from flask import current_app as app, g, has_app_context, request
 from sqlalchemy import text
 
 from superset import db
@@ -53,6 +56,108 @@ def preserve_g_context(
     yield
 
 
+def get_byte_count(data: str) -> int:
+    """
+    Return the size of a chunk of data encoded as UTF-8.
+
+    Checking if a string is ASCII is constant time, so the data is only encoded when
+    it has multi-byte characters.
+    """
+    return len(data) if data.isascii() else len(data.encode("utf-8"))
+
+
+def write_arrow_csv_rows(rows: Sequence[Sequence[Any]], buffer: io.StringIO) -> bool:
+    """
+    Write a batch of rows to a CSV buffer as a block, with Arrow's CSV writer.
+
+    Returns `False`, without writing anything, if the rows can't be converted to Arrow
+    columns (eg, a column mixing types, or integers over 64 bits).
+    """
+    try:
+        table = pa.table(
+            {
+                str(index): pa.array(column)
+                for index, column in enumerate(zip(*rows, strict=True))
+            }
+        )
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(table, sink, pa_csv.WriteOptions(include_header=False))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return False
+
+    buffer.write(sink.getvalue().to_pybytes().decode("utf-8"))
+    return True
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    A writable file collecting the bytes written to it, to be drained between writes.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def get_stream_content_encoding() -> str | None:
+    """
+    Return the encoding to compress a streaming response with, if any.
+
+    The encodings enabled in `CSV_STREAMING_COMPRESSION` are offered in order of
+    preference, and the best one accepted by the client is picked.
+    """
+    offered = [
+        encoding
+        for encoding in app.config["CSV_STREAMING_COMPRESSION"]
+        if encoding == "gzip" or (encoding == "zstd" and pa.Codec.is_available("zstd"))
+    ]
+    if not offered:
+        return None
+
+    return request.accept_encodings.best_match(offered)
+
+
+def compress_stream(
+    chunks: Iterable[str],
+    content_encoding: str,
+) -> Generator[bytes, None, None]:
+    """
+    Compress a stream of text chunks on the fly.
+
+    The compressor is flushed after each chunk, so that the client keeps receiving
+    data while the stream is being generated.
+    """
+    if content_encoding == "gzip":
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            yield compressor.compress(chunk.encode("utf-8")) + compressor.flush(
+                zlib.Z_SYNC_FLUSH
+            )
+        yield compressor.flush()
+    elif content_encoding == "zstd":
+        sink = _ChunkSink()
+        with pa.CompressedOutputStream(pa.PythonFile(sink, mode="w"), "zstd") as stream:
+            for chunk in chunks:
+                stream.write(chunk.encode("utf-8"))
+                stream.flush()
+                yield sink.drain()
+        yield sink.drain()
+    else:
+        raise ValueError(f"Unsupported content encoding: {content_encoding}")
+
+
 class BaseStreamingCSVExportCommand(BaseCommand):
     """
     Base class for streaming CSV export commands.
@@ -77,6 +182,7 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         """
         self._chunk_size = chunk_size
         self._current_app = app._get_current_object()
+        self._encoder = app.config["CSV_STREAMING_ENCODER"]
 
     @abstractmethod
     def _get_sql_and_database(self) -> tuple[str, Any]:
@@ -102,7 +208,7 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         """Write CSV header and return header data with byte count."""
         csv_writer.writerow(columns)
         header_data = buffer.getvalue()
-        total_bytes = len(header_data.encode("utf-8"))
+        total_bytes = get_byte_count(header_data)
         buffer.seek(0)
         buffer.truncate()
         return header_data, total_bytes
@@ -117,37 +223,40 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         """
         Process database rows and yield CSV data chunks.
 
+        Each batch of rows fetched from the database is written at once, as a block
+        with the Arrow encoder, and the buffer is flushed between batches once it's
+        over the flush threshold.
+
         Yields tuples of (data_chunk, row_count, byte_count).
         """
         row_count = 0
         flush_threshold = 65536  # 64KB
 
         while rows := result_proxy.fetchmany(self._chunk_size):
-            for row in rows:
-                # Apply limit if specified
-                if limit is not None and row_count >= limit:
-                    break
-
-                csv_writer.writerow(row)
-                row_count += 1
-
-                # Check buffer size and flush if needed
-                current_size = buffer.tell()
-                if current_size >= flush_threshold:
-                    data = buffer.getvalue()
-                    data_bytes = len(data.encode("utf-8"))
-                    yield data, row_count, data_bytes
-                    buffer.seek(0)
-                    buffer.truncate()
-
-            # Break outer loop if limit reached
+            # Apply limit if specified
+            if limit is not None:
+                rows = rows[: limit - row_count]
+
+            if not (
+                self._encoder == "arrow" and rows and write_arrow_csv_rows(rows, buffer)
+            ):
+                csv_writer.writerows(rows)
+            row_count += len(rows)
+
+            # Check buffer size and flush if needed
+            if buffer.tell() >= flush_threshold:
+                data = buffer.getvalue()
+                yield data, row_count, get_byte_count(data)
+                buffer.seek(0)
+                buffer.truncate()
+
+            # Stop fetching if limit reached
             if limit is not None and row_count >= limit:
                 break
 
         # Flush remaining buffer
         if remaining_data := buffer.getvalue():
-            data_bytes = len(remaining_data.encode("utf-8"))
-            yield remaining_data, row_count, data_bytes
+            yield remaining_data, row_count, get_byte_count(remaining_data)
 
     def _execute_query_and_stream(
         self, sql: str, database: Any, limit: int | None
@@ -171,7 +280,12 @@ class BaseStreamingCSVExportCommand(BaseCommand):
 
                     # Use StringIO with csv.writer for proper escaping
                     buffer = io.StringIO()
-                    csv_writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+                    csv_writer = csv.writer(
+                        buffer,
+                        quoting=csv.QUOTE_MINIMAL,
+                        # Arrow's CSV writer ends lines with \n
+                        lineterminator="\n" if self._encoder == "arrow" else "\r\n",
+                    )
 
                     # Write CSV header
                     header_data, header_bytes = self._write_csv_header(
@@ -24,12 +24,17 @@ class ChartDataResultFormat(StrEnum):
 
     CSV = "csv"
     JSON = "json"
+    JSON_COLUMNAR = "json_columnar"
     XLSX = "xlsx"
 
     @classmethod
     def table_like(cls) -> set["ChartDataResultFormat"]:
         return {cls.CSV} | {cls.XLSX}
 
+    @classmethod
+    def json_like(cls) -> set["ChartDataResultFormat"]:
+        return {cls.JSON} | {cls.JSON_COLUMNAR}
+
 
 class ChartDataResultType(StrEnum):
     """
@@ -177,7 +177,11 @@ def _get_drill_detail(
         else:
             qry_obj_cols.append(o.column_name)
     query_obj.columns = qry_obj_cols
-    query_obj.orderby = [(query_obj.columns[0], True)]
+    # samples paginated with a cursor are ordered by a unique key
+    if not (
+        query_obj.orderby and (query_context.form_data or {}).get("cursor_pagination")
+    ):
+        query_obj.orderby = [(query_obj.columns[0], True)]
     return _get_full(query_context, query_obj, force_cached)
 
 
@@ -16,13 +16,17 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import logging
 import re
+import time
 from typing import Any, cast, ClassVar, Sequence, TYPE_CHECKING
+from uuid import uuid4
 
 import pandas as pd
 from flask import current_app
 from flask_babel import gettext as _
+from flask_caching.backends import NullCache
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
@@ -32,6 +36,7 @@ from superset.common.utils.time_range_utils import get_since_until_from_time_ran
 from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
+from superset.dataframe import df_to_columnar
 from superset.exceptions import (
     QueryObjectValidationError,
     SupersetException,
@@ -42,6 +47,7 @@ from superset.models.helpers import QueryResult
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import map_in_app_context, merge_in_session
 from superset.utils.core import (
     DatasourceType,
     DTTM_ALIAS,
@@ -49,6 +55,7 @@ from superset.utils.core import (
     GenericDataType,
     get_column_names_from_columns,
     get_column_names_from_metrics,
+    get_user_id,
     is_adhoc_column,
     is_adhoc_metric,
 )
@@ -62,6 +69,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+SINGLE_FLIGHT_LOCK_PREFIX = "chart_data_query_lock_"
+
 
 class QueryContextProcessor:
     """
@@ -98,6 +107,12 @@ class QueryContextProcessor:
             force_cached=force_cached,
         )
 
+        is_stale = (
+            bool(current_app.config["DATA_CACHE_STALE_TIMEOUT"]) and cache.is_stale
+        )
+        if is_stale and not force_query:
+            self.revalidate()
+
         if query_obj and cache_key and not cache.is_loaded:
             try:
                 if invalid_columns := [
@@ -116,17 +131,10 @@ class QueryContextProcessor:
                         )
                     )
 
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
+                if self.is_single_flight(force_query):
+                    cache = self.get_single_flight_query_result(query_obj, cache_key)
+                else:
+                    self.set_query_result(cache, query_obj, cache_key, force_query)
             except QueryObjectValidationError as ex:
                 cache.error_message = str(ex)
                 cache.status = QueryStatus.FAILED
@@ -190,6 +198,8 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": is_stale,
+            "derived_from": cache.derived_from,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -200,6 +210,118 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def set_query_result(
+        self,
+        cache: QueryCacheManager,
+        query_obj: QueryObject,
+        cache_key: str,
+        force_query: bool,
+    ) -> None:
+        """Run the query and store its result in the data cache"""
+        query_result = self.get_query_result(query_obj)
+        annotation_data = self.get_annotation_data(query_obj)
+        cache.set_query_result(
+            key=cache_key,
+            query_result=query_result,
+            annotation_data=annotation_data,
+            force_query=force_query,
+            timeout=self.get_cache_timeout(),
+            datasource_uid=self._qc_datasource.uid,
+            region=CacheRegion.DATA,
+        )
+
+    def revalidate(self) -> None:
+        """
+        Refresh the results of the query context in the background.
+
+        Stale results are served until a Celery task has re-run the queries; a key in
+        the data cache ensures that only one refresh is scheduled at a time.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        lock_key = self.cache_key(revalidate=True)
+        timeout = current_app.config["DATA_CACHE_STALE_TIMEOUT"]
+        if not cache_manager.data_cache.add(lock_key, True, timeout=timeout):
+            return
+
+        job_metadata: dict[str, Any] = {"user_id": get_user_id()}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            job_metadata["guest_token"] = guest_user.guest_token
+
+        form_data = {
+            **self._query_context.cache_values,
+            "form_data": self._query_context.form_data,
+            "custom_cache_timeout": self._query_context.custom_cache_timeout,
+        }
+        try:
+            refresh_chart_data_cache.delay(job_metadata, form_data, lock_key)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to schedule the refresh of stale chart data")
+            cache_manager.data_cache.delete(lock_key)
+
+    def is_single_flight(self, force_query: bool) -> bool:
+        """
+        Whether concurrent requests for the same query should be coalesced.
+
+        Forced queries always run, and waiting for a result only makes sense if it
+        can be read back from the data cache.
+        """
+        return (
+            current_app.config["CHART_DATA_SINGLE_FLIGHT_ENABLED"]
+            and not force_query
+            and not isinstance(cache_manager.data_cache.cache, NullCache)
+        )
+
+    def get_single_flight_query_result(
+        self,
+        query_obj: QueryObject,
+        cache_key: str,
+    ) -> QueryCacheManager:
+        """
+        Run a query only once across workers for a given cache key.
+
+        The first request acquires a lock in the data cache and runs the query, while
+        the concurrent ones wait for the result to show up in the data cache. If the
+        lock is released without a result (eg, the query failed) or the wait times out,
+        they run the query themselves. The lock expires after the timeout, so a crashed
+        worker can't hold it forever; it holds a token unique to the request holding it,
+        so that a request whose lock expired doesn't release the lock of another one.
+        """
+        timeout = current_app.config["CHART_DATA_SINGLE_FLIGHT_TIMEOUT"]
+        interval = current_app.config["CHART_DATA_SINGLE_FLIGHT_POLL_INTERVAL"]
+        lock_key = f"{SINGLE_FLIGHT_LOCK_PREFIX}{cache_key}"
+        token = uuid4().hex
+
+        if cache_manager.data_cache.add(lock_key, token, timeout=timeout):
+            try:
+                # the query might have finished since the cache was checked
+                cache = QueryCacheManager.get(cache_key, CacheRegion.DATA)
+                if not cache.is_loaded:
+                    self.set_query_result(cache, query_obj, cache_key, False)
+                return cache
+            finally:
+                if cache_manager.data_cache.get(lock_key) == token:
+                    cache_manager.data_cache.delete(lock_key)
+
+        logger.debug("Waiting for in-flight query with cache key %s", cache_key)
+        stats_logger = current_app.config["STATS_LOGGER"]
+        deadline = time.monotonic() + timeout
+        while True:
+            cache = QueryCacheManager.get(cache_key, CacheRegion.DATA)
+            if cache.is_loaded:
+                stats_logger.incr("chart_data.single_flight.coalesced")
+                return cache
+            if time.monotonic() >= deadline or not cache_manager.data_cache.has(
+                lock_key
+            ):
+                break
+            time.sleep(interval)
+
+        stats_logger.incr("chart_data.single_flight.fallback")
+        self.set_query_result(cache, query_obj, cache_key, False)
+        return cache
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -228,11 +350,19 @@ class QueryContextProcessor:
         which handles query execution, normalization, time offsets, and
         post-processing.
         """
-        return self._qc_datasource.get_query_result(query_object)
+        cache_timeout = self.get_cache_timeout()
+        force_query = (
+            self._query_context.force or cache_timeout == CACHE_DISABLED_TIMEOUT
+        )
+        return self._qc_datasource.get_query_result(
+            query_object,
+            force_query=force_query,
+            cache_timeout=cache_timeout,
+        )
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | dict[str, Any]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -250,6 +380,9 @@ class QueryContextProcessor:
                 result = excel.df_to_excel(df, **current_app.config["EXCEL_EXPORT"])
             return result or ""
 
+        if self._query_context.result_format == ChartDataResultFormat.JSON_COLUMNAR:
+            return df_to_columnar(df)
+
         return df.to_dict(orient="records")
 
     def _prepare_contribution_totals(self) -> tuple[list[int], int | None]:
@@ -336,15 +469,40 @@ class QueryContextProcessor:
                 )
             ]
 
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
+        def get_results(
+            query_obj: QueryObject,
+            query_context: QueryContext = self._query_context,
+        ) -> dict[str, Any]:
+            return get_query_results(
+                query_obj.result_type or query_context.result_type,
+                query_context,
                 query_obj,
                 force_cached,
             )
-            for query_obj in self._query_context.queries
-        ]
+
+        def get_results_in_thread(query_obj: QueryObject) -> dict[str, Any]:
+            # the datasource and the chart are bound to the session of the current
+            # thread, so other threads query copies bound to their own session
+            query_context = copy.copy(self._query_context)
+            query_context.datasource = merge_in_session(query_context.datasource)
+            query_context.slice_ = merge_in_session(query_context.slice_)
+            # pylint: disable=protected-access
+            query_context._processor = QueryContextProcessor(query_context)
+            query_obj = copy.copy(query_obj)
+            query_obj.datasource = merge_in_session(query_obj.datasource)
+            return get_results(query_obj, query_context)
+
+        # the first query runs in the current thread, loading the lazy attributes of
+        # the datasource that are then copied to the other threads
+        queries = self._query_context.queries
+        query_results = [get_results(query_obj) for query_obj in queries[:1]]
+        query_results.extend(
+            map_in_app_context(
+                get_results_in_thread,
+                queries[1:],
+                current_app.config["CHART_DATA_MAX_WORKERS"],
+            )
+        )
 
         return_value = {"queries": query_results}
 
@@ -30,14 +30,13 @@ from pandas import DataFrame
 from superset import feature_flag_manager
 from superset.common.chart_data import ChartDataResultType
 from superset.exceptions import (
-    InvalidPostProcessingError,
     QueryClauseValidationException,
     QueryObjectValidationError,
 )
 from superset.extensions import event_logger
 from superset.sql.parse import sanitize_clause, transpile_to_dialect
 from superset.superset_typing import Column, Metric, OrderBy, QueryObjectDict
-from superset.utils import json, pandas_postprocessing
+from superset.utils import json
 from superset.utils.core import (
     DTTM_ALIAS,
     find_duplicates,
@@ -48,6 +47,7 @@ from superset.utils.core import (
 )
 from superset.utils.hashing import hash_from_dict
 from superset.utils.json import json_int_dttm_ser
+from superset.utils.pandas_postprocessing.pipeline import PostProcessingPipeline
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
@@ -522,20 +522,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
-        with event_logger.log_context(f"{self.__class__.__name__}.post_processing"):
-            for post_process in self.post_processing:
-                operation = post_process.get("operation")
-                if not operation:
-                    raise InvalidPostProcessingError(
-                        _("`operation` property of post processing object undefined")
-                    )
-                if not hasattr(pandas_postprocessing, operation):
-                    raise InvalidPostProcessingError(
-                        _(
-                            "Unsupported post processing operation: %(operation)s",
-                            type=operation,
-                        )
-                    )
-                options = post_process.get("options", {})
-                df = getattr(pandas_postprocessing, operation)(df, **options)
-            return df
+        pipeline = PostProcessingPipeline.from_post_processing(self.post_processing)
+        action = f"{self.__class__.__name__}.post_processing"
+        with event_logger.log_context(action):
+            return pipeline.run(df, action=action)
@@ -22,6 +22,9 @@ from typing import Any, TYPE_CHECKING
 import numpy as np
 import pandas as pd
 
+from superset.constants import TimeGrain
+from superset.utils.date_parser import normalize_time_delta
+
 if TYPE_CHECKING:
     from superset.common.query_object import QueryObject
 
@@ -70,3 +73,139 @@ def is_datetime_series(series: Any) -> bool:
     return pd.api.types.is_datetime64_any_dtype(series) or (
         series.apply(lambda x: isinstance(x, datetime.date) or x is None).all()
     )
+
+
+def get_time_grain_join_keys(
+    series: pd.Series,
+    time_grain: str,
+    time_offset: str | None = None,
+) -> pd.Series:
+    """
+    Return the keys joining the values of a datetime column to the values of the same
+    column in the result of a time comparison query.
+
+    This is the vectorized equivalent of `ExploreMixin.generate_join_column`: values
+    are shifted by the time offset, and values in the same week, month, quarter or
+    year share a key. Other time grains are joined on the shifted values.
+
+    :param series: A datetime series
+    :param time_grain: The time grain of the series
+    :param time_offset: The time offset to shift the values by, eg, "1 year ago"
+    :returns: The join keys
+    """
+    if time_offset:
+        series = series + pd.DateOffset(**normalize_time_delta(time_offset))
+
+    if time_grain in (
+        TimeGrain.WEEK_STARTING_SUNDAY,
+        TimeGrain.WEEK_ENDING_SATURDAY,
+    ):
+        # `%U`: days before the first Sunday of the year are in week 0
+        weekday = (series.dt.dayofweek + 1) % 7
+        return series.dt.year * 100 + (series.dt.dayofyear + 6 - weekday) // 7
+
+    if time_grain in (
+        TimeGrain.WEEK,
+        TimeGrain.WEEK_STARTING_MONDAY,
+        TimeGrain.WEEK_ENDING_SUNDAY,
+    ):
+        # `%W`: days before the first Monday of the year are in week 0
+        weekday = series.dt.dayofweek
+        return series.dt.year * 100 + (series.dt.dayofyear + 6 - weekday) // 7
+
+    if time_grain == TimeGrain.MONTH:
+        return series.dt.year * 100 + series.dt.month
+
+    if time_grain == TimeGrain.QUARTER:
+        return series.dt.year * 10 + series.dt.quarter
+
+    if time_grain == TimeGrain.YEAR:
+        return series.dt.year
+
+    return series
+
+
+def left_join_offset_dfs(
+    df: pd.DataFrame,
+    offset_dfs: dict[str, pd.DataFrame],
+    time_grain: str,
+    join_keys: list[str],
+) -> pd.DataFrame | None:
+    """
+    Left join the results of time comparison queries to the result of a query, on
+    the time grain of the first join key and on the other join keys.
+
+    The rows of each offset are looked up by index with vectorized join keys, and
+    all the offsets are added to the result in a single concatenation, instead of
+    building string join columns row by row and merging each offset in turn.
+
+    Returns `None` when the results can't be joined this way: when the first join key
+    isn't a datetime column, or when the join keys of an offset aren't unique, in
+    which case its rows would be repeated for each matching row.
+
+    :param df: The result of the query
+    :param offset_dfs: The results of the time comparison queries, by time offset
+    :param time_grain: The time grain of the first join key
+    :param join_keys: The columns to join on, starting with the temporal column
+    :returns: The joined dataframe, or `None`
+    """
+    if not join_keys or df.columns[0] != join_keys[0]:
+        return None
+
+    temporal_column, *other_keys = join_keys
+    if not pd.api.types.is_datetime64_any_dtype(df[temporal_column]):
+        return None
+
+    metric_columns = [col for col in df.columns if col not in join_keys]
+    row_index = pd.RangeIndex(len(df))
+    seen_columns = set(df.columns)
+    offset_metric_dfs = []
+    for offset, offset_df in offset_dfs.items():
+        if any(key not in offset_df.columns for key in join_keys):
+            return None
+
+        columns = [
+            col
+            for col in offset_df.columns
+            if col not in join_keys and col not in seen_columns
+        ]
+        seen_columns.update(columns)
+
+        # empty results are a single row of nulls, which match nothing
+        if offset_df[temporal_column].isnull().all():
+            offset_metric_dfs.append(
+                pd.DataFrame(np.nan, index=row_index, columns=columns)
+            )
+            continue
+
+        if not pd.api.types.is_datetime64_any_dtype(offset_df[temporal_column]):
+            return None
+
+        offset_index = _get_join_index(
+            get_time_grain_join_keys(offset_df[temporal_column], time_grain),
+            [offset_df[key] for key in other_keys],
+        )
+        if not offset_index.is_unique:
+            return None
+
+        index = _get_join_index(
+            get_time_grain_join_keys(df[temporal_column], time_grain, offset),
+            [df[key] for key in other_keys],
+        )
+        offset_metric_df = offset_df[columns].set_axis(offset_index).reindex(index)
+        offset_metric_dfs.append(offset_metric_df.set_axis(row_index))
+
+    return pd.concat(
+        [
+            df[[*join_keys, *metric_columns]].set_axis(row_index),
+            *offset_metric_dfs,
+        ],
+        axis=1,
+    )
+
+
+def _get_join_index(keys: pd.Series, other_keys: list[pd.Series]) -> pd.Index:
+    if not other_keys:
+        return pd.Index(keys)
+
+    return pd.MultiIndex.from_arrays([keys, *other_keys])
@@ -0,0 +1,155 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the dataframes stored in the query cache.
+
+The cached value is a dictionary with the query metadata (query, applied filters,
+etc.) and the dataframe; codecs only serialize the latter, and the name of the codec
+is stored next to it so that values written with any codec can be read back.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from flask import current_app
+
+from superset.utils.decorators import stats_timing
+
+logger = logging.getLogger(__name__)
+
+CODEC_KEY = "df_codec"
+
+
+class QueryCacheCodec(ABC):
+    """
+    Serialize the dataframe of a cached query result.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode_df(self, df: pd.DataFrame) -> Any: ...
+
+    @abstractmethod
+    def decode_df(self, payload: Any) -> pd.DataFrame: ...
+
+
+class PickleQueryCacheCodec(QueryCacheCodec):
+    """
+    Store the dataframe as is, leaving its serialization to the cache backend.
+    """
+
+    name = "pickle"
+
+    def encode_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    def decode_df(self, payload: pd.DataFrame) -> pd.DataFrame:
+        return payload
+
+
+class ArrowQueryCacheCodec(QueryCacheCodec):
+    """
+    Store the dataframe as a compressed Arrow IPC stream.
+
+    The payload is much smaller than a pickled dataframe, and it's read without
+    copying it into Arrow memory. Dataframes that can't be represented in Arrow
+    without changing their dtypes (eg, columns with mixed types, or duplicate column
+    names) are stored with the pickle codec instead.
+    """
+
+    name = "arrow"
+
+    def __init__(self, compression: str | None = "zstd") -> None:
+        self.compression = compression
+
+    def encode_df(self, df: pd.DataFrame) -> bytes:
+        table = pa.Table.from_pandas(df)
+        if any(
+            dtype == np.dtype(object) and pa.types.is_timestamp(field.type)
+            for dtype, field in zip(df.dtypes, table.schema, strict=False)
+        ):
+            # object columns with datetimes would be read back as datetime64
+            raise ValueError("Unable to preserve the dtype of datetime objects")
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+        return sink.getvalue().to_pybytes()
+
+    def decode_df(self, payload: bytes) -> pd.DataFrame:
+        with pa.ipc.open_stream(pa.py_buffer(payload)) as reader:
+            table = reader.read_all()
+
+        # same conversion as `SupersetResultSet`, so integers with nulls are kept
+        return table.to_pandas(integer_object_nulls=True)
+
+
+def get_codec(name: str | None = None) -> QueryCacheCodec:
+    """
+    Return the codec with a given name, or the configured one.
+    """
+    name = name or current_app.config["DATA_CACHE_CODEC"]
+    if name == ArrowQueryCacheCodec.name:
+        return ArrowQueryCacheCodec(current_app.config["DATA_CACHE_ARROW_COMPRESSION"])
+    if name == PickleQueryCacheCodec.name:
+        return PickleQueryCacheCodec()
+    raise KeyError(f"Unknown data cache codec: {name}")
+
+
+def encode_cache_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Serialize the dataframe of a cache value with the configured codec.
+    """
+    codec = get_codec()
+    stats_logger = current_app.config["STATS_LOGGER"]
+
+    try:
+        with stats_timing(f"data_cache.{codec.name}.encode", stats_logger):
+            payload = codec.encode_df(value["df"])
+    except (pa.lib.ArrowException, ValueError, TypeError) as ex:
+        logger.debug("Unable to encode dataframe with %s: %s", codec.name, ex)
+        codec = PickleQueryCacheCodec()
+        payload = value["df"]
+
+    if isinstance(payload, bytes):
+        stats_logger.gauge(f"data_cache.{codec.name}.payload_bytes", len(payload))
+
+    return {**value, "df": payload, CODEC_KEY: codec.name}
+
+
+def decode_cache_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Deserialize the dataframe of a cache value, with the codec it was written with.
+
+    Values written before codecs were introduced contain a pickled dataframe.
+    """
+    codec = get_codec(value.get(CODEC_KEY, PickleQueryCacheCodec.name))
+    stats_logger = current_app.config["STATS_LOGGER"]
+
+    with stats_timing(f"data_cache.{codec.name}.decode", stats_logger):
+        df = codec.decode_df(value["df"])
+
+    return {**value, "df": df}
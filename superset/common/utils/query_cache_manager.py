@@ -17,14 +17,21 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+import pyarrow as pa
 from flask import current_app
 from flask_caching import Cache
+from flask_caching.backends import NullCache
 from pandas import DataFrame
 
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_codec import (
+    decode_cache_value,
+    encode_cache_value,
+)
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -69,6 +76,8 @@ class QueryCacheManager:
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
         queried_dttm: str | None = None,
+        is_stale: bool = False,
+        derived_from: dict[str, Any] | None = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -86,6 +95,8 @@ class QueryCacheManager:
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
         self.queried_dttm = queried_dttm
+        self.is_stale = is_stale
+        self.derived_from = derived_from
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -110,6 +121,7 @@ class QueryCacheManager:
             self.error_message = query_result.error_message
             self.df = query_result.df
             self.sql_rowcount = query_result.sql_rowcount
+            self.derived_from = query_result.derived_from
             self.annotation_data = {} if annotation_data is None else annotation_data
             self.queried_dttm = (
                 datetime.now(tz=timezone.utc).replace(microsecond=0).isoformat()
@@ -131,13 +143,25 @@ class QueryCacheManager:
                 "rejected_filter_columns": self.rejected_filter_columns,
                 "annotation_data": self.annotation_data,
                 "sql_rowcount": self.sql_rowcount,
+                "derived_from": self.derived_from,
                 "queried_dttm": self.queried_dttm,
                 "dttm": self.queried_dttm,  # Backwards compatibility
             }
-            if self.is_loaded and key and self.status != QueryStatus.FAILED:
+            stale_timeout = current_app.config["DATA_CACHE_STALE_TIMEOUT"]
+            if region == CacheRegion.DATA and stale_timeout and timeout and timeout > 0:
+                # keep serving the value for a while after it expires, while it's
+                # refreshed in the background
+                value["stale_after"] = time.time() + timeout
+                timeout += stale_timeout
+            if (
+                self.is_loaded
+                and key
+                and self.status != QueryStatus.FAILED
+                and not isinstance(_cache[region].cache, NullCache)
+            ):
                 self.set(
                     key=key,
-                    value=value,
+                    value=encode_cache_value(value),
                     timeout=timeout,
                     datasource_uid=datasource_uid,
                     region=region,
@@ -170,6 +194,7 @@ class QueryCacheManager:
             logger.debug("CACHE GET - Key: %s, Region: %s", key, region)
             current_app.config["STATS_LOGGER"].incr("loading_from_cache")
             try:
+                cache_value = decode_cache_value(cache_value)
                 query_cache.df = cache_value["df"]
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
@@ -186,15 +211,19 @@ class QueryCacheManager:
                 query_cache.is_loaded = True
                 query_cache.is_cached = cache_value is not None
                 query_cache.sql_rowcount = cache_value.get("sql_rowcount", None)
+                query_cache.derived_from = cache_value.get("derived_from")
                 query_cache.cache_dttm = (
                     cache_value["dttm"] if cache_value is not None else None
                 )
                 query_cache.queried_dttm = cache_value.get(
                     "queried_dttm", cache_value.get("dttm")
                 )
+                query_cache.is_stale = (
+                    stale_after := cache_value.get("stale_after")
+                ) is not None and time.time() >= stale_after
                 query_cache.cache_value = cache_value
                 current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
-            except KeyError as ex:
+            except (KeyError, pa.lib.ArrowException) as ex:
                 logger.exception(ex)
                 logger.error(
                     "Error reading cache: %s",
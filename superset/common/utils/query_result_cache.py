@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache the results of queries before they're post-processed.
+
+The data cache key of a query includes its time offsets and post-processing
+operations, so changing a chart option that's applied in pandas (eg, a rolling
+window or a pivot) runs the query again. The results of queries are also stored
+before time offsets and post-processing are applied, keyed by everything else in
+the query, so that only the post-processing runs again.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from flask import current_app
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_codec import encode_cache_value
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
+from superset.extensions import security_manager
+from superset.models.helpers import QueryResult
+
+if TYPE_CHECKING:
+    from superset.common.query_object import QueryObject
+    from superset.explorables.base import Explorable
+
+logger = logging.getLogger(__name__)
+
+
+class QueryResultCache:
+    """
+    Store and load the results of a query before they're post-processed.
+    """
+
+    def __init__(
+        self,
+        datasource: Explorable,
+        query_object: QueryObject,
+        cache_timeout: int | None = None,
+    ) -> None:
+        self.datasource = datasource
+        self.query_object = query_object
+        self.cache_timeout = cache_timeout
+
+    @classmethod
+    def from_query_object(
+        cls,
+        datasource: Explorable,
+        query_object: QueryObject,
+        cache_timeout: int | None = None,
+    ) -> QueryResultCache | None:
+        """
+        Return the result cache of a query, or `None` if results aren't cached.
+
+        The cache timeout is the one of the query context, which accounts for the
+        timeouts of the chart, the datasource and the database; results aren't cached
+        when it disables caching. Without one, `CACHE_DEFAULT_TIMEOUT` applies.
+        """
+        if (
+            not current_app.config["DATA_CACHE_QUERY_RESULTS_ENABLED"]
+            or cache_timeout == CACHE_DISABLED_TIMEOUT
+        ):
+            return None
+
+        return cls(datasource, query_object, cache_timeout)
+
+    def cache_key(self) -> str:
+        """
+        Return the cache key of the result of the query.
+
+        Everything that's applied to the result of the query is left out of the key.
+        """
+        query_object = copy.copy(self.query_object)
+        query_object.annotation_layers = []
+        query_object.post_processing = []
+        query_object.result_type = None
+        query_object.time_offsets = []
+
+        return query_object.cache_key(
+            datasource=self.datasource.uid,
+            extra_cache_keys=self.datasource.get_extra_cache_keys(
+                query_object.to_dict()
+            ),
+            rls=security_manager.get_rls_cache_key(self.datasource),
+            changed_on=self.datasource.changed_on,
+            raw=True,
+        )
+
+    def get_query_result(self) -> QueryResult | None:
+        """
+        Return the result of the query, if cached.
+        """
+        cache = QueryCacheManager.get(self.cache_key(), CacheRegion.DATA)
+        if not cache.is_loaded or not cache.cache_value:
+            return None
+
+        current_app.config["STATS_LOGGER"].incr("data_cache.query_result")
+        return QueryResult(
+            df=cache.df,
+            query=cache.query,
+            duration=timedelta(0),
+            applied_template_filters=cache.applied_template_filters,
+            applied_filter_columns=cache.applied_filter_columns,
+            rejected_filter_columns=cache.rejected_filter_columns,
+            from_dttm=self.query_object.from_dttm,
+            to_dttm=self.query_object.to_dttm,
+        )
+
+    def set_query_result(self, query_result: QueryResult) -> None:
+        """
+        Store the result of the query, before it's post-processed.
+        """
+        if query_result.status != QueryStatus.SUCCESS:
+            return
+
+        value = {
+            "df": query_result.df,
+            "query": query_result.query,
+            "applied_template_filters": query_result.applied_template_filters,
+            "applied_filter_columns": query_result.applied_filter_columns,
+            "rejected_filter_columns": query_result.rejected_filter_columns,
+        }
+        try:
+            QueryCacheManager.set(
+                key=self.cache_key(),
+                value=encode_cache_value(value),
+                timeout=self.cache_timeout,
+                datasource_uid=self.datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Unable to store the query result: %s", ex)
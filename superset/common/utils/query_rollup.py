@@ -0,0 +1,433 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Roll up cached query results to coarser time grains.
+
+When the metrics of a query grouped by a time grain are additive, the query can be
+answered from the result of the same query for a finer time grain (eg, a monthly
+query from the daily one), by aggregating it in pandas instead of querying the
+database again. The results are the ones the chart data API already stores in the
+data cache for queries without time offsets and post-processing operations, so
+rollups don't store anything in the data cache themselves.
+
+The time range, dimensions, row limit and order of the finer query must be the same
+as the ones of the query. Its filters can be a subset of the ones of the query (eg,
+without a filter added to the dashboard since), as long as the missing filters are on
+dimensions of the query and can be applied again to the rows of the cached result.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from datetime import timedelta
+from itertools import combinations
+from typing import Any, Callable, TYPE_CHECKING
+
+import pandas as pd
+from flask import current_app
+
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion, TimeGrain
+from superset.extensions import security_manager
+from superset.models.helpers import ExploreMixin, QueryResult
+from superset.utils.core import (
+    DTTM_ALIAS,
+    FilterOperator,
+    get_column_name,
+    get_metric_name,
+    is_adhoc_metric,
+    is_base_axis,
+)
+
+if TYPE_CHECKING:
+    from superset.common.query_object import QueryObject
+    from superset.explorables.base import Explorable
+    from superset.utils.core import QueryObjectFilterClause
+
+logger = logging.getLogger(__name__)
+
+# How the values of an additive metric are combined, by SQL aggregate
+ROLLUP_AGGREGATES = {"SUM": "sum", "COUNT": "sum", "MIN": "min", "MAX": "max"}
+
+# The finer time grains each time grain can be rolled up from, coarsest first. Weeks
+# are only rolled up when their start day is explicit, since `P1W` depends on the
+# database.
+ROLLUP_TIME_GRAINS: dict[str, tuple[str, ...]] = {
+    TimeGrain.HOUR: (
+        TimeGrain.THIRTY_MINUTES,
+        TimeGrain.FIFTEEN_MINUTES,
+        TimeGrain.TEN_MINUTES,
+        TimeGrain.FIVE_MINUTES,
+        TimeGrain.MINUTE,
+    ),
+    TimeGrain.DAY: (TimeGrain.HOUR,),
+    TimeGrain.WEEK_STARTING_SUNDAY: (TimeGrain.DAY,),
+    TimeGrain.WEEK_STARTING_MONDAY: (TimeGrain.DAY,),
+    TimeGrain.MONTH: (TimeGrain.DAY,),
+    TimeGrain.QUARTER: (TimeGrain.MONTH, TimeGrain.DAY),
+    TimeGrain.YEAR: (TimeGrain.QUARTER, TimeGrain.MONTH, TimeGrain.DAY),
+}
+
+# Truncate timestamps to the start of their time grain, like the database does
+TRUNCATE_FUNCTIONS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    TimeGrain.HOUR: lambda series: series.dt.floor(pd.offsets.Hour()),
+    TimeGrain.DAY: lambda series: series.dt.floor(pd.offsets.Day()),
+    TimeGrain.WEEK_STARTING_SUNDAY: lambda series: series.dt.to_period(
+        "W-SAT"
+    ).dt.start_time,
+    TimeGrain.WEEK_STARTING_MONDAY: lambda series: series.dt.to_period(
+        "W-SUN"
+    ).dt.start_time,
+    TimeGrain.MONTH: lambda series: series.dt.to_period("M").dt.start_time,
+    TimeGrain.QUARTER: lambda series: series.dt.to_period("Q").dt.start_time,
+    TimeGrain.YEAR: lambda series: series.dt.to_period("Y").dt.start_time,
+}
+
+
+# The filters that can be applied again to the rows of a cached result, like the
+# database would (comparisons with NULL are never true)
+FILTER_FUNCTIONS: dict[str, Callable[[pd.Series, list[Any]], pd.Series]] = {
+    FilterOperator.EQUALS: lambda series, values: series == values[0],
+    FilterOperator.NOT_EQUALS: lambda series, values: (series != values[0])
+    & series.notna(),
+    FilterOperator.IN: lambda series, values: series.isin(values),
+    FilterOperator.NOT_IN: lambda series, values: ~series.isin(values) & series.notna(),
+    FilterOperator.IS_NULL: lambda series, values: series.isna(),
+    FilterOperator.IS_NOT_NULL: lambda series, values: series.notna(),
+    FilterOperator.GREATER_THAN: lambda series, values: series > values[0],
+    FilterOperator.LESS_THAN: lambda series, values: series < values[0],
+    FilterOperator.GREATER_THAN_OR_EQUALS: lambda series, values: series >= values[0],
+    FilterOperator.LESS_THAN_OR_EQUALS: lambda series, values: series <= values[0],
+}
+
+# Strings are only compared for equality, since their order depends on the collation
+STRING_FILTER_OPERATORS = {
+    FilterOperator.EQUALS,
+    FilterOperator.NOT_EQUALS,
+    FilterOperator.IN,
+    FilterOperator.NOT_IN,
+}
+
+# How many filters of a query can be missing from the finer query, which bounds the
+# number of cache keys looked up for each time grain
+MAX_MISSING_FILTERS = 2
+
+
+def get_rollup_aggregate(metric: Any, datasource: Explorable) -> str | None:
+    """
+    Return how the values of a metric are rolled up, or `None` if it's not additive.
+
+    Simple adhoc metrics are additive depending on their aggregate, and saved metrics
+    depending on their `metric_type`; custom SQL metrics never are.
+    """
+    if is_adhoc_metric(metric):
+        aggregate = (
+            metric.get("aggregate") if metric["expressionType"] == "SIMPLE" else None
+        )
+    else:
+        saved_metric = next(
+            (
+                saved_metric
+                for saved_metric in datasource.metrics
+                if saved_metric.metric_name == metric
+            ),
+            None,
+        )
+        aggregate = saved_metric.metric_type if saved_metric else None
+
+    return ROLLUP_AGGREGATES.get((aggregate or "").upper())
+
+
+def get_filter_mask(
+    df: pd.DataFrame,
+    filter_: QueryObjectFilterClause,
+) -> pd.Series | None:
+    """
+    Return the rows of a result matching a filter, or `None` if it can't be applied.
+    """
+    column, operator = filter_.get("col"), filter_.get("op")
+    if (
+        not isinstance(column, str)
+        or column not in df.columns
+        or operator not in FILTER_FUNCTIONS
+    ):
+        return None
+
+    series = df[column]
+    if operator in {FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL}:
+        return FILTER_FUNCTIONS[operator](series, [])
+
+    value = filter_.get("val")
+    values: list[Any] = list(value) if isinstance(value, (list, tuple)) else [value]
+    if not values:
+        return None
+
+    if pd.api.types.is_bool_dtype(series):
+        valid = all(isinstance(value, bool) for value in values)
+    elif pd.api.types.is_numeric_dtype(series):
+        valid = all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in values
+        )
+    elif pd.api.types.infer_dtype(series, skipna=True) in {"string", "empty"}:
+        valid = operator in STRING_FILTER_OPERATORS and all(
+            isinstance(value, str) for value in values
+        )
+    else:
+        valid = False
+
+    return FILTER_FUNCTIONS[operator](series, values) if valid else None
+
+
+class QueryRollup:
+    """
+    Roll up the cached results of a query grouped by a finer time grain.
+    """
+
+    def __init__(
+        self,
+        datasource: Explorable,
+        query_object: QueryObject,
+        time_grain: str,
+        x_axis: str,
+        aggregates: dict[str, str],
+    ) -> None:
+        self.datasource = datasource
+        self.query_object = query_object
+        self.time_grain = time_grain
+        self.x_axis = x_axis
+        self.aggregates = aggregates
+
+    @classmethod
+    def from_query_object(
+        cls,
+        datasource: Explorable,
+        query_object: QueryObject,
+    ) -> QueryRollup | None:
+        """
+        Return a rollup for a query, or `None` if its results can't be rolled up.
+        """
+        if not current_app.config["DATA_CACHE_ROLLUP_ENABLED"]:
+            return None
+
+        time_grain = ExploreMixin.get_time_grain(query_object)
+        if time_grain not in ROLLUP_TIME_GRAINS:
+            return None
+
+        if query_object.columns and is_base_axis(query_object.columns[0]):
+            x_axis = get_column_name(query_object.columns[0])
+        elif query_object.is_timeseries and query_object.granularity:
+            x_axis = DTTM_ALIAS
+        else:
+            return None
+
+        if (
+            not query_object.metrics
+            or query_object.row_offset
+            or query_object.is_rowcount
+            or query_object.time_shift
+            or query_object.extras.get("having")
+            # timestamps shifted after being truncated can't be truncated again
+            or datasource.offset
+        ):
+            return None
+
+        aggregates: dict[str, str] = {}
+        for metric in query_object.metrics:
+            if (aggregate := get_rollup_aggregate(metric, datasource)) is None:
+                return None
+            aggregates[get_metric_name(metric)] = aggregate
+
+        return cls(datasource, query_object, time_grain, x_axis, aggregates)
+
+    def get_missing_filters(self) -> list[list[QueryObjectFilterClause]]:
+        """
+        Return the sets of filters that can be missing from the finer query.
+
+        Only filters on dimensions of the query can be applied again to the cached
+        result. Filters are never left out for virtual datasets or custom WHERE clauses,
+        whose SQL may depend on them through Jinja templates.
+        """
+        if getattr(self.datasource, "sql", None) or self.query_object.extras.get(
+            "where"
+        ):
+            return [[]]
+
+        dimensions = set(self.query_object.column_names)
+        filters = [
+            filter_
+            for filter_ in self.query_object.filter
+            if isinstance(filter_.get("col"), str)
+            and filter_["col"] in dimensions
+            and filter_.get("op") in FILTER_FUNCTIONS
+        ]
+        return [
+            list(missing_filters)
+            for count in range(min(len(filters), MAX_MISSING_FILTERS) + 1)
+            for missing_filters in combinations(filters, count)
+        ]
+
+    def cache_key(
+        self,
+        time_grain: str,
+        missing_filters: list[QueryObjectFilterClause],
+    ) -> str:
+        """
+        Return the data cache key of the query for a finer time grain.
+
+        This is the key the chart data API stores the result of the query under when
+        it has no time offsets and post-processing operations, which is its result as
+        returned by the database.
+        """
+        query_object = copy.copy(self.query_object)
+        query_object.annotation_layers = []
+        query_object.post_processing = []
+        query_object.time_offsets = []
+        query_object.filter = [
+            filter_
+            for filter_ in self.query_object.filter
+            if filter_ not in missing_filters
+        ]
+        if query_object.columns and is_base_axis(query_object.columns[0]):
+            query_object.columns = [
+                {**query_object.columns[0], "timeGrain": time_grain},  # type: ignore
+                *query_object.columns[1:],
+            ]
+        if "time_grain_sqla" in query_object.extras:
+            query_object.extras = {**query_object.extras, "time_grain_sqla": time_grain}
+
+        return query_object.cache_key(
+            datasource=self.datasource.uid,
+            extra_cache_keys=self.datasource.get_extra_cache_keys(
+                query_object.to_dict()
+            ),
+            rls=security_manager.get_rls_cache_key(self.datasource),
+            changed_on=self.datasource.changed_on,
+        )
+
+    def get_query_result(self) -> QueryResult | None:
+        """
+        Return the result of the query rolled up from a finer time grain, if cached.
+
+        The results with all the filters of the query are looked up first.
+        """
+        for missing_filters in self.get_missing_filters():
+            for time_grain in ROLLUP_TIME_GRAINS.get(self.time_grain, ()):
+                cache = QueryCacheManager.get(
+                    self.cache_key(time_grain, missing_filters),
+                    CacheRegion.DATA,
+                )
+                if not cache.is_loaded or not cache.cache_value:
+                    continue
+
+                # the result must not have been truncated by its row limit
+                row_limit = self.query_object.row_limit
+                if row_limit and len(cache.df.index) >= row_limit:
+                    continue
+
+                df = self.roll_up(cache.df, missing_filters)
+                if df is None:
+                    continue
+
+                current_app.config["STATS_LOGGER"].incr("data_cache.rollup")
+                return QueryResult(
+                    df=df,
+                    query=cache.query,
+                    duration=timedelta(0),
+                    applied_template_filters=cache.applied_template_filters,
+                    applied_filter_columns=list(
+                        dict.fromkeys(
+                            [
+                                *(cache.applied_filter_columns or []),
+                                *(filter_["col"] for filter_ in missing_filters),
+                            ]
+                        )
+                    ),
+                    rejected_filter_columns=cache.rejected_filter_columns,
+                    from_dttm=self.query_object.from_dttm,
+                    to_dttm=self.query_object.to_dttm,
+                    derived_from={
+                        "time_grain": time_grain,
+                        "cached_dttm": cache.cache_dttm,
+                    },
+                )
+
+        return None
+
+    def roll_up(
+        self,
+        df: pd.DataFrame,
+        missing_filters: list[QueryObjectFilterClause],
+    ) -> pd.DataFrame | None:
+        """
+        Aggregate a result for a finer time grain into the time grain of the query.
+
+        The filters missing from the finer query are applied to its rows first.
+        """
+        labels = [self.x_axis, *self.aggregates]
+        if (
+            any(label not in df.columns for label in labels)
+            or df.columns.has_duplicates
+            or not pd.api.types.is_datetime64_dtype(df[self.x_axis])
+        ):
+            return None
+
+        for filter_ in missing_filters:
+            if (mask := get_filter_mask(df, filter_)) is None:
+                return None
+            df = df[mask]
+
+        orderby: list[tuple[str, bool]] = []
+        for column, ascending in self.query_object.orderby:
+            label = (
+                get_metric_name(column)
+                if is_adhoc_metric(column)  # type: ignore
+                else get_column_name(column)  # type: ignore
+            )
+            if label not in df.columns:
+                return None
+            orderby.append((label, ascending))
+
+        dimensions = [column for column in df.columns if column not in self.aggregates]
+        df = df.assign(
+            **{self.x_axis: TRUNCATE_FUNCTIONS[self.time_grain](df[self.x_axis])}
+        )
+        grouped = df.groupby(dimensions, sort=True, dropna=False)
+        df = pd.DataFrame(
+            {
+                # the sum of NULL values is NULL in SQL
+                label: (
+                    grouped[label].sum(min_count=1)
+                    if aggregate == "sum"
+                    else grouped[label].agg(aggregate)
+                )
+                for label, aggregate in self.aggregates.items()
+            }
+        ).reset_index()[list(df.columns)]
+
+        if orderby:
+            df = df.sort_values(
+                [label for label, _ in orderby],
+                ascending=[ascending for _, ascending in orderby],
+                kind="stable",
+                ignore_index=True,
+            )
+        if self.query_object.row_limit:
+            df = df.head(self.query_object.row_limit)
+
+        return df
@@ -84,6 +84,12 @@ STATS_LOGGER = DummyStatsLogger()
 # Note that you can use `StdOutEventLogger` for debugging
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
+# To insert the logs in batches from a background thread, instead of committing
+# them with each request, use `QueuedDBEventLogger`:
+#
+# from superset.utils.log import QueuedDBEventLogger
+#
+# EVENT_LOGGER = QueuedDBEventLogger(max_queue_size=10000, batch_size=500)
 EVENT_LOGGER = DBEventLogger()
 
 SUPERSET_LOG_VIEW = True
@@ -680,6 +686,28 @@ SSH_TUNNEL_TIMEOUT_SEC = 10.0
 #: Timeout (seconds) for transport socket (``socket.settimeout``)
 SSH_TUNNEL_PACKET_TIMEOUT_SEC = 1.0
 
+# ------------------------------
+# Database engine pooling
+# ------------------------------
+# By default a new SQLAlchemy engine using a ``NullPool`` is created every time a
+# connection to an analytical database is needed, so every query pays for a new
+# connection handshake. When enabled, engines are cached per database, catalog,
+# schema, effective user and connection parameters, and use a ``QueuePool`` so that
+# connections are reused across requests. Databases connected through an SSH tunnel
+# are never pooled.
+DATABASE_ENGINE_POOL_ENABLED = False
+#: Maximum number of engines kept per process; the least recently used is evicted
+DATABASE_ENGINE_POOL_MAX_ENGINES = 100
+#: Engines not used for this many seconds are disposed of
+DATABASE_ENGINE_POOL_IDLE_TIMEOUT_SEC = 300
+#: Default pool parameters, can be overridden per database in ``engine_params``
+DATABASE_ENGINE_POOL_PARAMS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
 
 # Feature flags may also be set via 'SUPERSET_FEATURE_' prefixed environment vars.
 DEFAULT_FEATURE_FLAGS.update(
@@ -863,6 +891,17 @@ EXTRA_SEQUENTIAL_COLOR_SCHEMES: list[dict[str, Any]] = []
 # CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER, FixedExecutor("admin")]
 CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER]
 
+# By default, the cache warmup task schedules a request to the
+# `/api/v1/chart/warm_up_cache` endpoint for each chart, which forces the queries of
+# the chart to run in the web server. When enabled, the queries run in the Celery
+# worker instead, charts whose results are already cached are skipped, and the
+# charts of each database are warmed up concurrently. Charts are warmed up for up to
+# CACHE_WARMUP_MAX_DATABASES databases at a time, with up to
+# CACHE_WARMUP_MAX_WORKERS_PER_DATABASE concurrent queries on each of them.
+CACHE_WARMUP_IN_PROCESS = False
+CACHE_WARMUP_MAX_DATABASES = 4
+CACHE_WARMUP_MAX_WORKERS_PER_DATABASE = 4
+
 # ---------------------------------------------------
 # Thumbnail config (behind feature flag)
 # ---------------------------------------------------
@@ -928,6 +967,9 @@ SCREENSHOT_PLAYWRIGHT_WAIT_EVENT = "domcontentloaded"
 SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT = int(
     timedelta(seconds=60).total_seconds() * 1000
 )
+# Max number of pages Playwright renders at a time when taking several screenshots,
+# eg, the tabs of a dashboard report, in a worker
+SCREENSHOT_PLAYWRIGHT_MAX_PAGES = 4
 
 # Tiled screenshot configuration for large dashboards
 SCREENSHOT_TILED_ENABLED = True  # Enable tiled screenshots for large dashboards
@@ -954,9 +996,83 @@ CACHE_DEFAULT_TIMEOUT = int(timedelta(days=1).total_seconds())
 # Default cache for Superset objects
 CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Cache the row level security filters of each set of roles and dataset in the cache
+# above for this many seconds, instead of querying the metadata database for them every
+# time a chart is queried or its cache key is computed. Cached filters are invalidated
+# when RLS filters are changed or their roles or datasets are deleted, which requires a
+# cache shared by all workers. Set to `None` to disable; filters are always cached for
+# the duration of a request.
+RLS_FILTERS_CACHE_TIMEOUT: int | None = None
+
+# Cache an index of the permissions granted to each set of roles in the cache above for
+# this many seconds, and check access against it instead of querying the metadata
+# database for every permission check (eg, for each dataset or chart of a list). The
+# index is invalidated when roles, permissions or the roles of users are changed, and when
+# datasets or databases are renamed or deleted, which requires a cache shared by all
+# workers. Set to `None` to disable.
+PERMISSION_INDEX_CACHE_TIMEOUT: int | None = None
+
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How the dataframes of chart query results are serialized in the data cache. By
+# default they're stored as is, and pickled by the cache backend; "arrow" stores them
+# as Arrow IPC streams, which are smaller and faster to load than pickled dataframes,
+# compressed with DATA_CACHE_ARROW_COMPRESSION ("zstd", "lz4" or None).
+DATA_CACHE_CODEC: Literal["pickle", "arrow"] = "pickle"
+DATA_CACHE_ARROW_COMPRESSION: Literal["zstd", "lz4"] | None = "zstd"
+
+# Serve chart data from the data cache for up to this many seconds after it expires
+# (stale-while-revalidate): the stale result is returned right away, flagged with
+# `is_stale`, while a Celery task refreshes it in the background. Set to 0 to disable,
+# in which case expired results are queried synchronously.
+DATA_CACHE_STALE_TIMEOUT = 0
+
+# Answer chart data queries for a coarser time grain (eg, months) from the cached
+# result of the same query for a finer one (eg, days), by aggregating it instead of
+# querying the database. Only queries with additive metrics are rolled up: simple
+# metrics using SUM, COUNT, MIN or MAX, and saved metrics whose `metric_type` is one of
+# those. Queries are rolled up from the cached results of queries without time offsets
+# and post-processing, with the same time range, dimensions, row limit and order. The
+# finer query can miss up to two filters of the query on its dimensions (eg, a filter
+# added to the dashboard since), which are then applied to its rows in pandas, except
+# for virtual datasets and custom WHERE clauses. Rolled up results report the time
+# grain they were derived from.
+DATA_CACHE_ROLLUP_ENABLED = False
+
+# Also store the results of chart data queries in the data cache before time offsets
+# and post-processing operations (eg, rolling windows, pivots or contributions) are
+# applied, keyed by everything else in the query. Changing chart options that are
+# applied in pandas then reuses the result instead of querying the database again,
+# while the post-processed result is still cached under its own key.
+DATA_CACHE_QUERY_RESULTS_ENABLED = False
+
+# Coalesce identical chart data queries across workers: when a query result is not in
+# the data cache, only the first request runs the query, while concurrent requests
+# for the same query wait for it and read the result from the cache. The lock is held
+# in the data cache, which should be shared across workers (eg, Redis) for queries to
+# be coalesced beyond a single process. Has no effect without a data cache.
+CHART_DATA_SINGLE_FLIGHT_ENABLED = False
+# How long concurrent requests wait for the first one before running the query
+# themselves, which is also when the lock expires
+CHART_DATA_SINGLE_FLIGHT_TIMEOUT = int(timedelta(minutes=2).total_seconds())
+# How often (in seconds) concurrent requests check if the result is available
+CHART_DATA_SINGLE_FLIGHT_POLL_INTERVAL = 0.5
+
+# How long (in seconds) the latest partitions of tables, as returned by the partition
+# macros of Presto, Trino and Hive templates, are kept in the data cache. Concurrent
+# lookups of the same partition are coalesced across workers. This can be overridden
+# per database with the `partition_cache_timeout` of its `metadata_cache_timeout`, and
+# the cached partitions of a database invalidated with
+# `DELETE /api/v1/database/<pk>/partitions_cache/`. Set to None to disable the cache.
+LATEST_PARTITION_CACHE_TIMEOUT: int | None = 60
+
+# Maximum number of threads used to run the queries of a chart data request (eg, the
+# time comparison queries of a chart) concurrently. Each thread uses its own metadata
+# database session and analytical database connection. Set to 1 to run the queries
+# one after the other.
+CHART_DATA_MAX_WORKERS = 1
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -1046,6 +1162,22 @@ CSV_EXPORT = {"encoding": "utf-8-sig"}
 # large datasets efficiently.
 CSV_STREAMING_ROW_THRESHOLD = 100000
 
+# CSV Streaming: number of rows fetched from the database and encoded at once
+CSV_STREAMING_CHUNK_SIZE = 1024
+
+# CSV Streaming: how rows are encoded. "csv" formats values like the csv module (eg,
+# `True`, `1.0`). "arrow" encodes each batch of rows as a block with Arrow's CSV
+# writer, which is several times faster, but formats values the Arrow way (eg, `true`,
+# `1`, quoted strings, timestamps with microseconds) and ends lines with `\n`. Batches
+# Arrow can't convert (eg, columns mixing types) are encoded with the csv module.
+CSV_STREAMING_ENCODER: Literal["csv", "arrow"] = "csv"
+
+# CSV Streaming: content encodings streaming CSV exports can be compressed with on the
+# fly, in order of preference, eg `["zstd", "gzip"]`. The best one accepted by the
+# client is used. Compression is disabled by default, since it's usually done by the
+# reverse proxy.
+CSV_STREAMING_COMPRESSION: list[str] = []
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -1416,6 +1548,15 @@ REPORTS_CSV_NA_NAMES: list[str] | None = None
 # Smaller values use less memory but may be slower for large files
 READ_CSV_CHUNK_SIZE = 1000
 
+# Upload CSV files to the database chunk by chunk as they're read, instead of reading
+# the whole file in memory first. The types of the columns are inferred from the
+# first chunk and applied to the others, so columns whose values don't all look alike
+# should be given a data type in the upload form. If reading or uploading a chunk
+# fails, a table created by the upload is dropped, while rows appended to an existing
+# table are kept. Uploads replacing a table aren't streamed, so that the table isn't
+# lost when a chunk fails.
+CSV_UPLOAD_STREAMING = False
+
 # A dictionary of items that gets merged into the Jinja context for
 # SQL Lab. The existing context gets updated with this dictionary,
 # meaning values for existing keys get overwritten by the content of this
@@ -1434,6 +1575,12 @@ JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 # basis. Example value = `{"presto": CustomPrestoTemplateProcessor}`
 CUSTOM_TEMPLATE_PROCESSORS: dict[str, type[BaseTemplateProcessor]] = {}
 
+# The maximum number of compiled Jinja templates kept in memory by each worker, by
+# template processor and template source, so that the SQL of virtual datasets,
+# metrics and filters isn't parsed and compiled again for every query. Set to 0 to
+# disable the cache.
+JINJA_TEMPLATE_CACHE_SIZE = 1024
+
 # Roles that are controlled by the API / Superset and should not be changed
 # by humans.
 ROBOT_PERMISSION_ROLES = ["Public", "Gamma", "Alpha", "Admin", "sql_lab"]
@@ -1773,6 +1920,10 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
+# Run the queries of CSV and text reports of charts in the worker, as the executor,
+# instead of requesting the chart data API of the web server with a machine-auth
+# session. This saves a request, a login and a serialization round trip per report.
+ALERT_REPORTS_CHART_DATA_IN_PROCESS = False
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
@@ -1831,6 +1982,25 @@ WEBDRIVER_CONFIGURATION = {
 # Note: If using Chrome, you'll want to add the "--marionette" arg.
 WEBDRIVER_OPTION_ARGS = ["--headless"]
 
+# Keep headless browsers running between screenshots, thumbnails and reports, rather
+# than starting a browser for each of them. Each capture gets its own browser
+# context (Playwright) or is authenticated again after clearing the cookies of the
+# previous capture (Selenium). Browsers are recycled after MAX_USAGE_COUNT captures
+# or MAX_AGE_SECONDS, when idle for IDLE_TIMEOUT_SECONDS, or when the browsers of
+# a worker process use more than MAX_MEMORY_MB (requires psutil). Idle browsers are
+# checked when a browser is taken or given back, and after each Celery task. At most
+# MAX_POOL_SIZE browsers are in use at a time in a worker process; idle browsers are
+# kept per thread, so each thread of a worker can keep up to MAX_POOL_SIZE of them.
+WEBDRIVER_POOL: dict[str, Any] = {
+    "ENABLED": False,
+    "MAX_POOL_SIZE": 5,
+    "MAX_AGE_SECONDS": 3600,
+    "MAX_USAGE_COUNT": 50,
+    "IDLE_TIMEOUT_SECONDS": 300,
+    "HEALTH_CHECK_INTERVAL": 60,
+    "MAX_MEMORY_MB": None,
+}
+
 # The base URL to query for accessing the user interface
 WEBDRIVER_BASEURL = "http://0.0.0.0:8080/"
 # The base URL for the email report hyperlinks.
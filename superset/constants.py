@@ -174,6 +174,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "put_filters": "write",
     "put_colors": "write",
     "sync_permissions": "write",
+    "delete_partitions_cache": "write",
 }
 
 EXTRA_FORM_DATA_APPEND_KEYS = {
@@ -111,6 +111,7 @@ from superset.databases.schemas import (
 )
 from superset.databases.utils import get_table_metadata
 from superset.db_engine_specs import get_available_engine_specs
+from superset.db_engine_specs.partition_cache import invalidate_partitions
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
     DatabaseNotFoundException,
@@ -176,6 +177,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         "upload",
         "oauth2",
         "sync_permissions",
+        "delete_partitions_cache",
     }
 
     resource_name = "database"
@@ -672,6 +674,51 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             return self.response(202, message="Async task created to sync permissions")
         return self.response(200, message="Permissions successfully synced")
 
+    @expose("/<int:pk>/partitions_cache/", methods=("DELETE",))
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".delete_partitions_cache",
+        log_to_statsd=False,
+    )
+    def delete_partitions_cache(self, pk: int) -> Response:
+        """Invalidate the cached latest partitions of a database.
+        ---
+        delete:
+          summary: Invalidate the cached latest partitions of a database
+          description: >-
+            Invalidates the latest partitions of the tables of a database cached
+            for partition macros, eg, after new partitions are loaded.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database connection ID
+          responses:
+            200:
+              description: Cached partitions invalidated
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      message:
+                        type: string
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        database = self.datamodel.get(pk, self._base_filters)
+        if not database:
+            return self.response_404()
+        invalidate_partitions(database)
+        return self.response(200, message="OK")
+
     @expose("/<int:pk>/catalogs/")
     @protect()
     @rison(database_catalogs_query_schema)
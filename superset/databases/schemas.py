@@ -146,7 +146,9 @@ extra_description = markdown(
     '**"metadata_cache_timeout": {"schema_cache_timeout": 600, '
     '"table_cache_timeout": 600}**. '
     "If unset, cache will not be enabled for the functionality. "
-    "A timeout of 0 indicates that the cache never expires.<br/>"
+    "A timeout of 0 indicates that the cache never expires. "
+    "The ``partition_cache_timeout`` of the latest partitions used by "
+    "partition macros defaults to ``LATEST_PARTITION_CACHE_TIMEOUT``.<br/>"
     "3. The ``schemas_allowed_for_file_upload`` is a comma separated list "
     "of schemas that CSVs are allowed to upload to. "
     'Specify it as **"schemas_allowed_for_file_upload": '
@@ -19,6 +19,7 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from superset.utils.core import JS_MAX_INTEGER
@@ -37,6 +38,34 @@ def _convert_big_integers(val: Any) -> Any:
     return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
 
 
+# Values inferred by pandas for object columns that might contain integers
+INTEGER_INFERRED_TYPES = {"integer", "mixed-integer", "mixed-integer-float", "mixed"}
+
+# Number of units per second for the resolutions of ``datetime64`` columns
+DATETIME_UNITS_PER_SECOND = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+
+def _may_contain_big_integers(series: pd.Series) -> bool:
+    """
+    Check if a column might contain integers larger than ``JS_MAX_INTEGER``.
+
+    Integer columns are checked with a vectorized comparison; object columns can only
+    be checked value by value, so they're only skipped if they hold no integers.
+    """
+    if pd.api.types.is_integer_dtype(series.dtype):
+        # `abs` would overflow for the smallest int64
+        maximum, minimum = series.max(), series.min()
+        return bool(
+            pd.notna(maximum)
+            and (maximum > JS_MAX_INTEGER or minimum < -JS_MAX_INTEGER)
+        )
+
+    if pd.api.types.is_object_dtype(series.dtype):
+        return pd.api.types.infer_dtype(series, skipna=True) in INTEGER_INFERRED_TYPES
+
+    return False
+
+
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
@@ -50,8 +79,86 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         )
     records = dframe.to_dict(orient="records")
 
-    for record in records:
-        for key in record:
-            record[key] = _convert_big_integers(record[key])
+    for position, column in enumerate(dframe.columns):
+        if _may_contain_big_integers(dframe.iloc[:, position]):
+            for record in records:
+                record[column] = _convert_big_integers(record[column])
 
     return records
+
+
+def _box_native(val: Any) -> Any:
+    """
+    Cast NumPy scalars to their Python equivalent.
+    """
+    return val.item() if isinstance(val, (np.integer, np.floating, np.bool_)) else val
+
+
+def _column_to_json_values(series: pd.Series) -> list[Any]:
+    """
+    Convert a column into a list of JSON serializable values.
+
+    Datetimes are converted to milliseconds since epoch (like ``json_int_dttm_ser``,
+    timezone-aware values are taken at their wall-clock time), and missing values to
+    ``None``.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            series = series.dt.tz_localize(None)
+        values = series.to_numpy()
+        # same arithmetic as `datetime_to_epoch`, which has microsecond precision
+        unit, _ = np.datetime_data(values.dtype)
+        units_per_second = DATETIME_UNITS_PER_SECOND[unit]
+        if units_per_second > 10**6:
+            microseconds = values.view("i8") // (units_per_second // 10**6)
+        else:
+            microseconds = values.view("i8") * (10**6 // units_per_second)
+        epochs = microseconds / 10**6 * 1000
+        result = epochs.tolist()
+        for position in np.flatnonzero(np.isnat(values)):
+            result[position] = None
+        return result
+
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        result = series.tolist()
+        if series.dtype.kind == "f":
+            for position in np.flatnonzero(np.isnan(series.to_numpy())):
+                result[position] = None
+        return result
+
+    if pd.api.types.is_object_dtype(series.dtype) and pd.api.types.infer_dtype(
+        series, skipna=True
+    ) in {"string", "empty"}:
+        return series.where(series.notna(), None).tolist()
+
+    return [
+        None if is_missing else _box_native(value)
+        for value, is_missing in zip(
+            series.astype(object).tolist(), series.isna().tolist(), strict=True
+        )
+    ]
+
+
+def df_to_columnar(dframe: pd.DataFrame) -> dict[str, Any]:
+    """
+    Convert a DataFrame to a columnar payload, with the column names and the rows.
+
+    The values are converted one column at a time, so unlike records the payload can
+    be encoded to JSON without converting datetimes value by value. Like records,
+    integers larger than ``JS_MAX_INTEGER`` are converted to strings.
+
+    :param dframe: the DataFrame to convert
+    :returns: a dictionary with the list of columns and the list of rows
+    """
+    columns = []
+    for position in range(len(dframe.columns)):
+        series = dframe.iloc[:, position]
+        values = _column_to_json_values(series)
+        if _may_contain_big_integers(series):
+            values = [_convert_big_integers(value) for value in values]
+        columns.append(values)
+
+    return {
+        "columns": dframe.columns.tolist(),
+        "data": [list(row) for row in zip(*columns, strict=True)],
+    }
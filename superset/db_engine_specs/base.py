@@ -86,6 +86,8 @@ from superset.utils.network import is_hostname_valid, is_port_open
 from superset.utils.oauth2 import encode_oauth2_state
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.connectors.sqla.models import TableColumn
     from superset.databases.schemas import TableMetadataResponse
     from superset.models.core import Database
@@ -1010,6 +1012,22 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch the results of a query as an Arrow table.
+
+        Engine specs whose drivers can return Arrow data natively should override
+        this, so that results don't go through a Python object per value. Returning
+        ``None`` means that the results should be fetched with ``fetch_data`` instead,
+        which is the default.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or ``None`` if not supported
+        """
+        return None
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1187,13 +1205,29 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
+            if method := cls.get_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def get_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Return the `method` used by `pandas.DataFrame.to_sql` to insert rows.
+
+        Rows are inserted with multi-row inserts when the engine supports them. Can be
+        overridden for engines with a native bulk load, e.g. `COPY` in Postgres.
+
+        :param engine: The engine of the database the data is uploaded to
+        :return: `"multi"`, a callable inserting a chunk of rows, or `None` to insert
+            rows one at a time
+        """
+        if (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            return "multi"
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -31,7 +31,11 @@ from sqlalchemy.engine.url import URL
 
 from superset.constants import TimeGrain
 from superset.databases.utils import make_url_safe
-from superset.db_engine_specs.base import BaseEngineSpec, BasicParametersMixin
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    BasicParametersMixin,
+    LimitMethod,
+)
 from superset.db_engine_specs.hive import HiveEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.utils import json
@@ -39,6 +43,8 @@ from superset.utils.core import get_user_agent, QuerySource
 from superset.utils.network import is_hostname_valid, is_port_open
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 
@@ -283,6 +289,21 @@ class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngine
 
         return extra
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch results as an Arrow table, using the Databricks SQL connector.
+        """
+        if not hasattr(cursor, "fetchall_arrow"):
+            return None
+
+        try:
+            if cls.limit_method == LimitMethod.FETCH_MANY and limit:
+                return cursor.fetchmany_arrow(limit)
+            return cursor.fetchall_arrow()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def get_table_names(
         cls,
@@ -38,6 +38,8 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.utils.core import GenericDataType, get_user_agent, QuerySource
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 
@@ -294,6 +296,26 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
         return data
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch results as an Arrow table, which DuckDB produces natively.
+        """
+        if (cls.limit_method == LimitMethod.FETCH_MANY and limit) or not hasattr(
+            cursor, "fetch_arrow_table"
+        ):
+            return None
+
+        # see ``fetch_data`` for the description workaround
+        description = cursor.description
+        try:
+            table = cursor.fetch_arrow_table()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+        cursor.description = description
+
+        return table
+
     @classmethod
     def get_table_names(
         cls, database: Database, inspector: Inspector, schema: str | None
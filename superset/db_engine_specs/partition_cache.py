@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache the latest partitions of tables.
+
+Looking up the latest partition of a table (eg, for the ``latest_partition`` macro of
+Presto, Trino and Hive templates) runs a metadata query on the database, which can
+take seconds, for every chart using it. The partitions are stored in the data cache
+for the ``partition_cache_timeout`` of the database, and concurrent lookups of the
+same partition are coalesced across workers. The cached partitions of a database can
+be invalidated through the API, eg, when new partitions are loaded.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
+
+from flask import current_app
+from flask_caching.backends import NullCache
+
+from superset.extensions import cache_manager
+from superset.utils.hashing import hash_from_dict
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+    from superset.sql.parse import Table
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "latest_partition_lock:"
+LOCK_TIMEOUT = 30
+POLL_INTERVAL = 0.1
+
+T = TypeVar("T")
+
+
+def get_version_cache_key(database: Database) -> str:
+    return f"latest_partition_version:{database.id}"
+
+
+def get_version(database: Database) -> str:
+    """
+    Return the version of the cached partitions of a database.
+
+    Versions are random rather than incremented, so that an evicted version is never
+    reused.
+    """
+    key = get_version_cache_key(database)
+    if (version := cache_manager.data_cache.get(key)) is None:
+        cache_manager.data_cache.add(key, uuid.uuid4().hex, timeout=0)
+        version = cache_manager.data_cache.get(key)
+
+    return version or ""
+
+
+def invalidate_partitions(database: Database) -> None:
+    """
+    Invalidate the cached partitions of all the tables of a database.
+    """
+    cache_manager.data_cache.set(
+        get_version_cache_key(database),
+        uuid.uuid4().hex,
+        timeout=0,
+    )
+
+
+def get_cached_partition(
+    database: Database,
+    table: Table,
+    get_partition: Callable[[], T],
+    **kwargs: Any,
+) -> T:
+    """
+    Return the latest partition of a table from the cache, looking it up on a miss.
+
+    Only one worker looks up a missing partition, while the others wait for it to show
+    up in the cache. The lock is held in the data cache rather than the metadata
+    database, since this runs while rendering templates, inside the transaction of
+    the query. If the lock is released without a partition (eg, the lookup failed) or
+    the wait times out, they look it up themselves.
+
+    :param database: The database of the table
+    :param table: The table
+    :param get_partition: A function looking up the latest partition
+    :param kwargs: Additional arguments of the lookup, included in the cache key
+    :returns: The latest partition
+    """
+    cache = cache_manager.data_cache
+    timeout = database.partition_cache_timeout
+    if timeout is None or database.id is None or isinstance(cache.cache, NullCache):
+        return get_partition()
+
+    key = "latest_partition:" + hash_from_dict(
+        {
+            "database_id": database.id,
+            "version": get_version(database),
+            "catalog": table.catalog,
+            "schema": table.schema,
+            "table": table.table,
+            **kwargs,
+        }
+    )
+    stats_logger = current_app.config["STATS_LOGGER"]
+
+    # partitions are wrapped in a tuple, since `None` is a valid partition
+    if (value := cache.get(key)) is not None:
+        stats_logger.incr("latest_partition_cache.hit")
+        return value[0]
+
+    stats_logger.incr("latest_partition_cache.miss")
+    lock_key = LOCK_PREFIX + key
+    if cache.add(lock_key, True, timeout=LOCK_TIMEOUT):
+        try:
+            # the partition might have been looked up since the cache was checked
+            if (value := cache.get(key)) is None:
+                value = (get_partition(),)
+                cache.set(key, value, timeout=timeout)
+            return value[0]
+        finally:
+            cache.delete(lock_key)
+
+    logger.debug("Waiting for in-flight partition lookup with key %s", key)
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        if (value := cache.get(key)) is not None:
+            stats_logger.incr("latest_partition_cache.coalesced")
+            return value[0]
+        if time.monotonic() >= deadline or not cache.has(lock_key):
+            break
+        time.sleep(POLL_INTERVAL)
+
+    value = (get_partition(),)
+    cache.set(key, value, timeout=timeout)
+    return value[0]
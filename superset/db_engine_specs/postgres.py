@@ -17,15 +17,19 @@
 
 from __future__ import annotations
 
+import csv
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime
+from io import StringIO
 from re import Pattern
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -40,6 +44,8 @@ from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType, QuerySource
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database  # pragma: no cover
 
 logger = logging.getLogger()
@@ -94,6 +100,36 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def copy_from_stdin(
+    table: SQLTable,
+    connection: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows with `COPY ... FROM STDIN`, as a `method` of `pandas.DataFrame.to_sql`.
+
+    Rows are sent as CSV, where nulls and empty strings are both written as empty
+    values, and loaded as nulls.
+    """
+    preparer = connection.dialect.identifier_preparer
+    table_name = ".".join(
+        preparer.quote(name) for name in (table.schema, table.name) if name
+    )
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    buffer = StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        return cursor.rowcount
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -483,3 +519,16 @@ WHERE datistemplate = false;
             return False
 
         return True
+
+    @classmethod
+    def get_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Load uploaded files with `COPY ... FROM STDIN` when connected with psycopg2,
+        which is much faster than multi-row inserts.
+
+        Databases speaking the Postgres protocol don't all support `COPY`, so derived
+        engine specs keep using multi-row inserts.
+        """
+        if cls.engine == "postgresql" and engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_to_sql_method(engine)
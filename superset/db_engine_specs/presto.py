@@ -46,6 +46,7 @@ from superset.common.db_query_status import QueryStatus
 from superset.constants import TimeGrain
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.db_engine_specs.exceptions import SupersetDBAPIProgrammingError
+from superset.db_engine_specs.partition_cache import get_cached_partition
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetTemplateException
 from superset.models.sql_lab import Query
@@ -568,7 +569,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         return None
 
     @classmethod
-    @cache_manager.data_cache.memoize(timeout=60)
     def latest_partition(
         cls,
         database: Database,
@@ -578,6 +578,8 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     ) -> tuple[list[str], list[str] | None]:
         """Returns col name and the latest (max) partition value for a table
 
+        The result is cached for the ``partition_cache_timeout`` of the database.
+
         :param table: the table instance
         :param database: database query will be run against
         :type database: models.Database
@@ -589,6 +591,21 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_partition('foo_table')
         (['ds'], ('2018-01-01',))
         """
+        return get_cached_partition(
+            database,
+            table,
+            lambda: cls._latest_partition(database, table, show_first, indexes),
+            show_first=show_first,
+        )
+
+    @classmethod
+    def _latest_partition(
+        cls,
+        database: Database,
+        table: Table,
+        show_first: bool,
+        indexes: list[dict[str, Any]] | None,
+    ) -> tuple[list[str], list[str] | None]:
         if indexes is None:
             indexes = database.get_indexes(table)
 
@@ -655,6 +672,20 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
+        return get_cached_partition(
+            database,
+            table,
+            lambda: cls._latest_sub_partition(database, table, **kwargs),
+            sub_partition=kwargs,
+        )
+
+    @classmethod
+    def _latest_sub_partition(
+        cls,
+        database: Database,
+        table: Table,
+        **kwargs: Any,
+    ) -> Any:
         indexes = database.get_indexes(table)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
@@ -1261,12 +1292,13 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                     indexes=indexes,
                 )
 
-                if not latest_parts:
-                    latest_parts = tuple([None] * len(col_names))
+                latest_values: list[str | None] = (
+                    list(latest_parts) if latest_parts else [None] * len(col_names)
+                )
 
                 metadata["partitions"] = {
                     "cols": sorted(indexes[0].get("column_names", [])),
-                    "latest": dict(zip(col_names, latest_parts, strict=False)),
+                    "latest": dict(zip(col_names, latest_values, strict=False)),
                     "partitionQuery": cls._partition_query(
                         table=table,
                         indexes=indexes,
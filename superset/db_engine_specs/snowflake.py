@@ -23,6 +23,7 @@ from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from cryptography.hazmat.backends import default_backend
@@ -254,6 +255,41 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
         extra["engine_params"] = engine_params
         database.extra = json.dumps(extra)
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch results as an Arrow table, which is the native Snowflake result format.
+
+        Returns ``None`` for empty results, and for results that aren't in the Arrow
+        format (e.g. ``SHOW`` and ``DESCRIBE`` statements), so that the caller can fall
+        back to ``fetch_data``. When a limit is given, batches are only fetched until
+        the limit is reached.
+        """
+        if not hasattr(cursor, "fetch_arrow_all"):
+            return None
+
+        # pylint: disable=import-outside-toplevel
+        from snowflake.connector.errors import NotSupportedError
+
+        try:
+            if not limit:
+                return cursor.fetch_arrow_all()
+
+            batches = []
+            rows = 0
+            for batch in cursor.fetch_arrow_batches():
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= limit:
+                    break
+            if not batches:
+                return None
+            return pa.concat_tables(batches).slice(0, limit)
+        except NotSupportedError:
+            return None
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def get_cancel_query_id(cls, cursor: Any, query: Query) -> Optional[str]:
         """
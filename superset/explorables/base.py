@@ -72,7 +72,12 @@ class Explorable(Protocol):
     # Core Query Interface
     # =========================================================================
 
-    def get_query_result(self, query_object: QueryObject) -> QueryResult:
+    def get_query_result(
+        self,
+        query_object: QueryObject,
+        force_query: bool = False,
+        cache_timeout: int | None = None,
+    ) -> QueryResult:
         """
         Execute a query and return results.
 
@@ -81,6 +86,8 @@ class Explorable(Protocol):
         etc.) and returns a QueryResult containing a pandas DataFrame with the results.
 
         :param query_obj: QueryObject describing the query
+        :param force_query: Whether to bypass any results cached by the datasource
+        :param cache_timeout: How long the datasource may cache results for, if at all
 
         :return: QueryResult containing:
             - df: pandas DataFrame with query results
@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple
+
+from flask import Flask
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from superset.utils.hashing import hash_from_dict
+
+logger = logging.getLogger(__name__)
+
+
+class EngineKey(NamedTuple):
+    """
+    Identifies a reusable engine.
+
+    The fingerprint is a hash of the final URL and engine parameters, ie, after
+    impersonation and the ``DB_CONNECTION_MUTATOR`` have been applied, so that any
+    change in how the connection is established produces a different key.
+    """
+
+    database_id: int
+    catalog: str | None
+    schema: str | None
+    username: str | None
+    fingerprint: str
+
+
+@dataclass
+class EngineEntry:
+    engine: Engine
+    last_used: float
+    user_id: int | None = None
+
+
+class EngineManager:
+    """
+    Process-wide registry of pooled SQLAlchemy engines.
+
+    By default Superset creates a new engine with a ``NullPool`` every time a
+    connection to an analytical database is needed. When
+    ``DATABASE_ENGINE_POOL_ENABLED`` is set, engines are instead cached by
+    ``EngineKey`` and use a ``QueuePool``, so that connections are reused across
+    requests. Entries are evicted when the registry grows beyond
+    ``DATABASE_ENGINE_POOL_MAX_ENGINES`` (least recently used first), when they
+    have been idle for longer than ``DATABASE_ENGINE_POOL_IDLE_TIMEOUT_SEC``, or
+    when the database (or one of its OAuth2 tokens) is modified.
+
+    Invalidation is local to the process; other workers will stop using the stale
+    engine because its key no longer matches, and evict it once it's idle.
+    """
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._max_engines = 100
+        self._idle_timeout = 300
+        self._pool_params: dict[str, Any] = {}
+        self._engines: OrderedDict[EngineKey, EngineEntry] = OrderedDict()
+        self._lock = threading.RLock()
+
+        # connections must never be shared between processes
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def init_app(self, app: Flask) -> None:
+        self.clear()
+        self._enabled = app.config["DATABASE_ENGINE_POOL_ENABLED"]
+        self._max_engines = app.config["DATABASE_ENGINE_POOL_MAX_ENGINES"]
+        self._idle_timeout = app.config["DATABASE_ENGINE_POOL_IDLE_TIMEOUT_SEC"]
+        self._pool_params = app.config["DATABASE_ENGINE_POOL_PARAMS"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def apply_pool_params(self, engine_kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Add the default pool configuration to the engine parameters.
+
+        Parameters explicitly set in the database ``engine_params`` take precedence.
+        """
+        if "poolclass" not in engine_kwargs:
+            engine_kwargs["poolclass"] = QueuePool
+            for key, value in self._pool_params.items():
+                engine_kwargs.setdefault(key, value)
+
+        return engine_kwargs
+
+    @staticmethod
+    def get_fingerprint(url: URL, engine_kwargs: dict[str, Any]) -> str:
+        return hash_from_dict(
+            {
+                "url": url.render_as_string(hide_password=False),
+                "engine_kwargs": engine_kwargs,
+            },
+            default=str,
+        )
+
+    def get_engine(
+        self,
+        key: EngineKey,
+        create_engine: Callable[[], Engine],
+        user_id: int | None = None,
+    ) -> Engine:
+        """
+        Return the engine for a given key, creating it if needed.
+        """
+        with self._lock:
+            self._evict_idle()
+
+            if entry := self._engines.get(key):
+                entry.last_used = time.monotonic()
+                self._engines.move_to_end(key)
+                return entry.engine
+
+            engine = create_engine()
+            self._engines[key] = EngineEntry(
+                engine=engine,
+                last_used=time.monotonic(),
+                user_id=user_id,
+            )
+            logger.debug("Created pooled engine for database %s", key.database_id)
+
+            while len(self._engines) > self._max_engines:
+                _, evicted = self._engines.popitem(last=False)
+                self._dispose(evicted)
+
+            return engine
+
+    def invalidate(self, database_id: int, user_id: int | None = None) -> None:
+        """
+        Dispose of the engines of a database, optionally only for a given user.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._engines.items()
+                if key.database_id == database_id
+                and (user_id is None or entry.user_id == user_id)
+            ]
+            for key in keys:
+                self._dispose(self._engines.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._engines:
+                _, entry = self._engines.popitem()
+                self._dispose(entry)
+
+    def _evict_idle(self) -> None:
+        threshold = time.monotonic() - self._idle_timeout
+        while self._engines:
+            key, entry = next(iter(self._engines.items()))
+            if entry.last_used > threshold:
+                break
+            del self._engines[key]
+            self._dispose(entry)
+
+    @staticmethod
+    def _dispose(entry: EngineEntry) -> None:
+        # connections currently checked out are closed when they're returned
+        try:
+            entry.engine.dispose()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to dispose of engine", exc_info=True)
+
+    def _reset_after_fork(self) -> None:
+        # the lock might have been held by another thread during the fork, and the
+        # inherited connections belong to the parent so they must not be closed here
+        self._lock = threading.RLock()
+        for entry in self._engines.values():
+            entry.engine.dispose(close=False)
+        self._engines = OrderedDict()
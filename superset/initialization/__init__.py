@@ -49,6 +49,7 @@ from superset.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_manager,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
@@ -584,6 +585,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_auth_provider()
         self.configure_async_queries()
         self.configure_ssh_manager()
+        self.configure_engine_manager()
         self.configure_stats_manager()
 
         # Hook that provides administrators a handle on the Flask APP
@@ -753,6 +755,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_ssh_manager(self) -> None:
         ssh_manager_factory.init_app(self.superset_app)
 
+    def configure_engine_manager(self) -> None:
+        engine_manager.init_app(self.superset_app)
+
     def configure_stats_manager(self) -> None:
         stats_logger_manager.init_app(self.superset_app)
 
@@ -802,6 +807,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         appbuilder.indexview = SupersetIndexView
         appbuilder.security_manager_class = custom_sm
         appbuilder.init_app(self.superset_app, db.session)
+        appbuilder.sm.register_cache_listeners()
 
     def configure_url_map_converters(self) -> None:
         #
@@ -917,6 +923,11 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         if feature_flag_manager.is_feature_enabled("GLOBAL_ASYNC_QUERIES"):
             async_query_manager_factory.init_app(self.superset_app)
 
+        if self.config["DATA_CACHE_STALE_TIMEOUT"]:
+            # register the task refreshing stale chart data in the background
+            # pylint: disable=import-outside-toplevel,unused-import
+            import superset.tasks.async_queries  # noqa: F401
+
     def register_blueprints(self) -> None:
         # Register custom blueprints from config
         for bp in self.config["BLUEPRINTS"]:
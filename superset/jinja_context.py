@@ -20,15 +20,24 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
-from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
+from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, TypeVar, Union
 
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import (
+    DebugUndefined,
+    Environment,
+    Template,
+    TemplateSyntaxError,
+    UndefinedError,
+)
 from jinja2.exceptions import SecurityError
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
@@ -65,6 +74,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class UndefinedTemplateFunctionException(SupersetTemplateException):
     """Raised when an undefined function-like Jinja identifier is encountered."""
@@ -650,6 +661,45 @@ def to_datetime(
     return datetime.strptime(value, format)
 
 
+# Compiled templates, by template processor class, dialect and template source
+_compiled_templates: OrderedDict[Hashable, Any] = OrderedDict()
+_compiled_templates_lock = threading.Lock()
+
+
+def get_compiled_template(key: Hashable, compile_template: Callable[[], T]) -> T:
+    """
+    Return a compiled template from the cache, compiling and storing it on a miss.
+
+    The least recently used template is evicted when the cache holds more than
+    `JINJA_TEMPLATE_CACHE_SIZE` templates. Templates are compiled to code objects
+    instead of `Template` objects, since those are bound to the environment (and the
+    dialect specific filters) of the template processor that compiled them.
+
+    :param key: the key of the template, see `BaseTemplateProcessor.get_template_key`
+    :param compile_template: a function compiling the template
+    :returns: the compiled template
+    """
+    max_size = current_app.config["JINJA_TEMPLATE_CACHE_SIZE"]
+    if not max_size:
+        return compile_template()
+
+    stats_logger = current_app.config["STATS_LOGGER"]
+    with _compiled_templates_lock:
+        if key in _compiled_templates:
+            _compiled_templates.move_to_end(key)
+            stats_logger.incr("jinja_template_cache.hit")
+            return cast(T, _compiled_templates[key])
+
+    stats_logger.incr("jinja_template_cache.miss")
+    compiled = compile_template()
+    with _compiled_templates_lock:
+        _compiled_templates[key] = compiled
+        while len(_compiled_templates) > max_size:
+            _compiled_templates.popitem(last=False)
+
+    return compiled
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -684,7 +734,8 @@ class BaseTemplateProcessor:
         self.set_context(**kwargs)
 
         # custom filters
-        self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
+        self._dialect = database.get_dialect()
+        self.env.filters["where_in"] = WhereInMacro(self._dialect)
         self.env.filters["to_datetime"] = to_datetime
 
     def set_context(self, **kwargs: Any) -> None:
@@ -697,6 +748,31 @@ class BaseTemplateProcessor:
         """
         return self._context.copy()
 
+    def get_template_key(self, sql: str) -> Hashable:
+        """
+        Return the key of a template source in the compiled template cache.
+
+        Filters with constant arguments are evaluated when compiling templates, so
+        compiled templates are only shared by processors of the same class and
+        dialect.
+        """
+        return (type(self), type(self._dialect), sql)
+
+    def get_template(self, sql: str) -> Template:
+        """
+        Return a template for a source, compiled once per processor class and dialect.
+        """
+        code = get_compiled_template(
+            self.get_template_key(sql),
+            lambda: self.env.compile(sql),
+        )
+        return self.env.template_class.from_code(
+            self.env,
+            code,
+            self.env.make_globals(None),
+            None,
+        )
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -705,7 +781,7 @@ class BaseTemplateProcessor:
         "SELECT '2017-01-01T00:00:00'"
         """
         try:
-            template = self.env.from_string(sql)
+            template = self.get_template(sql)
         except (
             TemplateSyntaxError,
             SecurityError,
@@ -941,7 +1017,7 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Hive.
@@ -954,7 +1030,7 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
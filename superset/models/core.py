@@ -34,6 +34,7 @@ from typing import Any, Callable, cast, Optional, TYPE_CHECKING
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sshtunnel
 from flask import current_app as app, g, has_app_context
@@ -70,10 +71,12 @@ from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
+    engine_manager,
     event_logger,
     security_manager,
     ssh_manager_factory,
 )
+from superset.extensions.engine_manager import EngineKey
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin, UUIDMixin
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import SQLScript, Table
@@ -367,6 +370,13 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
     def table_cache_timeout(self) -> int | None:
         return self.metadata_cache_timeout.get("table_cache_timeout")
 
+    @property
+    def partition_cache_timeout(self) -> int | None:
+        return self.metadata_cache_timeout.get(
+            "partition_cache_timeout",
+            app.config["LATEST_PARTITION_CACHE_TIMEOUT"],
+        )
+
     @property
     def default_schemas(self) -> list[str]:
         return self.get_extra().get("default_schemas", [])
@@ -490,7 +500,10 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        pooled = engine_manager.enabled and self.id is not None and not self.ssh_tunnel
+        if pooled:
+            engine_kwargs = engine_manager.apply_pool_params(engine_kwargs)
+        elif nullpool:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -509,14 +522,15 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
                 effective_username = user.email.split("@")[0]
 
         oauth2_config = self.get_oauth2_config()
+        user_id = g.user.id if hasattr(g, "user") and hasattr(g.user, "id") else None
         access_token = (
             get_oauth2_access_token(
                 oauth2_config,
                 self.id,
-                g.user.id,
+                user_id,
                 self.db_engine_spec,
             )
-            if oauth2_config and hasattr(g, "user") and hasattr(g.user, "id")
+            if oauth2_config and user_id is not None
             else None
         )
         masked_url = self.get_password_masked_url(sqlalchemy_url)
@@ -543,10 +557,30 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
                 security_manager,
                 source,
             )
-        try:
-            return create_engine(sqlalchemy_url, **engine_kwargs)
-        except Exception as ex:
-            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        def _create_engine() -> Engine:
+            try:
+                return create_engine(sqlalchemy_url, **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        if not pooled:
+            return _create_engine()
+
+        # the username only affects the connection through impersonation or the
+        # mutator, and in that case it's also part of the fingerprint
+        key = EngineKey(
+            database_id=self.id,
+            catalog=catalog,
+            schema=schema,
+            username=(
+                effective_username
+                if self.impersonate_user or DB_CONNECTION_MUTATOR
+                else None
+            ),
+            fingerprint=engine_manager.get_fingerprint(sqlalchemy_url, engine_kwargs),
+        )
+        return engine_manager.get_engine(key, _create_engine, user_id=user_id)
 
     def add_database_to_signature(
         self,
@@ -673,7 +707,11 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
         catalog: str | None = None,
         schema: str | None = None,
         fetch_last_result: bool = False,
-    ) -> tuple[Any, list[tuple[Any, ...]] | None, DbapiDescription | None]:
+    ) -> tuple[
+        Any,
+        list[tuple[Any, ...]] | pa.Table | None,
+        DbapiDescription | None,
+    ]:
         """
         Internal method to execute SQL with mutation and logging.
 
@@ -682,7 +720,8 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
         :param schema: Optional schema name
         :param fetch_last_result: Whether to fetch results from last statement
         :return: Tuple of (cursor, rows, description) where rows and description
-        are None if not fetching.
+        are None if not fetching. Rows are an Arrow table when the engine spec can
+        fetch them natively.
         """
         script = SQLScript(sql, self.db_engine_spec.engine)
 
@@ -724,7 +763,9 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
                 if fetch_last_result and i == len(script.statements) - 1:
                     # Capture cursor.description while it's still valid
                     description = cursor.description
-                    rows = self.db_engine_spec.fetch_data(cursor)
+                    rows = self.db_engine_spec.fetch_arrow(cursor)
+                    if rows is None:
+                        rows = self.db_engine_spec.fetch_data(cursor)
                 else:
                     # Consume results without storing
                     cursor.fetchall()
@@ -790,7 +831,7 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
     def load_into_dataframe(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
+        data: list[tuple[Any, ...]] | pa.Table,
     ) -> pd.DataFrame:
         result_set = SupersetResultSet(
             data,
@@ -1316,6 +1357,18 @@ sqla.event.listen(Database, "after_update", security_manager.database_after_upda
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
 
 
+def invalidate_database_engines(
+    mapper: Any,  # pylint: disable=unused-argument
+    connection: Connection,  # pylint: disable=unused-argument
+    target: Database,
+) -> None:
+    engine_manager.invalidate(target.id)
+
+
+sqla.event.listen(Database, "after_update", invalidate_database_engines)
+sqla.event.listen(Database, "after_delete", invalidate_database_engines)
+
+
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
     """
     Store OAuth2 tokens, for authenticating to DBs using user personal tokens.
@@ -1345,6 +1398,18 @@ class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
     refresh_token = Column(encrypted_field_factory.create(Text), nullable=True)
 
 
+def invalidate_oauth2_engines(
+    mapper: Any,  # pylint: disable=unused-argument
+    connection: Connection,  # pylint: disable=unused-argument
+    target: DatabaseUserOAuth2Tokens,
+) -> None:
+    engine_manager.invalidate(target.database_id, user_id=target.user_id)
+
+
+sqla.event.listen(DatabaseUserOAuth2Tokens, "after_update", invalidate_oauth2_engines)
+sqla.event.listen(DatabaseUserOAuth2Tokens, "after_delete", invalidate_oauth2_engines)
+
+
 class Log(Model):  # pylint: disable=too-few-public-methods
     """ORM object used to log Superset actions to the database"""
 
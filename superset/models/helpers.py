@@ -67,6 +67,7 @@ from superset import db, is_feature_enabled
 from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.common.db_query_status import QueryStatus
 from superset.common.utils import dataframe_utils
+from superset.common.utils.query_cache_codec import encode_cache_value
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
@@ -98,6 +99,7 @@ from superset.superset_typing import (
     QueryObjectDict,
 )
 from superset.utils import core as utils, json
+from superset.utils.concurrency import map_in_app_context, merge_in_session
 from superset.utils.core import (
     DateColumn,
     DTTM_ALIAS,
@@ -131,8 +133,10 @@ class ValidationResultDict(TypedDict):
 
 if TYPE_CHECKING:
     from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_manager import QueryCacheManager
     from superset.connectors.sqla.models import SqlMetric, TableColumn
     from superset.db_engine_specs import BaseEngineSpec
+    from superset.explorables.base import Explorable
     from superset.models.core import Database
 
 logger = logging.getLogger(__name__)
@@ -155,6 +159,18 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class PendingTimeOffset(NamedTuple):
+    """A time offset that isn't cached, and needs to be queried"""
+
+    offset: str
+    position: int
+    query_object: QueryObject
+    query_object_dct: QueryObjectDict
+    metrics_mapping: dict[str, str]
+    cache: QueryCacheManager
+    cache_key: str | None
+
+
 # Keys used to filter QueryObjectDict for get_sqla_query parameters
 SQLA_QUERY_KEYS = {
     "apply_fetch_values_predicate",
@@ -669,6 +685,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         errors: Optional[list[dict[str, Any]]] = None,
         from_dttm: Optional[datetime] = None,
         to_dttm: Optional[datetime] = None,
+        derived_from: Optional[dict[str, Any]] = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -681,6 +698,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         self.errors = errors or []
         self.from_dttm = from_dttm
         self.to_dttm = to_dttm
+        self.derived_from = derived_from
         self.sql_rowcount = len(self.df.index) if not self.df.empty else 0
 
 
@@ -1298,29 +1316,63 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         return df
 
-    def get_query_result(self, query_object: QueryObject) -> QueryResult:
+    def get_query_result(
+        self,
+        query_object: QueryObject,
+        force_query: bool = False,
+        cache_timeout: int | None = None,
+    ) -> QueryResult:
         """
         Execute query and return results with full processing pipeline.
 
         This method handles:
-        1. Query execution via self.query()
+        1. Query execution via self.query(), or loading the result cached before
+           post-processing, or rollup of a cached result for a finer time grain (if
+           enabled)
         2. DataFrame normalization
         3. Time offset processing (if applicable)
         4. Post-processing operations
 
         :param query_object: The query configuration
+        :param force_query: Whether to query the database even if the result can be
+            loaded or rolled up from the cache
+        :param cache_timeout: The data cache timeout of the query, if caching its
+            result before post-processing
         :return: QueryResult with processed dataframe
         """
-        # Execute the base query
-        result = self.query(query_object.to_dict())
+        # Import here to avoid circular dependency
+        # pylint: disable=import-outside-toplevel
+        from superset.common.utils.query_result_cache import QueryResultCache
+        from superset.common.utils.query_rollup import QueryRollup
+
+        result_cache = QueryResultCache.from_query_object(
+            cast("Explorable", self),
+            query_object,
+            cache_timeout,
+        )
+        rollup = QueryRollup.from_query_object(
+            cast("Explorable", self),
+            query_object,
+        )
+        result = None
+        if result_cache and not force_query:
+            result = result_cache.get_query_result()
+        if result is None and rollup and not force_query:
+            result = rollup.get_query_result()
+        if result is None:
+            # Execute the base query
+            result = self.query(query_object.to_dict())
+            if not result.df.empty:
+                # Normalize datetime columns and metrics
+                result.df = self.normalize_df(result.df, query_object)
+            if result_cache:
+                result_cache.set_query_result(result)
+
         query = result.query + ";\n\n" if result.query else ""
 
         # Process the dataframe if not empty
         df = result.df
         if not df.empty:
-            # Normalize datetime columns and metrics
-            df = self.normalize_df(df, query_object)
-
             # Process time offsets if requested
             if query_object.time_offsets:
                 # Process time offsets using the datasource's own method
@@ -1377,6 +1429,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        pending_offsets: list[PendingTimeOffset] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -1587,43 +1640,64 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 query_object_clone_dct["row_limit"] = app.config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            # Call the unified query method on the datasource
-            result = self.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            # the offset is queried once all the offsets are processed, so that the
+            # queries can run concurrently
+            offset_dfs[offset] = pd.DataFrame()
+            pending_offsets.append(
+                PendingTimeOffset(
+                    offset=offset,
+                    position=len(queries),
+                    query_object=copy.copy(query_object_clone),
+                    query_object_dct=query_object_clone_dct,
+                    metrics_mapping=metrics_mapping,
+                    cache=cache,
+                    cache_key=cache_key,
+                )
+            )
+            queries.append("")
             cache_keys.append(None)
 
+        results = map_in_app_context(
+            lambda pending: merge_in_session(self).query(pending.query_object_dct),
+            pending_offsets,
+            app.config["CHART_DATA_MAX_WORKERS"],
+        )
+        for pending, result in zip(pending_offsets, results, strict=True):
+            queries[pending.position] = result.query
+
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
                     {
                         col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
+                        for col in join_keys + list(pending.metrics_mapping.values())
                     }
                 )
             else:
                 # 1. normalize df, set dttm column
                 offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+                    offset_metrics_df, pending.query_object
                 )
 
                 # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+                offset_metrics_df = offset_metrics_df.rename(
+                    columns=pending.metrics_mapping
+                )
 
             # cache df and query if caching is enabled
-            if cache_key and cache_timeout_fn:
+            if pending.cache_key and cache_timeout_fn:
                 value = {
                     "df": offset_metrics_df,
                     "query": result.query,
                 }
-                cache.set(
-                    key=cache_key,
-                    value=value,
+                pending.cache.set(
+                    key=pending.cache_key,
+                    value=encode_cache_value(value),
                     timeout=cache_timeout_fn(),
                     datasource_uid=self.uid,
                     region=CacheRegion.DATA,
                 )
-            offset_dfs[offset] = offset_metrics_df
+            offset_dfs[pending.offset] = offset_metrics_df
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -1871,6 +1945,21 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 _("Time Grain must be specified when using Time Shift.")
             )
 
+        # relative offsets are joined on vectorized keys when possible
+        if (
+            time_grain
+            and not join_column_producer
+            and not any(self.is_valid_date_range(offset) for offset in offset_dfs)
+        ):
+            joined_df = dataframe_utils.left_join_offset_dfs(
+                df,
+                offset_dfs,
+                time_grain,
+                join_keys,
+            )
+            if joined_df is not None:
+                return joined_df
+
         for offset, offset_df in offset_dfs.items():
             is_date_range_offset = self.is_valid_date_range(
                 offset
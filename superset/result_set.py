@@ -18,6 +18,8 @@
 
 import datetime
 import logging
+from collections.abc import Sequence
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -99,20 +101,75 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+# Arrow types that can be safely requested up front for a given generic type, along
+# with the Python type the values must have; other types (numeric, temporal) are
+# inferred from the values, since drivers return them as different Python types (eg,
+# ``Decimal`` vs ``float``, naive vs aware datetimes).
+ARROW_TYPE_HINTS: dict[GenericDataType, tuple[pa.DataType, type[Any]]] = {
+    GenericDataType.STRING: (pa.string(), str),
+    GenericDataType.BOOLEAN: (pa.bool_(), bool),
+}
+
+# Errors raised by pyarrow when a column can't be converted as is
+ARROW_CONVERSION_ERRORS = (
+    pa.lib.ArrowInvalid,
+    pa.lib.ArrowTypeError,
+    pa.lib.ArrowNotImplementedError,
+    ValueError,
+    TypeError,  # this is super hackey,
+    # https://issues.apache.org/jira/browse/ARROW-7855
+)
+
+
+def stringify_column(values: Sequence[Any]) -> pa.Array:
+    """
+    Serialize the values of a column as strings.
+
+    Only the non-null values go through ``stringify_values``, since columns that need
+    to be serialized (eg, nested types) are often sparse.
+    """
+    positions = [i for i, value in enumerate(values) if value is not None]
+    result: list[Any] = [None] * len(values)
+    if not positions:
+        return pa.array(result)
+
+    non_null = np.fromiter(
+        (values[i] for i in positions),
+        dtype=object,
+        count=len(positions),
+    )
+    for position, value in zip(
+        positions,
+        stringify_values(non_null).tolist(),
+        strict=True,
+    ):
+        result[position] = value
+
+    return pa.array(result)
+
+
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals  # noqa: C901
+    def __init__(
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[pa.Array | pa.ChunkedArray] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
+
+        if isinstance(data, pa.Table):
+            # results fetched natively as Arrow by the driver; the description might
+            # be missing, or not match the table
+            if not cursor_description or len(cursor_description) != data.num_columns:
+                cursor_description = [
+                    (name, "", None, None, None, None, True)
+                    for name in data.column_names
+                ]
+        else:
+            data = data or []
 
         if cursor_description:
             # get deduped list of column names
@@ -128,60 +185,6 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-
-        for column in column_names:
-            try:
-                pa_data.append(pa.array(array[column].tolist()))
-            except (
-                pa.lib.ArrowInvalid,
-                pa.lib.ArrowTypeError,
-                pa.lib.ArrowNotImplementedError,
-                ValueError,
-                TypeError,  # this is super hackey,
-                # https://issues.apache.org/jira/browse/ARROW-7855
-            ):
-                # attempt serialization of values as strings
-                stringified_arr = stringify_values(array[column])
-                pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series, utc=True)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
-
-        if not pa_data:
-            column_names = []
-
-        self.table = pa.Table.from_arrays(pa_data, names=column_names)
         self._type_dict: dict[str, Any] = {}
         try:
             # The driver may not be passing a cursor.description
@@ -193,6 +196,113 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+        if isinstance(data, pa.Table):
+            pa_data = [self.normalize_arrow_column(column) for column in data.columns]
+        else:
+            # only do expensive recasting if rows can't be indexed
+            if data and not isinstance(data[0], (tuple, list)):
+                data = [tuple(row) for row in data]
+
+            # build one column at a time straight from the rows, so that only the
+            # values of the column being converted are materialized in a list
+            for i, column in enumerate(column_names):
+                pa_data.append(
+                    self.build_arrow_array(
+                        list(map(itemgetter(i), data)),
+                        self.get_arrow_type_hint(self._type_dict.get(column)),
+                    )
+                )
+
+        if not pa_data:
+            column_names = []
+
+        self.table = pa.Table.from_arrays(pa_data, names=column_names)
+
+    def get_arrow_type_hint(
+        self, db_type_str: Optional[str]
+    ) -> Optional[tuple[pa.DataType, type[Any]]]:
+        """
+        Return the Arrow type to try first for a column, based on its DB type.
+        """
+        if not db_type_str:
+            return None
+
+        try:
+            generic_type = self.type_generic(db_type_str)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        return ARROW_TYPE_HINTS.get(generic_type) if generic_type else None
+
+    @staticmethod
+    def normalize_arrow_column(
+        column: pa.ChunkedArray,
+    ) -> pa.Array | pa.ChunkedArray:
+        """
+        Adapt a column fetched natively as Arrow to what the row-based path produces.
+        """
+        if pa.types.is_nested(column.type):
+            # nested types are serialized as strings, see ``build_arrow_array``
+            return stringify_column(column.to_pylist())
+
+        if pa.types.is_dictionary(column.type):
+            return column.cast(column.type.value_type)
+
+        return column
+
+    @classmethod
+    def build_arrow_array(
+        cls,
+        values: Sequence[Any],
+        type_hint: Optional[tuple[pa.DataType, type[Any]]] = None,
+    ) -> pa.Array:
+        """
+        Convert the values of a single column into an Arrow array.
+
+        The type hint is tried first, then Arrow's type inference; only if both fail
+        are the values serialized as strings.
+        """
+        if type_hint is not None:
+            pa_type, python_type = type_hint
+            sample = next((value for value in values if value is not None), None)
+            if isinstance(sample, python_type):
+                try:
+                    return pa.array(values, type=pa_type)
+                except ARROW_CONVERSION_ERRORS:
+                    pass
+
+        try:
+            array = pa.array(values)
+        except ARROW_CONVERSION_ERRORS:
+            # attempt serialization of values as strings
+            return stringify_column(values)
+
+        if pa.types.is_nested(array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            return stringify_column(values)
+
+        if pa.types.is_temporal(array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = cls.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(values, dtype=object)
+                        series = pd.to_datetime(series, utc=True)
+                        return pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=tz),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -215,7 +325,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
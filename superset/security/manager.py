@@ -20,10 +20,11 @@
 import logging
 import re
 import time
+import uuid
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.models.filters import BaseFilter
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
@@ -48,9 +49,9 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import eagerload
+from sqlalchemy.orm import eagerload, Session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
 from sqlalchemy.sql import exists
@@ -83,11 +84,7 @@ from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
-    from superset.connectors.sqla.models import (
-        BaseDatasource,
-        RowLevelSecurityFilter,
-        SqlaTable,
-    )
+    from superset.connectors.sqla.models import BaseDatasource, SqlaTable
     from superset.explorables.base import Explorable
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
@@ -104,6 +101,11 @@ def get_conf() -> Any:
 
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
+# Cache keys of the versions of the RLS filters and permission indexes, changed
+# whenever they are
+RLS_FILTERS_VERSION_CACHE_KEY = "rls_filters_version"
+PERMISSIONS_VERSION_CACHE_KEY = "permissions_version"
+
 
 class DatabaseCatalogSchema(NamedTuple):
     database: str
@@ -111,6 +113,12 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class RLSFilterClause(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -933,6 +941,11 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        if (
+            permission_index := self._get_permission_index(self.get_user_roles(g.user))
+        ) is not None:
+            return set(permission_index.get(permission_name, ()))
+
         base_query = (
             self.session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -973,6 +986,143 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return {s.name for s in view_menu_names}
         return set()
 
+    def _has_view_access(
+        self, user: object, permission_name: str, view_name: str
+    ) -> bool:
+        roles = self.get_user_roles(user)
+        db_roles = [role for role in roles if role.name not in self.builtin_roles]
+        if (permission_index := self._get_permission_index(db_roles)) is None:
+            return super()._has_view_access(user, permission_name, view_name)
+
+        return any(
+            role.name in self.builtin_roles
+            and self._has_access_builtin_roles(role, permission_name, view_name)
+            for role in roles
+        ) or view_name in permission_index.get(permission_name, ())
+
+    def _get_permission_index(
+        self, roles: list[Role]
+    ) -> Optional[dict[str, frozenset[str]]]:
+        """
+        Return the view menus of each permission granted to a set of roles.
+
+        The index is built in a single query, and cached for the duration of the
+        request and across requests, for `PERMISSION_INDEX_CACHE_TIMEOUT` seconds.
+
+        :param roles: The roles
+        :returns: The view menu names by permission name, or `None` if the permission
+            index is disabled
+        """
+        timeout = get_conf()["PERMISSION_INDEX_CACHE_TIMEOUT"]
+        if timeout is None:
+            return None
+
+        role_ids = tuple(sorted({role.id for role in roles}))
+        permission_indexes = g.setdefault("_permission_indexes", {})
+        if role_ids not in permission_indexes:
+            # pylint: disable=import-outside-toplevel
+            from superset.extensions import cache_manager
+
+            version = self._get_cache_version(PERMISSIONS_VERSION_CACHE_KEY)
+            cache_key = f"permission_index:{version}:{','.join(map(str, role_ids))}"
+            permission_index = cache_manager.cache.get(cache_key)
+            if permission_index is None:
+                permission_index = self._query_permission_index(role_ids)
+                cache_manager.cache.set(cache_key, permission_index, timeout=timeout)
+            permission_indexes[role_ids] = permission_index
+
+        return permission_indexes[role_ids]
+
+    def _query_permission_index(
+        self, role_ids: tuple[int, ...]
+    ) -> dict[str, frozenset[str]]:
+        """
+        Query the view menus of each permission granted to a set of roles.
+
+        :param role_ids: The IDs of the roles
+        :returns: The view menu names by permission name
+        """
+        if not role_ids:
+            return {}
+
+        query = (
+            self.session.query(self.permission_model.name, self.viewmenu_model.name)
+            .select_from(self.permissionview_model)
+            .join(self.permission_model)
+            .join(self.viewmenu_model)
+            .join(assoc_permissionview_role)
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+            .distinct()
+        )
+        view_menu_names: dict[str, set[str]] = defaultdict(set)
+        for permission_name, view_menu_name in query:
+            view_menu_names[permission_name].add(view_menu_name)
+
+        return {
+            permission_name: frozenset(names)
+            for permission_name, names in view_menu_names.items()
+        }
+
+    @classmethod
+    def invalidate_permission_indexes(cls) -> None:
+        """
+        Invalidate the permission indexes cached for the request, and across requests
+        by changing their version.
+        """
+        if not has_app_context():
+            return
+
+        g.pop("_permission_indexes", None)
+        cls._change_cache_version(PERMISSIONS_VERSION_CACHE_KEY)
+
+    @staticmethod
+    def _flag_permissions_changed(connection: Connection) -> None:
+        """
+        Flag the changes of view menus and permission views made by SQLAlchemy events
+        through a connection (eg, when a dataset is renamed), which aren't visible to
+        the session.
+
+        :param connection: The SQLA connection
+        """
+        connection.info["permissions_changed"] = True
+
+    @classmethod
+    def permissions_after_flush(
+        cls,
+        session: Session,
+        flush_context: Any,  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Flag the changes of roles, permissions, view menus and the roles of users, so
+        that the cached permission indexes are invalidated once they are committed.
+
+        :param session: The flushed session
+        :param flush_context: The flush context
+        """
+        models = (
+            cls.role_model,
+            cls.permission_model,
+            cls.viewmenu_model,
+            cls.permissionview_model,
+        )
+        # the flag is popped after each flush, since the connection outlives the session
+        changed_by_events = session.connection().info.pop("permissions_changed", False)
+        if (
+            changed_by_events
+            or any(
+                isinstance(instance, models)
+                for instance in (*session.new, *session.dirty, *session.deleted)
+            )
+            or any(
+                isinstance(instance, cls.user_model)
+                and inspect(instance).attrs.roles.history.has_changes()
+                for instance in session.dirty
+            )
+        ):
+            if has_app_context():
+                g.pop("_permission_indexes", None)
+            session.info["permissions_changed"] = True
+
     def get_accessible_databases(self) -> list[int]:
         """
         Return the list of databases accessible by the user.
@@ -1708,6 +1858,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             connection, new_view_menu_name
         )
 
+        self._flag_permissions_changed(connection)
         self.on_view_menu_after_update(mapper, connection, new_db_view_menu)
         return new_db_view_menu
 
@@ -1781,6 +1932,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                     connection,
                     new_dataset_vm_name,
                 )
+                self._flag_permissions_changed(connection)
                 self.on_view_menu_after_update(
                     mapper,
                     connection,
@@ -2117,6 +2269,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         # VM changed, so call hook
         new_dataset_view_menu = self.find_view_menu(new_permission_name)
+        self._flag_permissions_changed(connection)
         self.on_view_menu_after_update(mapper, connection, new_dataset_view_menu)
         # Update dataset (SqlaTable perm field)
         connection.execute(
@@ -2176,6 +2329,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 permission_view_menu_table.c.id == pvm.id
             )
         )
+        self._flag_permissions_changed(connection)
         self.on_permission_view_after_delete(mapper, connection, pvm)
         connection.execute(
             view_menu_table.delete().where(view_menu_table.c.id == pvm.view_menu_id)
@@ -2713,11 +2867,16 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource | Explorable") -> list[SqlaQuery]:
+    def get_rls_filters(
+        self, table: "BaseDatasource | Explorable"
+    ) -> list[RLSFilterClause]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        Filters are cached for the duration of the request, and across requests when
+        `RLS_FILTERS_CACHE_TIMEOUT` is set.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2725,6 +2884,54 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        role_ids = tuple(sorted({role.id for role in self.get_user_roles(g.user)}))
+        table_id = getattr(table, "id", None) or table.data["id"]
+        rls_filters = g.setdefault("_rls_filters", {})
+        if (role_ids, table_id) not in rls_filters:
+            rls_filters[(role_ids, table_id)] = self._get_cached_rls_filters(
+                role_ids, table_id
+            )
+
+        # copied, since callers sort the filters in place
+        return list(rls_filters[(role_ids, table_id)])
+
+    def _get_cached_rls_filters(
+        self, role_ids: tuple[int, ...], table_id: int
+    ) -> list[RLSFilterClause]:
+        """
+        Retrieves the row level security filters of a set of roles and a table from
+        the cache, querying them if they're not cached.
+
+        :param role_ids: The IDs of the roles to check against
+        :param table_id: The ID of the table to check against
+        :returns: A list of filters
+        """
+        timeout = get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]
+        if timeout is None:
+            return self._query_rls_filters(role_ids, table_id)
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = self._get_cache_version(RLS_FILTERS_VERSION_CACHE_KEY)
+        cache_key = f"rls_filters:{version}:{table_id}:{','.join(map(str, role_ids))}"
+        rls_filters = cache_manager.cache.get(cache_key)
+        if rls_filters is None:
+            rls_filters = self._query_rls_filters(role_ids, table_id)
+            cache_manager.cache.set(cache_key, rls_filters, timeout=timeout)
+
+        return rls_filters
+
+    def _query_rls_filters(
+        self, role_ids: tuple[int, ...], table_id: int
+    ) -> list[RLSFilterClause]:
+        """
+        Queries the row level security filters of a set of roles and a table.
+
+        :param role_ids: The IDs of the roles to check against
+        :param table_id: The ID of the table to check against
+        :returns: A list of filters
+        """
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2732,14 +2939,13 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
             .filter(
                 RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.REGULAR
             )
-            .filter(RLSFilterRoles.c.role_id.in_(user_roles))
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
         )
         base_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
@@ -2747,10 +2953,10 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(
                 RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.BASE
             )
-            .filter(RLSFilterRoles.c.role_id.in_(user_roles))
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
         )
         filter_tables = self.session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.data["id"]
+            RLSFilterTables.c.table_id == table_id
         )
         query = (
             self.session.query(
@@ -2774,11 +2980,128 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [RLSFilterClause(*row) for row in query.all()]
+
+    @staticmethod
+    def _get_cache_version(key: str) -> str:
+        """
+        Returns the version of data cached across requests, which is changed to
+        invalidate it.
+
+        Versions are random rather than incremented, so that an evicted version is
+        never reused.
+
+        :param key: The cache key of the version
+        :returns: The version
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if (version := cache_manager.cache.get(key)) is None:
+            cache_manager.cache.add(key, uuid.uuid4().hex, timeout=0)
+            version = cache_manager.cache.get(key)
+
+        return version or ""
+
+    @staticmethod
+    def _change_cache_version(key: str) -> None:
+        """
+        Changes the version of data cached across requests, invalidating it.
+
+        :param key: The cache key of the version
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(key, uuid.uuid4().hex, timeout=0)
+
+    @classmethod
+    def invalidate_rls_filters(cls) -> None:
+        """
+        Invalidates the RLS filters cached for the request, and across requests by
+        changing their version.
+        """
+        if not has_app_context():
+            return
+
+        g.pop("_rls_filters", None)
+        cls._change_cache_version(RLS_FILTERS_VERSION_CACHE_KEY)
+
+    @classmethod
+    def rls_filters_after_flush(
+        cls,
+        session: Session,
+        flush_context: Any,  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Flags the changes of RLS filters, including the changes of their roles and
+        tables, and the deletion of roles and tables whose filter associations are
+        deleted along with them.
+
+        The filters cached for the request are dropped right away, while the ones
+        cached across requests are invalidated once the change is committed, so that
+        other workers can't cache them again in the meantime.
+
+        :param session: The flushed session
+        :param flush_context: The flush context
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
+
+        if any(
+            isinstance(instance, RowLevelSecurityFilter)
+            for instance in (*session.new, *session.dirty, *session.deleted)
+        ) or any(
+            isinstance(instance, (cls.role_model, SqlaTable))
+            for instance in session.deleted
+        ):
+            if has_app_context():
+                g.pop("_rls_filters", None)
+            session.info["rls_filters_changed"] = True
+
+    @classmethod
+    def security_caches_after_commit(cls, session: Session) -> None:
+        """
+        Invalidates the cached RLS filters and permission indexes when a transaction
+        changing them is committed.
+
+        :param session: The committed session
+        """
+        if session.info.pop("rls_filters_changed", False):
+            cls.invalidate_rls_filters()
+        if session.info.pop("permissions_changed", False):
+            cls.invalidate_permission_indexes()
+
+    @staticmethod
+    def security_caches_after_rollback(session: Session) -> None:
+        """
+        Forgets the changes of RLS filters and permissions that are rolled back.
+
+        :param session: The rolled back session
+        """
+        session.info.pop("rls_filters_changed", None)
+        session.info.pop("permissions_changed", None)
+
+    @classmethod
+    def register_cache_listeners(cls) -> None:
+        """
+        Registers the session listeners invalidating the RLS filters and permission
+        indexes cached across requests. The listeners are bound to the class, so
+        registering them again (eg, for another app) is a no-op.
+        """
+        listeners: list[tuple[str, Callable[..., None]]] = [
+            ("after_flush", cls.permissions_after_flush),
+            ("after_flush", cls.rls_filters_after_flush),
+            ("after_commit", cls.security_caches_after_commit),
+            ("after_rollback", cls.security_caches_after_rollback),
+        ]
+        for identifier, listener in listeners:
+            if not event.contains(Session, identifier, listener):
+                event.listen(Session, identifier, listener)
 
     def get_rls_sorted(
         self, table: "BaseDatasource | Explorable"
-    ) -> list["RowLevelSecurityFilter"]:
+    ) -> list[RLSFilterClause]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
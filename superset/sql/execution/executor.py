@@ -156,7 +156,9 @@ def execute_sql_with_cursor(
         # Fetch results from ALL statements
         description = cursor.description
         if description:
-            rows = database.db_engine_spec.fetch_data(cursor)
+            rows = database.db_engine_spec.fetch_arrow(cursor)
+            if rows is None:
+                rows = database.db_engine_spec.fetch_data(cursor)
             result_set = SupersetResultSet(
                 rows,
                 description,
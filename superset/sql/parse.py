@@ -24,9 +24,12 @@ import re
 import urllib.parse
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Generic, Optional, TYPE_CHECKING, TypeVar
 
 import sqlglot
+from flask import current_app, has_app_context
 from jinja2 import nodes, Template
 from sqlglot import exp
 from sqlglot.dialects.dialect import (
@@ -44,6 +47,7 @@ from sqlglot.optimizer.scope import (
     traverse_scope,
 )
 
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.exceptions import QueryClauseValidationException, SupersetParseError
 from superset.sql.dialects import DB2, Dremio, Firebolt, Pinot
 
@@ -536,6 +540,66 @@ class BaseSQLStatement(Generic[InternalRepresentation]):
         return self.format()
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def _parse_script(script: str, engine: str) -> tuple[exp.Expression, ...]:
+    """
+    Parse a script with sqlglot, caching the ASTs of its statements.
+
+    When the base dialect (engine="base" or unknown engines) fails to parse SQL
+    containing backtick-quoted identifiers, we fall back to MySQL dialect which
+    supports backticks natively. This handles cases like "Other" database type
+    where users may have MySQL-compatible syntax with backtick-quoted table names.
+
+    The cached ASTs are shared, and must be copied before being used.
+    """
+    dialect = SQLGLOT_DIALECTS.get(engine)
+    try:
+        statements = sqlglot.parse(script, dialect=dialect)
+    except sqlglot.errors.ParseError as ex:
+        # If parsing fails with base dialect (or no dialect for unknown engines)
+        # and the script contains backticks, retry with MySQL dialect which
+        # supports backtick-quoted identifiers
+        if (dialect is None or dialect == Dialects.DIALECT) and "`" in script:
+            try:
+                statements = sqlglot.parse(script, dialect=Dialects.MYSQL)
+            except sqlglot.errors.ParseError:
+                # If MySQL dialect also fails, raise the original error
+                pass
+            else:
+                return tuple(statement for statement in statements if statement)
+
+        kwargs = (
+            {
+                "highlight": ex.errors[0]["highlight"],
+                "line": ex.errors[0]["line"],
+                "column": ex.errors[0]["col"],
+            }
+            if ex.errors
+            else {}
+        )
+        raise SupersetParseError(script, engine, **kwargs) from ex
+    except sqlglot.errors.SqlglotError as ex:
+        raise SupersetParseError(
+            script,
+            engine,
+            message="Unable to parse script",
+        ) from ex
+
+    # `sqlglot` will parse comments after the last semicolon as a separate
+    # statement; move them back to the last token in the last real statement
+    if len(statements) > 1 and isinstance(statements[-1], exp.Semicolon):
+        last_statement = statements.pop()
+        target = statements[-1]
+        for node in statements[-1].walk():
+            if hasattr(node, "comments"):  # pragma: no cover
+                target = node
+
+        target.comments = target.comments or []
+        target.comments.extend(last_statement.comments)
+
+    return tuple(statement for statement in statements if statement)
+
+
 class SQLStatement(BaseSQLStatement[exp.Expression]):
     """
     A SQL statement.
@@ -557,57 +621,20 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         """
         Parse helper.
 
-        When the base dialect (engine="base" or unknown engines) fails to parse SQL
-        containing backtick-quoted identifiers, we fall back to MySQL dialect which
-        supports backticks natively. This handles cases like "Other" database type
-        where users may have MySQL-compatible syntax with backtick-quoted table names.
-        """
-        dialect = SQLGLOT_DIALECTS.get(engine)
-        try:
-            statements = sqlglot.parse(script, dialect=dialect)
-        except sqlglot.errors.ParseError as ex:
-            # If parsing fails with base dialect (or no dialect for unknown engines)
-            # and the script contains backticks, retry with MySQL dialect which
-            # supports backtick-quoted identifiers
-            if (dialect is None or dialect == Dialects.DIALECT) and "`" in script:
-                try:
-                    statements = sqlglot.parse(script, dialect=Dialects.MYSQL)
-                except sqlglot.errors.ParseError:
-                    # If MySQL dialect also fails, raise the original error
-                    pass
-                else:
-                    return statements
-
-            kwargs = (
-                {
-                    "highlight": ex.errors[0]["highlight"],
-                    "line": ex.errors[0]["line"],
-                    "column": ex.errors[0]["col"],
-                }
-                if ex.errors
-                else {}
+        The same SQL is usually parsed several times per request (eg, for security
+        checks, RLS and limits), so parsed scripts are cached by engine. Callers get
+        copies of the cached ASTs, so that they can be modified.
+        """
+        hits = _parse_script.cache_info().hits
+        statements = _parse_script(script.strip(), engine)
+        if has_app_context():
+            current_app.config["STATS_LOGGER"].incr(
+                "sql_parse_cache.hit"
+                if _parse_script.cache_info().hits > hits
+                else "sql_parse_cache.miss"
             )
-            raise SupersetParseError(script, engine, **kwargs) from ex
-        except sqlglot.errors.SqlglotError as ex:
-            raise SupersetParseError(
-                script,
-                engine,
-                message="Unable to parse script",
-            ) from ex
 
-        # `sqlglot` will parse comments after the last semicolon as a separate
-        # statement; move them back to the last token in the last real statement
-        if len(statements) > 1 and isinstance(statements[-1], exp.Semicolon):
-            last_statement = statements.pop()
-            target = statements[-1]
-            for node in statements[-1].walk():
-                if hasattr(node, "comments"):  # pragma: no cover
-                    target = node
-
-            target.comments = target.comments or []
-            target.comments.extend(last_statement.comments)
-
-        return statements
+        return [statement.copy() for statement in statements]
 
     @classmethod
     def split_script(
@@ -1456,40 +1483,51 @@ def process_jinja_sql(
     """
 
     from superset.jinja_context import (  # pylint: disable=import-outside-toplevel
+        get_compiled_template,
         get_template_processor,
     )
 
     processor = get_template_processor(database)
-    ast = processor.env.parse(sql)
 
-    tables = set()
+    def compile_template() -> tuple[CodeType, frozenset[Table]]:
+        ast = processor.env.parse(sql)
 
-    for node in ast.find_all(nodes.Call):
-        if isinstance(node.node, nodes.Getattr) and node.node.attr in (
-            "latest_partition",
-            "latest_sub_partition",
-        ):
-            # Try to extract the table referenced in the macro.
-            try:
-                tables.add(
-                    Table(
-                        *[
-                            remove_quotes(part.strip())
-                            for part in node.args[0].as_const().split(".")[::-1]
-                            if len(node.args) == 1
-                        ]
+        tables = set()
+
+        for node in ast.find_all(nodes.Call):
+            if isinstance(node.node, nodes.Getattr) and node.node.attr in (
+                "latest_partition",
+                "latest_sub_partition",
+            ):
+                # Try to extract the table referenced in the macro.
+                try:
+                    tables.add(
+                        Table(
+                            *[
+                                remove_quotes(part.strip())
+                                for part in node.args[0].as_const().split(".")[::-1]
+                                if len(node.args) == 1
+                            ]
+                        )
                     )
-                )
-            except nodes.Impossible:
-                pass
+                except nodes.Impossible:
+                    pass
+
+                # Replace the potentially problematic Jinja macro with some benign SQL.
+                node.__class__ = nodes.TemplateData
+                node.fields = nodes.TemplateData.fields
+                node.data = "NULL"
 
-            # Replace the potentially problematic Jinja macro with some benign SQL.
-            node.__class__ = nodes.TemplateData
-            node.fields = nodes.TemplateData.fields
-            node.data = "NULL"
+        return processor.env.compile(ast), frozenset(tables)
+
+    # the rewritten template is cached separately from the original one
+    code, macro_tables = get_compiled_template(
+        (processor.get_template_key(sql), "process_jinja_sql"),
+        compile_template,
+    )
+    tables = set(macro_tables)
 
     # re-render template back into a string
-    code = processor.env.compile(ast)
     template = Template.from_code(processor.env, code, globals=processor.env.globals)
     rendered_sql = template.render(processor.get_context(), **(template_params or {}))
 
@@ -282,7 +282,9 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                data = db_engine_spec.fetch_arrow(cursor, increased_limit)
+                if data is None:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -16,7 +16,7 @@
 # under the License.
 import logging
 from datetime import datetime
-from typing import Any, cast, Optional
+from typing import Any, cast, Iterator, Optional
 from urllib import parse
 
 from flask import current_app as app, request, Response
@@ -34,6 +34,10 @@ from superset.commands.sql_lab.results import SqlExecutionResultsCommand
 from superset.commands.sql_lab.streaming_export_command import (
     StreamingSqlResultExportCommand,
 )
+from superset.commands.streaming_export.base import (
+    compress_stream,
+    get_stream_content_encoding,
+)
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
 from superset.daos.database import DatabaseDAO
 from superset.daos.query import QueryDAO
@@ -400,8 +404,7 @@ class SqlLabRestApi(BaseSupersetApi):
     ) -> Response:
         """Create a streaming CSV response for large SQL Lab result sets."""
         # Execute streaming command
-        # TODO: Make chunk size configurable via SUPERSET_CONFIG
-        chunk_size = 1024
+        chunk_size = app.config["CSV_STREAMING_CHUNK_SIZE"]
         command = StreamingSqlResultExportCommand(client_id, chunk_size)
         command.validate()
 
@@ -415,15 +418,23 @@ class SqlLabRestApi(BaseSupersetApi):
         # Get encoding from config
         encoding = app.config.get("CSV_EXPORT", {}).get("encoding", "utf-8")
 
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+        csv_stream = csv_generator_callable()  # Call the callable to get generator
+        stream: Iterator[str] | Iterator[bytes] = csv_stream
+        if content_encoding := get_stream_content_encoding():
+            stream = compress_stream(csv_stream, content_encoding)
+            headers["Content-Encoding"] = content_encoding
+            headers["Vary"] = "Accept-Encoding"
+
         # Create response with streaming headers
         response = Response(
-            csv_generator_callable(),  # Call the callable to get generator
+            stream,
             mimetype=f"text/csv; charset={encoding}",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Cache-Control": "no-cache",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-            },
+            headers=headers,
             direct_passthrough=False,  # Flask must iterate generator
         )
 
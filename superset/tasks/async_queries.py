@@ -124,6 +124,38 @@ def load_chart_data_into_cache(
             raise
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    job_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+    lock_key: str,
+) -> None:
+    """
+    Re-run the queries of a chart data request whose results are stale in the cache.
+
+    :param job_metadata: The user the results belong to
+    :param form_data: The query context form data
+    :param lock_key: The data cache key preventing concurrent refreshes
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+    with override_user(_load_user_from_job_metadata(job_metadata), force=False):
+        try:
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(
+                {**form_data, "force": True}
+            )
+            command = ChartDataCommand(query_context)
+            command.validate()
+            command.run()
+        except SoftTimeLimitExceeded as ex:
+            logger.warning("A timeout occurred while refreshing chart data: %s", ex)
+            raise
+        finally:
+            cache_manager.data_cache.delete(lock_key)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
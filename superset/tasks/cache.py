@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, TypedDict, Union
+import time
+from collections import defaultdict
+from typing import Any, cast, Literal, Optional, TypedDict, Union
 from urllib import request
 from urllib.error import URLError
 
@@ -27,6 +29,7 @@ from flask import current_app
 from sqlalchemy import and_, func
 
 from superset import db, security_manager
+from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
 from superset.extensions import celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
@@ -35,6 +38,8 @@ from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.concurrency import map_in_app_context
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
@@ -278,6 +283,104 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+CacheWarmupOutcome = Literal["hits", "misses", "errors"]
+
+
+def warm_up_chart(task: CacheWarmupTask) -> CacheWarmupOutcome:
+    """
+    Run the queries of a chart in the worker, unless they're already cached.
+
+    Dashboard native filter defaults are applied to the queries, so that the cached
+    results match what the dashboard requests when it's first loaded. The task must
+    have an executor.
+    """
+    payload = task["payload"]
+    stats_logger = current_app.config["STATS_LOGGER"]
+    start = time.perf_counter()
+    outcome: CacheWarmupOutcome
+    try:
+        user = security_manager.get_user_by_username(cast(str, task["username"]))
+        with override_user(user):
+            command = ChartWarmUpCacheCommand(
+                payload["chart_id"],
+                payload.get("dashboard_id"),
+                None,
+                force=False,
+            )
+            result = command.run()
+        if result["viz_error"]:
+            logger.error(
+                "Error warming up cache for %s: %s", payload, result["viz_error"]
+            )
+            outcome = "errors"
+        else:
+            outcome = "hits" if command.is_cached else "misses"
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Error warming up cache for %s", payload)
+        outcome = "errors"
+
+    stats_logger.incr(f"cache_warmup.{outcome}")
+    stats_logger.timing("cache_warmup.time", time.perf_counter() - start)
+    return outcome
+
+
+def warm_up_charts(
+    tasks: list[CacheWarmupTask],
+) -> dict[CacheWarmupOutcome, list[CacheWarmupPayload]]:
+    """
+    Warm up the cache of charts in the worker, without going through the web tier.
+
+    Charts are grouped by database: `CACHE_WARMUP_MAX_DATABASES` databases are
+    warmed up at a time, each running up to `CACHE_WARMUP_MAX_WORKERS_PER_DATABASE`
+    charts concurrently, so that a database with many charts doesn't get overloaded
+    nor hold up the others.
+    """
+    chart_ids = {task["payload"]["chart_id"] for task in tasks}
+    database_ids = {
+        chart.id: chart.datasource.database_id if chart.datasource else None
+        for chart in db.session.query(Slice).filter(Slice.id.in_(chart_ids))
+    }
+    tasks_by_database: dict[int | None, list[CacheWarmupTask]] = defaultdict(list)
+    for task in tasks:
+        chart_id = task["payload"]["chart_id"]
+        tasks_by_database[database_ids.get(chart_id)].append(task)
+
+    max_workers = current_app.config["CACHE_WARMUP_MAX_WORKERS_PER_DATABASE"]
+
+    def warm_up_database(
+        database_tasks: list[CacheWarmupTask],
+    ) -> list[CacheWarmupOutcome]:
+        return map_in_app_context(warm_up_chart, database_tasks, max_workers)
+
+    start = time.perf_counter()
+    groups = list(tasks_by_database.values())
+    outcomes = map_in_app_context(
+        warm_up_database,
+        groups,
+        current_app.config["CACHE_WARMUP_MAX_DATABASES"],
+    )
+
+    results: dict[CacheWarmupOutcome, list[CacheWarmupPayload]] = {
+        "hits": [],
+        "misses": [],
+        "errors": [],
+    }
+    for database_tasks, database_outcomes in zip(groups, outcomes, strict=True):
+        for task, outcome in zip(database_tasks, database_outcomes, strict=True):
+            results[outcome].append(task["payload"])
+
+    logger.info(
+        "Warmed up %d charts in %d databases in %.2f s: %d hits, %d misses, %d errors",
+        len(tasks),
+        len(groups),
+        time.perf_counter() - start,
+        len(results["hits"]),
+        len(results["misses"]),
+        len(results["errors"]),
+    )
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -307,6 +410,18 @@ def cache_warmup(
         logger.exception(message)
         return message
 
+    if current_app.config["CACHE_WARMUP_IN_PROCESS"]:
+        tasks = []
+        for task in strategy.get_tasks():
+            if task["username"]:
+                tasks.append(task)
+            else:
+                logger.warning("Executor not found for %s", task["payload"])
+        return {
+            outcome: [json.dumps(payload) for payload in payloads]
+            for outcome, payloads in warm_up_charts(tasks).items()
+        }
+
     results: dict[str, list[str]] = {"scheduled": [], "errors": []}
     for task in strategy.get_tasks():
         username = task["username"]
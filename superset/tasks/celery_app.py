@@ -22,11 +22,12 @@ it needs to call create_app() in order to initialize things properly
 
 from typing import Any
 
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 
 # Superset framework imports
 from superset import create_app
 from superset.extensions import celery_app, db
+from superset.utils.browser_pool import close_expired_browsers, shutdown_browser_pools
 
 # Init the Flask app / configure everything
 flask_app = create_app()
@@ -47,6 +48,22 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
         db.engine.dispose()
 
 
+@worker_process_shutdown.connect
+def close_browsers(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    with flask_app.app_context():
+        shutdown_browser_pools()
+
+
+@task_postrun.connect
+def close_idle_browsers(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    """
+    Close the browsers that expired while the worker was idle, from the thread that
+    started them.
+    """
+    with flask_app.app_context():
+        close_expired_browsers()
+
+
 @task_postrun.connect
 def teardown(  # pylint: disable=unused-argument
     retval: Any,
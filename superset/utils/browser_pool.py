@@ -0,0 +1,294 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A pool of warm headless browsers for screenshots, thumbnails and reports.
+
+Starting a browser takes a few seconds, which used to be spent on every capture.
+When `WEBDRIVER_POOL["ENABLED"]` is set, browsers are kept running between captures
+and recycled after a number of captures, after some time, or when the browsers of
+the worker use too much memory.
+
+Pools are local to a thread, since the Playwright sync API can only be used from the
+thread that started it, and so are the checks closing idle browsers: they run when
+the thread uses its pools, and after each Celery task. The number of browsers in use
+at a time is capped for the whole process, but idle browsers are not: each thread
+keeps up to `MAX_POOL_SIZE` idle browsers per pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, TypeVar
+
+from flask import current_app as app
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+BrowserT = TypeVar("BrowserT")
+
+
+@dataclass
+class PooledBrowser(Generic[BrowserT]):
+    """A browser of the pool, with its metadata"""
+
+    browser: BrowserT
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    usage_count: int = 0
+
+
+def get_browsers_memory() -> int | None:
+    """
+    Return the memory used by the processes started by this worker, in bytes, or
+    None if it can't be measured.
+
+    Browsers are the only processes started by workers taking screenshots.
+    """
+    if psutil is None:
+        return None
+
+    memory = 0
+    for process in psutil.Process().children(recursive=True):
+        try:
+            memory += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return memory
+
+
+class BrowserPool(Generic[BrowserT]):
+    """
+    A pool of warm browsers.
+
+    Browsers are created on demand and handed out one capture at a time. A browser
+    is closed, rather than returned to the pool, when a capture fails, after
+    `max_usage_count` captures or `max_age_seconds`, and when the browsers of the
+    worker use more than `max_memory_mb`. Idle browsers are closed once they've
+    expired, eg, after `idle_timeout_seconds`, when a browser is taken from or given
+    back to the pool, or by `close_expired`. They're also checked before being handed
+    out when they've been idle for more than `health_check_interval` seconds.
+
+    The semaphore caps the number of browsers in use, shared by the pools of all the
+    threads, while each pool keeps up to `max_pool_size` idle browsers.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        create: Callable[[], BrowserT],
+        destroy: Callable[[BrowserT], None],
+        health_check: Callable[[BrowserT], bool],
+        semaphore: threading.BoundedSemaphore,
+        max_pool_size: int = 5,
+        max_age_seconds: int = 3600,
+        max_usage_count: int = 50,
+        idle_timeout_seconds: int = 300,
+        health_check_interval: int = 60,
+        max_memory_mb: int | None = None,
+    ):
+        self._create = create
+        self._destroy = destroy
+        self._health_check = health_check
+        self._semaphore = semaphore
+        self.max_pool_size = max_pool_size
+        self.max_age_seconds = max_age_seconds
+        self.max_usage_count = max_usage_count
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.health_check_interval = health_check_interval
+        self.max_memory_mb = max_memory_mb
+        self._idle: list[PooledBrowser[BrowserT]] = []
+
+    def _is_expired(self, pooled_browser: PooledBrowser[BrowserT]) -> bool:
+        now = time.time()
+        return (
+            pooled_browser.usage_count >= self.max_usage_count
+            or now - pooled_browser.created_at > self.max_age_seconds
+            or now - pooled_browser.last_used > self.idle_timeout_seconds
+        )
+
+    def _is_healthy(self, pooled_browser: PooledBrowser[BrowserT]) -> bool:
+        if time.time() - pooled_browser.last_used < self.health_check_interval:
+            return True
+        try:
+            return self._health_check(pooled_browser.browser)
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def _is_memory_exceeded(self) -> bool:
+        if self.max_memory_mb is None:
+            return False
+        memory = get_browsers_memory()
+        return memory is not None and memory > self.max_memory_mb * 2**20
+
+    def _close(self, pooled_browser: PooledBrowser[BrowserT], reason: str) -> None:
+        logger.debug(
+            "Closing browser after %i captures: %s", pooled_browser.usage_count, reason
+        )
+        app.config["STATS_LOGGER"].incr(f"browser_pool.{reason}")
+        try:
+            self._destroy(pooled_browser.browser)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Error closing browser", exc_info=True)
+
+    def close_expired(self) -> None:
+        """Close the idle browsers that have expired"""
+        for pooled_browser in [
+            pooled_browser
+            for pooled_browser in self._idle
+            if self._is_expired(pooled_browser)
+        ]:
+            self._idle.remove(pooled_browser)
+            self._close(pooled_browser, "expired")
+
+    def acquire(self) -> PooledBrowser[BrowserT]:
+        """
+        Take a browser from the pool, starting one if none is available.
+
+        Blocks while the maximum number of browsers are in use in the process. The
+        browser must be given back with `release`.
+        """
+        self._semaphore.acquire()  # pylint: disable=consider-using-with
+        try:
+            self.close_expired()
+            while self._idle:
+                pooled_browser = self._idle.pop()
+                if self._is_expired(pooled_browser):
+                    self._close(pooled_browser, "expired")
+                elif not self._is_healthy(pooled_browser):
+                    self._close(pooled_browser, "unhealthy")
+                else:
+                    app.config["STATS_LOGGER"].incr("browser_pool.reused")
+                    return pooled_browser
+
+            app.config["STATS_LOGGER"].incr("browser_pool.created")
+            return PooledBrowser(self._create())
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(
+        self,
+        pooled_browser: PooledBrowser[BrowserT],
+        healthy: bool = True,
+    ) -> None:
+        """
+        Give a browser back to the pool, or close it if it shouldn't be reused.
+        """
+        try:
+            self.close_expired()
+            pooled_browser.usage_count += 1
+            pooled_browser.last_used = time.time()
+            if not healthy:
+                self._close(pooled_browser, "failed")
+            elif self._is_expired(pooled_browser):
+                self._close(pooled_browser, "expired")
+            elif self._is_memory_exceeded():
+                self._close(pooled_browser, "memory_exceeded")
+            elif len(self._idle) >= self.max_pool_size:
+                self._close(pooled_browser, "pool_full")
+            else:
+                self._idle.append(pooled_browser)
+        finally:
+            self._semaphore.release()
+
+    @contextmanager
+    def get_browser(self) -> Iterator[PooledBrowser[BrowserT]]:
+        """
+        Context manager to get a browser from the pool; the browser is closed if
+        the block raises an exception.
+        """
+        pooled_browser = self.acquire()
+        try:
+            yield pooled_browser
+        except BaseException:
+            self.release(pooled_browser, healthy=False)
+            raise
+        self.release(pooled_browser)
+
+    def shutdown(self) -> None:
+        """Close the idle browsers"""
+        while self._idle:
+            self._close(self._idle.pop(), "shutdown")
+
+
+_local = threading.local()
+_semaphore: threading.BoundedSemaphore | None = None
+_semaphore_lock = threading.Lock()
+
+
+def _get_semaphore(max_pool_size: int) -> threading.BoundedSemaphore:
+    global _semaphore  # pylint: disable=global-statement
+
+    with _semaphore_lock:
+        if _semaphore is None:
+            _semaphore = threading.BoundedSemaphore(max_pool_size)
+    return _semaphore
+
+
+def get_browser_pool(
+    name: str,
+    create: Callable[[], BrowserT],
+    destroy: Callable[[BrowserT], None],
+    health_check: Callable[[BrowserT], bool],
+) -> BrowserPool[BrowserT] | None:
+    """
+    Return the pool of browsers of a given name for the current thread, or None if
+    browsers aren't pooled.
+    """
+    pool_config: dict[str, Any] = app.config.get("WEBDRIVER_POOL") or {}
+    if not pool_config.get("ENABLED"):
+        return None
+
+    pools: dict[str, BrowserPool[Any]] = _local.__dict__.setdefault("pools", {})
+    if name not in pools:
+        max_pool_size = pool_config.get("MAX_POOL_SIZE", 5)
+        pools[name] = BrowserPool(
+            create,
+            destroy,
+            health_check,
+            semaphore=_get_semaphore(max_pool_size),
+            max_pool_size=max_pool_size,
+            max_age_seconds=pool_config.get("MAX_AGE_SECONDS", 3600),
+            max_usage_count=pool_config.get("MAX_USAGE_COUNT", 50),
+            idle_timeout_seconds=pool_config.get("IDLE_TIMEOUT_SECONDS", 300),
+            health_check_interval=pool_config.get("HEALTH_CHECK_INTERVAL", 60),
+            max_memory_mb=pool_config.get("MAX_MEMORY_MB"),
+        )
+    return pools[name]
+
+
+def close_expired_browsers() -> None:
+    """Close the expired idle browsers of the pools of the current thread"""
+    pools: dict[str, BrowserPool[Any]] = _local.__dict__.get("pools", {})
+    for pool in pools.values():
+        pool.close_expired()
+
+
+def shutdown_browser_pools() -> None:
+    """Close the idle browsers of the pools of the current thread"""
+    pools: dict[str, BrowserPool[Any]] = _local.__dict__.pop("pools", {})
+    for pool in pools.values():
+        pool.shutdown()
@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+import sqlalchemy as sa
+from flask import (
+    copy_current_request_context,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm.state import InstanceState
+
+from superset.extensions import db
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def merge_in_session(value: T) -> T:
+    """
+    Return a copy of an ORM instance bound to the database session of the current
+    thread; other values are returned as is.
+
+    ORM instances belong to the session of the thread that loaded them, which can't be
+    used concurrently. The attributes already loaded are copied without querying the
+    database, unless the instance has pending changes, in which case it's read again.
+    """
+    state = sa.inspect(value, raiseerr=False)
+    if not isinstance(state, InstanceState) or not state.has_identity:
+        return value
+
+    try:
+        return db.session.merge(value, load=False)
+    except InvalidRequestError:
+        return db.session.get(type(value), state.identity)
+
+
+def map_in_app_context(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int,
+) -> list[R]:
+    """
+    Apply a function to each item, using a bounded pool of threads.
+
+    Threads don't inherit the Flask contexts, so each call runs in a copy of the
+    current request context (or in a new app context, eg, in Celery workers) with the
+    attributes of ``g`` copied over; these include the user, needed for row level
+    security and user impersonation. Each thread gets its own database session, and ORM
+    instances in ``g`` are copied to it with ``merge_in_session``; other ORM instances
+    used by ``func`` should be copied the same way.
+
+    Results are returned in the order of the items, and the first exception raised by
+    a call is re-raised once all calls are done.
+    """
+    if max_workers <= 1 or len(items) <= 1 or not has_app_context():
+        return [func(item) for item in items]
+
+    # pylint: disable=protected-access
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    captured_g: dict[str, Any] = g._get_current_object().__dict__.copy()
+
+    def wrap(item: T) -> Callable[[], R]:
+        def call() -> R:
+            with app.app_context():
+                for key, value in captured_g.items():
+                    setattr(g, key, merge_in_session(value))
+                return func(item)
+
+        # a request context can only be pushed in one thread at a time, so it's
+        # copied for each call
+        return copy_current_request_context(call) if has_request_context() else call
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(wrap(item)) for item in items]
+        return [future.result() for future in futures]
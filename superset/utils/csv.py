@@ -22,9 +22,10 @@ from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+from flask import current_app
 
 from superset.utils import json
-from superset.utils.core import GenericDataType
+from superset.utils.core import create_zip, GenericDataType
 
 logger = logging.getLogger(__name__)
 
@@ -98,19 +99,46 @@ def get_chart_csv_data(
     return None
 
 
+def get_chart_csv_content(queries: list[dict[str, Any]]) -> Optional[bytes]:
+    """
+    Encode the CSV data of the queries of a chart, as the chart data API returns
+    it: the CSV of a single query, or the CSV of each query bundled in a zip file.
+    """
+    if not queries or not queries[0]["data"]:
+        return None
+
+    encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+    if len(queries) == 1:
+        return queries[0]["data"].encode(encoding)
+
+    files = {
+        f"query_{idx + 1}.csv": query["data"].encode(encoding)
+        for idx, query in enumerate(queries)
+    }
+    return create_zip(files).getvalue()
+
+
 def get_chart_dataframe(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies)
     if content is None:
         return None
 
     result = json.loads(content.decode("utf-8"))
+    return build_chart_dataframe(result["result"][0])
+
+
+def build_chart_dataframe(query: dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Build a dataframe from the JSON data of a query of a chart, rebuilding its
+    temporal columns and its hierarchical columns and index.
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     if df.empty:
         return None
@@ -118,22 +146,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in query["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+        for indexname in query["indexnames"]
     )
     return df
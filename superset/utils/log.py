@@ -16,10 +16,15 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -28,6 +33,7 @@ from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
 from flask import g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset.extensions import stats_logger_manager
@@ -371,6 +377,37 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
+    @staticmethod
+    def get_log_values(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Return the values of the rows of the logs table for the records"""
+        values = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            values.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return values
+
     def log(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         user_id: int | None,
@@ -386,24 +423,18 @@ class DBEventLogger(AbstractEventLogger):
         from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+        logs = [
+            Log(**values)
+            for values in self.get_log_values(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
             )
-            logs.append(log)
+        ]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -423,6 +454,166 @@ class DBEventLogger(AbstractEventLogger):
                 )
 
 
+class QueuedDBEventLogger(DBEventLogger):
+    """
+    Event logger that inserts logs in Superset DB from a background thread.
+
+    Logs are queued in memory and inserted in batches of up to `batch_size` rows, on
+    a connection of their own, at least every `flush_interval` seconds, rather than
+    committed with the session of the request. When `max_queue_size` logs are
+    waiting, new logs are dropped after waiting up to `block_timeout` seconds for
+    the writer to catch up; they're counted in `dropped` and in the
+    `event_logger.dropped` metric. At exit, the process waits up to `exit_timeout`
+    seconds for the queued logs to be inserted.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        block_timeout: float = 0.0,
+        exit_timeout: float = 5.0,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.exit_timeout = exit_timeout
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(max_queue_size)
+        self._engine: Engine | None = None
+        self._pid: int | None = None
+
+    def _get_queue(self) -> queue.Queue[dict[str, Any]]:
+        """
+        Return the queue of the writer of the process, starting the writer if needed.
+
+        The writer is started on the first log of each process, since threads don't
+        survive the fork of web server workers.
+        """
+        if self._pid == os.getpid():
+            return self._queue
+
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._engine = db.engine
+                self._queue = queue.Queue(self.max_queue_size)
+                self._pid = os.getpid()
+                threading.Thread(
+                    target=self._write,
+                    args=(self._queue,),
+                    name="event-logger",
+                    daemon=True,
+                ).start()
+                atexit.register(self._flush_at_exit)
+        return self._queue
+
+    def _write(self, log_queue: queue.Queue[dict[str, Any]]) -> None:
+        while True:
+            batch = [log_queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(
+                        log_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    )
+                except queue.Empty:
+                    break
+
+            try:
+                self._insert(batch)
+            finally:
+                for _ in batch:
+                    log_queue.task_done()
+
+    def _insert(self, batch: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.models.core import Log
+
+        start = time.monotonic()
+        try:
+            with cast(Engine, self._engine).begin() as connection:
+                connection.execute(Log.__table__.insert(), batch)
+        except Exception:  # pylint: disable=broad-except
+            # Log errors but don't raise, so that the writer keeps running
+            logger.exception(
+                "QueuedDBEventLogger failed to log %i event(s)", len(batch)
+            )
+            stats_logger_manager.instance.incr("event_logger.failed")
+            return
+
+        stats_logger_manager.instance.timing(
+            "event_logger.insert", (time.monotonic() - start) * 1000
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the queued logs of the process to be inserted.
+
+        :param timeout: The maximum number of seconds to wait, or `None` to wait until
+            all the logs are inserted
+        :returns: Whether all the queued logs were inserted
+        """
+        if self._pid != os.getpid():
+            return True
+
+        log_queue = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with log_queue.all_tasks_done:
+            while log_queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                log_queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _flush_at_exit(self) -> None:
+        # Don't hang the exit of the process when the metadata database is unreachable
+        if not self.flush(self.exit_timeout):
+            logger.warning(
+                "QueuedDBEventLogger exited before logging %i event(s)",
+                self._queue.unfinished_tasks,
+            )
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        log_queue = self._get_queue()
+        dttm = datetime.utcnow()
+        for values in self.get_log_values(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        ):
+            try:
+                log_queue.put(
+                    {**values, "dttm": dttm},
+                    block=self.block_timeout > 0,
+                    timeout=self.block_timeout or None,
+                )
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+                stats_logger_manager.instance.incr("event_logger.dropped")
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -38,6 +38,7 @@ def contribution(
     time_shifts: list[str] | None = None,
     rename_columns: list[str] | None = None,
     contribution_totals: dict[str, float] | None = None,
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Calculate cell contribution to row/column total for numeric columns.
@@ -53,9 +54,10 @@ def contribution(
     :param rename_columns: The new labels for the calculated contribution columns.
                            The original columns will not be removed.
     :param orientation: calculate by dividing cell with row/column total
+    :param inplace: Whether to add the contributions to `df` instead of a copy.
     :return: DataFrame with contributions.
     """
-    contribution_df = df.copy()
+    contribution_df = df if inplace else df.copy()
     numeric_df = contribution_df.select_dtypes(include=["number", Decimal])
     numeric_df.fillna(0, inplace=True)
     # verify column selections
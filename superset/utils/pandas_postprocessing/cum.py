@@ -31,6 +31,7 @@ def cum(
     df: DataFrame,
     operator: str,
     columns: dict[str, str],
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Calculate cumulative sum/product/min/max for select columns.
@@ -42,6 +43,7 @@ def cum(
            `y2` based on cumulative values calculated from `y`, leaving the original
            column `y` unchanged.
     :param operator: cumulative operator, e.g. `sum`, `prod`, `min`, `max`
+    :param inplace: Whether to add the cumulated columns to `df` instead of a copy.
     :return: DataFrame with cumulated columns
     """
     columns = columns or {}
@@ -54,5 +56,10 @@ def cum(
         raise InvalidPostProcessingError(
             _("Invalid cumulative operator: %(operator)s", operator=operator)
         )
-    df_cum = _append_columns(df, getattr(df_cum, operation)(), columns)
+    df_cum = _append_columns(
+        df,
+        getattr(df_cum, operation)(),
+        columns,
+        inplace=inplace,
+    )
     return df_cum
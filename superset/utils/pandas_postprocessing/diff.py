@@ -30,6 +30,7 @@ def diff(
     columns: dict[str, str],
     periods: int = 1,
     axis: PandasAxis = PandasAxis.ROW,
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Calculate row-by-row or column-by-column difference for select columns.
@@ -42,9 +43,10 @@ def diff(
            unchanged.
     :param periods: periods to shift for calculating difference.
     :param axis: 0 for row, 1 for column. default 0.
+    :param inplace: Whether to add the diffed columns to `df` instead of a copy.
     :return: DataFrame with diffed columns
     :raises InvalidPostProcessingError: If the request in incorrect
     """
     df_diff = df[columns.keys()]
     df_diff = df_diff.diff(periods=periods, axis=axis)
-    return _append_columns(df, df_diff, columns)
+    return _append_columns(df, df_diff, columns, inplace=inplace)
@@ -0,0 +1,250 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Plan and run the post-processing operations of a query.
+
+Every operation is validated before the first one runs. Operations that accept an
+`inplace` option modify the result of the previous operation instead of copying it,
+once that result is no longer the dataframe returned by the query nor a view of
+another dataframe.
+
+Common sequences run as a single step: a `flatten` following a `pivot` modifies
+the pivot table, and a `rename` following a `rolling` is folded into the columns
+of the rolling window when it only renames the columns the window adds.
+"""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from flask_babel import gettext as _
+from pandas import DataFrame
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.extensions import event_logger
+from superset.utils import pandas_postprocessing
+
+# helpers exported alongside the operations
+HELPERS = frozenset({"escape_separator", "unescape_separator"})
+
+# operations whose result may share data with the dataframe they're given, which
+# therefore can't be modified in place by the next operation
+SHALLOW_OPERATIONS = frozenset({"select"})
+
+# options slicing the rows of the result, which is then a view of another dataframe
+SLICING_OPTIONS = {"rolling": "min_periods"}
+
+# sequences of operations run as a single step
+FUSED_OPERATIONS = frozenset({("pivot", "flatten"), ("rolling", "rename")})
+
+
+@dataclass
+class PostProcessingStep:
+    """
+    A validated post-processing operation.
+    """
+
+    operation: str
+    function: Callable[..., DataFrame]
+    options: dict[str, Any]
+
+    @property
+    def supports_inplace(self) -> bool:
+        return "inplace" in inspect.signature(self.function).parameters
+
+    @property
+    def returns_view(self) -> bool:
+        """
+        Whether the result may share data with another dataframe, and therefore
+        can't be modified in place by the next operation.
+        """
+        if self.operation in SHALLOW_OPERATIONS:
+            return True
+
+        option = SLICING_OPTIONS.get(self.operation)
+        return bool(option and self.options.get(option))
+
+    def run(self, df: DataFrame, inplace: bool) -> DataFrame:
+        options = self.options
+        if self.supports_inplace:
+            options = {**options, "inplace": inplace}
+
+        return self.function(df, **options)
+
+
+@dataclass
+class FusedPostProcessingStep:
+    """
+    Two operations run as one, the second one modifying the result of the first.
+    """
+
+    first: PostProcessingStep
+    second: PostProcessingStep
+
+    @property
+    def operation(self) -> str:
+        return f"{self.first.operation}+{self.second.operation}"
+
+    @property
+    def supports_inplace(self) -> bool:
+        return self.first.supports_inplace
+
+    @property
+    def returns_view(self) -> bool:
+        return self.first.returns_view or self.second.returns_view
+
+    def run(self, df: DataFrame, inplace: bool) -> DataFrame:
+        if folded := self.fold(df):
+            return folded.run(df, inplace)
+
+        result = self.first.run(df, inplace)
+        owned = (inplace or result is not df) and not self.first.returns_view
+        return self.second.run(result, inplace=owned)
+
+    def fold(self, df: DataFrame) -> PostProcessingStep | None:
+        """
+        Fold a `rename` into the columns of the `rolling` preceding it.
+
+        This only applies when the `rename` renames columns the rolling window adds
+        to `df`, to names that aren't taken, so that the window can be written
+        under its final names.
+
+        :param df: The dataframe given to the step
+        :returns: The `rolling` operation writing the renamed columns, if any
+        """
+        if (self.first.operation, self.second.operation) != ("rolling", "rename"):
+            return None
+
+        columns = self.first.options.get("columns") or {}
+        renames = self.second.options.get("columns") or {}
+        if not renames or self.second.options.get("level") is not None:
+            return None
+
+        targets = set(columns.values())
+        for old, new in renames.items():
+            if (
+                old not in targets
+                or old in df.columns
+                or not isinstance(new, str)
+                or new in targets
+                or new in df.columns
+            ):
+                return None
+
+        return PostProcessingStep(
+            self.first.operation,
+            self.first.function,
+            {
+                **self.first.options,
+                "columns": {
+                    source: renames.get(target, target)
+                    for source, target in columns.items()
+                },
+            },
+        )
+
+
+class PostProcessingPipeline:
+    """
+    Apply a chain of post-processing operations to a dataframe.
+    """
+
+    def __init__(
+        self, steps: list[PostProcessingStep | FusedPostProcessingStep]
+    ) -> None:
+        self.steps = steps
+
+    @classmethod
+    def from_post_processing(
+        cls,
+        post_processing: list[dict[str, Any]],
+    ) -> PostProcessingPipeline:
+        """
+        Validate the post-processing operations of a query.
+
+        :param post_processing: The post-processing operations and their options
+        :returns: The pipeline applying the operations
+        :raises InvalidPostProcessingError: If an operation is undefined or
+                 unsupported, or if its options don't match the operation
+        """
+        steps: list[PostProcessingStep | FusedPostProcessingStep] = []
+        for post_process in post_processing:
+            operation = post_process.get("operation")
+            if not operation:
+                raise InvalidPostProcessingError(
+                    _("`operation` property of post processing object undefined")
+                )
+            if operation not in pandas_postprocessing.__all__ or operation in HELPERS:
+                raise InvalidPostProcessingError(
+                    _(
+                        "Unsupported post processing operation: %(operation)s",
+                        operation=operation,
+                    )
+                )
+
+            function = getattr(pandas_postprocessing, operation)
+            options = post_process.get("options") or {}
+            try:
+                inspect.signature(function).bind(None, **options)
+            except TypeError as ex:
+                raise InvalidPostProcessingError(
+                    _(
+                        "Invalid options for %(operation)s: %(error)s",
+                        operation=operation,
+                        error=str(ex),
+                    )
+                ) from ex
+
+            step = PostProcessingStep(operation, function, options)
+            previous = steps[-1] if steps else None
+            if (
+                isinstance(previous, PostProcessingStep)
+                and (previous.operation, operation) in FUSED_OPERATIONS
+            ):
+                steps[-1] = FusedPostProcessingStep(previous, step)
+            else:
+                steps.append(step)
+
+        return cls(steps)
+
+    def run(self, df: DataFrame, action: str = "post_processing") -> DataFrame:
+        """
+        Apply the operations to a dataframe, which is never modified in place.
+
+        The duration of each operation is logged with the size of its result.
+
+        :param df: The dataframe returned by the query
+        :param action: The prefix of the logged actions
+        :returns: The post-processed dataframe
+        """
+        owned = False
+        for step in self.steps:
+            with event_logger.log_context(f"{action}.{step.operation}") as log:
+                result = step.run(df, inplace=owned)
+                log(
+                    inplace=owned and step.supports_inplace,
+                    rows=len(result),
+                    memory=int(result.memory_usage(deep=False).sum()),
+                )
+
+            if result is not df:
+                owned = not step.returns_view
+            df = result
+
+        return df
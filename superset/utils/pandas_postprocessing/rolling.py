@@ -37,6 +37,7 @@ def rolling(  # pylint: disable=too-many-arguments
     center: bool = False,
     win_type: Optional[str] = None,
     min_periods: Optional[int] = None,
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Apply a rolling window on the dataset. See the Pandas docs for further details:
@@ -56,6 +57,7 @@ def rolling(  # pylint: disable=too-many-arguments
     :param win_type: Type of window function.
     :param min_periods: The minimum amount of periods required for a row to be included
                         in the result set.
+    :param inplace: Whether to add the rolling columns to `df` instead of a copy.
     :return: DataFrame with the rolling columns
     :raises InvalidPostProcessingError: If the request in incorrect
     """
@@ -94,7 +96,7 @@ def rolling(  # pylint: disable=too-many-arguments
             )
         ) from ex
 
-    df_rolling = _append_columns(df, df_rolling, columns)
+    df_rolling = _append_columns(df, df_rolling, columns, inplace=inplace)
 
     if min_periods:
         df_rolling = df_rolling[min_periods - 1 :]
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 from collections.abc import Sequence
-from functools import partial
+from functools import partial, wraps
 from typing import Any, Callable
 
 import numpy as np
@@ -113,6 +113,7 @@ def scalar_to_sequence(val: Any) -> Sequence[str]:
 
 def validate_column_args(*argnames: str) -> Callable[..., Any]:
     def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
         def wrapped(df: DataFrame, **options: Any) -> Any:
             if _is_multi_index_on_columns(df):
                 # MultiIndex column validate first level
@@ -182,7 +183,10 @@ def _get_aggregate_funcs(
 
 
 def _append_columns(
-    base_df: DataFrame, append_df: DataFrame, columns: dict[str, str]
+    base_df: DataFrame,
+    append_df: DataFrame,
+    columns: dict[str, str],
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Function for adding columns from one DataFrame to another DataFrame. Calls the
@@ -199,13 +203,19 @@ def _append_columns(
            while `{'y': 'y2'}` will add a column `y2` to `base_df` based
            on values in column `y` in `append_df`, leaving the original column `y`
            in `base_df` unchanged.
-    :return: new DataFrame with combined data from `base_df` and `append_df`
+    :param inplace: Whether to add the columns to `base_df` instead of a new DataFrame.
+    :return: new DataFrame with combined data from `base_df` and `append_df`, or
+             `base_df` if `inplace`
     """
     if all(key == value for key, value in columns.items()):
-        # make sure to return a new DataFrame instead of changing the `base_df`.
-        _base_df = base_df.copy()
+        # unless `inplace`, return a new DataFrame instead of changing the `base_df`.
+        _base_df = base_df if inplace else base_df.copy()
         _base_df.loc[:, columns.keys()] = append_df
         return _base_df
+    if inplace and all(value not in base_df.columns for value in columns.values()):
+        for key, value in columns.items():
+            base_df[value] = append_df[key]
+        return base_df
     append_df = append_df.rename(columns=columns)
     return pd.concat([base_df, append_df], axis="columns")
 
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import base64
 import logging
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from enum import Enum
 from io import BytesIO
@@ -33,8 +34,8 @@ from superset.utils.urls import modify_url_query
 from superset.utils.webdriver import (
     ChartStandaloneMode,
     DashboardStandaloneMode,
-    WebDriver,
     WebDriverPlaywright,
+    WebDriverProxy,
     WebDriverSelenium,
     WindowSize,
 )
@@ -188,7 +189,7 @@ class BaseScreenshot:
         self.url = url
         self.screenshot = None
 
-    def driver(self, window_size: WindowSize | None = None) -> WebDriver:
+    def driver(self, window_size: WindowSize | None = None) -> WebDriverProxy:
         window_size = window_size or self.window_size
         if feature_flag_manager.is_feature_enabled("PLAYWRIGHT_REPORTS_AND_THUMBNAILS"):
             # Try to use Playwright if available (supports WebGL/DeckGL, unlike Cypress)
@@ -213,6 +214,30 @@ class BaseScreenshot:
         self.screenshot = driver.get_screenshot(self.url, self.element, user)
         return self.screenshot
 
+    @staticmethod
+    def get_screenshots(
+        screenshots: Sequence[BaseScreenshot], user: User
+    ) -> Iterator[bytes | None]:
+        """
+        Take several screenshots of the same kind and window size, eg, of the tabs
+        of a dashboard, yielding each one as soon as it's taken.
+
+        Several screenshots are taken in a single browser session, which renders
+        them concurrently when the webdriver supports it.
+        """
+        if len(screenshots) <= 1:
+            for screenshot in screenshots:
+                yield screenshot.get_screenshot(user=user)
+            return
+
+        first = screenshots[0]
+        images = first.driver().get_screenshots(
+            [screenshot.url for screenshot in screenshots], first.element, user
+        )
+        for screenshot, image in zip(screenshots, images, strict=True):
+            screenshot.screenshot = image
+            yield image
+
     def get_cache_key(
         self,
         window_size: bool | WindowSize | None = None,
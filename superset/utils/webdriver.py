@@ -19,8 +19,12 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, TYPE_CHECKING
 
 from flask import current_app as app
@@ -39,6 +43,11 @@ from selenium.webdriver.support import expected_conditions as EC  # noqa: N812
 from selenium.webdriver.support.ui import WebDriverWait
 
 from superset.extensions import machine_auth_provider_factory
+from superset.utils.browser_pool import (
+    BrowserPool,
+    get_browser_pool,
+    PooledBrowser,
+)
 from superset.utils.retries import retry_call
 from superset.utils.screenshot_utils import take_tiled_screenshot
 
@@ -59,10 +68,12 @@ if TYPE_CHECKING:
 
 try:
     from playwright.sync_api import (
+        Browser,
         BrowserContext,
         Error as PlaywrightError,
         Locator,
         Page,
+        Playwright,
         sync_playwright,
         TimeoutError as PlaywrightTimeout,
     )
@@ -70,7 +81,9 @@ except ImportError:
     from typing import Any
 
     # Define dummy classes when playwright is not available
+    Browser = Any
     BrowserContext = Any
+    Playwright = Any
     PlaywrightError = Exception
     PlaywrightTimeout = Exception
     Locator = Any
@@ -164,8 +177,77 @@ class WebDriverProxy(ABC):
         Run webdriver and return a screenshot
         """
 
+    def get_screenshots(
+        self, urls: list[str], element_name: str, user: User
+    ) -> Iterator[bytes | None]:
+        """
+        Run webdriver and yield the screenshots of several urls, in order
+        """
+        for url in urls:
+            yield self.get_screenshot(url, element_name, user)
+
+
+@dataclass
+class PlaywrightBrowser:
+    """
+    A pooled Chromium browser, with the Playwright driver that launched it; a
+    Playwright driver is started for each pooled browser, since the sync API can't
+    start a driver in a thread where one is already running.
+    """
+
+    playwright: Playwright
+    browser: Browser
+
+    @classmethod
+    def launch(cls) -> PlaywrightBrowser:
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(
+                args=app.config["WEBDRIVER_OPTION_ARGS"]
+            )
+        except BaseException:
+            playwright.stop()
+            raise
+        return cls(playwright, browser)
+
+    def close(self) -> None:
+        try:
+            self.browser.close()
+        finally:
+            self.playwright.stop()
+
+    def is_connected(self) -> bool:
+        return self.browser.is_connected()
+
 
 class WebDriverPlaywright(WebDriverProxy):
+    @staticmethod
+    @contextmanager
+    def get_browser() -> Iterator[Browser]:
+        """
+        Context manager to get a browser, from the pool if browsers are pooled or
+        launched for the block otherwise.
+        """
+        pool = get_browser_pool(
+            "playwright",
+            create=PlaywrightBrowser.launch,
+            destroy=PlaywrightBrowser.close,
+            health_check=PlaywrightBrowser.is_connected,
+        )
+        if pool:
+            with pool.get_browser() as pooled_browser:
+                yield pooled_browser.browser.browser
+            return
+
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(
+                args=app.config["WEBDRIVER_OPTION_ARGS"]
+            )
+            try:
+                yield browser
+            finally:
+                browser.close()
+
     @staticmethod
     def auth(user: User, context: BrowserContext) -> BrowserContext:
         return machine_auth_provider_factory.instance.authenticate_browser_context(
@@ -223,9 +305,17 @@ class WebDriverPlaywright(WebDriverProxy):
         else:
             return element.screenshot()
 
-    def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
-        self, url: str, element_name: str, user: User
-    ) -> bytes | None:
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        return list(self.get_screenshots([url], element_name, user))[0]
+
+    def get_screenshots(
+        self, urls: list[str], element_name: str, user: User
+    ) -> Iterator[bytes | None]:
+        """
+        Take the screenshots of several urls in a single browser context, rendering
+        up to SCREENSHOT_PLAYWRIGHT_MAX_PAGES pages concurrently; screenshots are
+        yielded in the order of the urls, as soon as each one is taken.
+        """
         if not PLAYWRIGHT_AVAILABLE:
             logger.info(
                 "Playwright not available - falling back to Selenium. "
@@ -233,19 +323,16 @@ class WebDriverPlaywright(WebDriverProxy):
                 "%s",
                 PLAYWRIGHT_INSTALL_MESSAGE,
             )
-            return None
+            yield from (None for _ in urls)
+            return
 
-        with sync_playwright() as playwright:
-            browser_args = app.config["WEBDRIVER_OPTION_ARGS"]
-            browser = playwright.chromium.launch(args=browser_args)
+        with self.get_browser() as browser:
             pixel_density = app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
-            viewport_height = self._window[1]
-            viewport_width = self._window[0]
             context = browser.new_context(
                 bypass_csp=True,
                 viewport={
-                    "height": viewport_height,
-                    "width": viewport_width,
+                    "height": self._window[1],
+                    "width": self._window[0],
                 },
                 device_scale_factor=pixel_density,
             )
@@ -253,131 +340,151 @@ class WebDriverPlaywright(WebDriverProxy):
                 app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
             )
             self.auth(user, context)
-            page = context.new_page()
+            max_pages = max(app.config.get("SCREENSHOT_PLAYWRIGHT_MAX_PAGES", 1), 1)
+            pages: deque[tuple[str, Page, float]] = deque()
             try:
-                page.goto(
-                    url,
-                    wait_until=app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                for url in urls:
+                    pages.append((url, self._open_page(context, url), monotonic()))
+                    if len(pages) >= max_pages:
+                        yield self._take_screenshot(
+                            *pages.popleft(), element_name, user
+                        )
+                while pages:
+                    yield self._take_screenshot(*pages.popleft(), element_name, user)
+            finally:
+                # contexts are isolated, so that a pooled browser can be reused by
+                # other users
+                context.close()
+
+    @staticmethod
+    def _open_page(context: BrowserContext, url: str) -> Page:
+        page = context.new_page()
+        try:
+            page.goto(
+                url,
+                wait_until=app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+            )
+        except PlaywrightTimeout:
+            logger.exception(
+                "Web event %s not detected. Page %s might not have been fully loaded",
+                app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                url,
+            )
+        return page
+
+    def _take_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
+        self,
+        url: str,
+        page: Page,
+        opened_at: float,
+        element_name: str,
+        user: User,
+    ) -> bytes | None:
+        img: bytes | None = None
+        viewport_width, viewport_height = self._window
+        # pages opened ahead have already been rendering for a while
+        selenium_headstart = max(
+            app.config["SCREENSHOT_SELENIUM_HEADSTART"] - (monotonic() - opened_at),
+            0,
+        )
+        logger.debug("Sleeping for %.2f seconds", selenium_headstart)
+        page.wait_for_timeout(selenium_headstart * 1000)
+        element: Locator
+        try:
+            try:
+                # page didn't load
+                logger.debug(
+                    "Wait for the presence of %s at url: %s", element_name, url
                 )
+                element = page.locator(f".{element_name}")
+                element.wait_for()
+            except PlaywrightTimeout:
+                logger.exception("Timed out requesting url %s", url)
+                raise
+
+            try:
+                # chart containers didn't render
+                logger.debug("Wait for chart containers to draw at url: %s", url)
+                slice_container_locator = page.locator(".chart-container")
+                for slice_container_elem in slice_container_locator.all():
+                    slice_container_elem.wait_for()
             except PlaywrightTimeout:
                 logger.exception(
-                    "Web event %s not detected. Page %s might not have been fully loaded",  # noqa: E501
-                    app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                    "Timed out waiting for chart containers to draw at url %s",
                     url,
                 )
-
-            img: bytes | None = None
-            selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-            logger.debug("Sleeping for %i seconds", selenium_headstart)
-            page.wait_for_timeout(selenium_headstart * 1000)
-            element: Locator
+                raise
             try:
-                try:
-                    # page didn't load
-                    logger.debug(
-                        "Wait for the presence of %s at url: %s", element_name, url
-                    )
-                    element = page.locator(f".{element_name}")
-                    element.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception("Timed out requesting url %s", url)
-                    raise
+                # charts took too long to load
+                logger.debug(
+                    "Wait for loading element of charts to be gone at url: %s", url
+                )
+                for loading_element in page.locator(".loading").all():
+                    loading_element.wait_for(state="detached")
+            except PlaywrightTimeout:
+                logger.exception("Timed out waiting for charts to load at url %s", url)
+                raise
 
-                try:
-                    # chart containers didn't render
-                    logger.debug("Wait for chart containers to draw at url: %s", url)
-                    slice_container_locator = page.locator(".chart-container")
-                    for slice_container_elem in slice_container_locator.all():
-                        slice_container_elem.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception(
-                        "Timed out waiting for chart containers to draw at url %s",
+            selenium_animation_wait = app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"]
+            logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
+            page.wait_for_timeout(selenium_animation_wait * 1000)
+            logger.debug(
+                "Taking a PNG screenshot of url %s as user %s",
+                url,
+                user.username,
+            )
+            if app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
+                unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
+                if unexpected_errors:
+                    logger.warning(
+                        "%i errors found in the screenshot. URL: %s. Errors are: %s",  # noqa: E501
+                        len(unexpected_errors),
                         url,
+                        unexpected_errors,
                     )
-                    raise
-                try:
-                    # charts took too long to load
-                    logger.debug(
-                        "Wait for loading element of charts to be gone at url: %s", url
-                    )
-                    for loading_element in page.locator(".loading").all():
-                        loading_element.wait_for(state="detached")
-                except PlaywrightTimeout:
-                    logger.exception(
-                        "Timed out waiting for charts to load at url %s", url
-                    )
-                    raise
+            # Detect large dashboards and use tiled screenshots if enabled
+            tiled_enabled = app.config.get("SCREENSHOT_TILED_ENABLED", False)
 
-                selenium_animation_wait = app.config[
-                    "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
-                ]
-                logger.debug(
-                    "Wait %i seconds for chart animation", selenium_animation_wait
+            if tiled_enabled:
+                chart_count = page.evaluate(
+                    'document.querySelectorAll(".chart-container").length'
                 )
-                page.wait_for_timeout(selenium_animation_wait * 1000)
-                logger.debug(
-                    "Taking a PNG screenshot of url %s as user %s",
-                    url,
-                    user.username,
+                dashboard_height = page.evaluate(
+                    f'document.querySelector(".{element_name}").scrollHeight || 0'
+                )
+                chart_threshold = app.config.get("SCREENSHOT_TILED_CHART_THRESHOLD", 20)
+                height_threshold = app.config.get(
+                    "SCREENSHOT_TILED_HEIGHT_THRESHOLD", 5000
+                )
+                tile_height = app.config.get(
+                    "SCREENSHOT_TILED_VIEWPORT_HEIGHT", viewport_height
                 )
-                if app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
-                    unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
-                    if unexpected_errors:
-                        logger.warning(
-                            "%i errors found in the screenshot. URL: %s. Errors are: %s",  # noqa: E501
-                            len(unexpected_errors),
-                            url,
-                            unexpected_errors,
-                        )
-                # Detect large dashboards and use tiled screenshots if enabled
-                tiled_enabled = app.config.get("SCREENSHOT_TILED_ENABLED", False)
 
-                if tiled_enabled:
-                    chart_count = page.evaluate(
-                        'document.querySelectorAll(".chart-container").length'
-                    )
-                    dashboard_height = page.evaluate(
-                        f'document.querySelector(".{element_name}").scrollHeight || 0'
-                    )
-                    chart_threshold = app.config.get(
-                        "SCREENSHOT_TILED_CHART_THRESHOLD", 20
+                # Use tiled screenshots for large dashboards
+                use_tiled = (
+                    chart_count >= chart_threshold
+                    or dashboard_height > height_threshold
+                ) and dashboard_height > tile_height
+
+                if use_tiled:
+                    logger.info(
+                        "Large dashboard detected: %s charts, %spx height. "
+                        "Using tiled screenshots.",
+                        chart_count,
+                        dashboard_height,
                     )
-                    height_threshold = app.config.get(
-                        "SCREENSHOT_TILED_HEIGHT_THRESHOLD", 5000
+                    # set viewport height to tile height for easier calculations
+                    page.set_viewport_size(
+                        {"height": tile_height, "width": viewport_width}
                     )
-                    tile_height = app.config.get(
-                        "SCREENSHOT_TILED_VIEWPORT_HEIGHT", viewport_height
-                    )
-
-                    # Use tiled screenshots for large dashboards
-                    use_tiled = (
-                        chart_count >= chart_threshold
-                        or dashboard_height > height_threshold
-                    ) and dashboard_height > tile_height
-
-                    if use_tiled:
-                        logger.info(
-                            "Large dashboard detected: %s charts, %spx height. "
-                            "Using tiled screenshots.",
-                            chart_count,
-                            dashboard_height,
-                        )
-                        # set viewport height to tile height for easier calculations
-                        page.set_viewport_size(
-                            {"height": tile_height, "width": viewport_width}
-                        )
-                        img = take_tiled_screenshot(page, element_name, tile_height)
-                        if img is None:
-                            logger.warning(
-                                (
-                                    "Tiled screenshot failed, "
-                                    "falling back to standard screenshot"
-                                )
-                            )
-                            img = WebDriverPlaywright._get_screenshot(
-                                page, element, element_name
+                    img = take_tiled_screenshot(page, element_name, tile_height)
+                    if img is None:
+                        logger.warning(
+                            (
+                                "Tiled screenshot failed, "
+                                "falling back to standard screenshot"
                             )
-                    else:
+                        )
                         img = WebDriverPlaywright._get_screenshot(
                             page, element, element_name
                         )
@@ -385,17 +492,19 @@ class WebDriverPlaywright(WebDriverProxy):
                     img = WebDriverPlaywright._get_screenshot(
                         page, element, element_name
                     )
+            else:
+                img = WebDriverPlaywright._get_screenshot(page, element, element_name)
 
-            except PlaywrightTimeout:
-                # raise again for the finally block, but handled above
-                pass
-            except PlaywrightError:
-                logger.exception(
-                    "Encountered an unexpected error when requesting url %s", url
-                )
-            finally:
-                browser.close()
-            return img
+        except PlaywrightTimeout:
+            # raise again for the finally block, but handled above
+            pass
+        except PlaywrightError:
+            logger.exception(
+                "Encountered an unexpected error when requesting url %s", url
+            )
+        finally:
+            page.close()
+        return img
 
 
 class WebDriverSelenium(WebDriverProxy):
@@ -522,6 +631,56 @@ class WebDriverSelenium(WebDriverProxy):
             driver, user
         )
 
+    def get_pool(self) -> BrowserPool[WebDriver] | None:
+        return get_browser_pool(
+            f"selenium.{self._driver_type}",
+            create=self.create,
+            destroy=self.destroy,
+            health_check=WebDriverSelenium.is_healthy,
+        )
+
+    def acquire(self, user: User) -> tuple[WebDriver, PooledBrowser[WebDriver] | None]:
+        """
+        Return a driver authenticated as the user, taken from the pool if drivers
+        are pooled, along with its pool entry.
+        """
+        pool = self.get_pool()
+        if not pool:
+            return self.auth(user), None
+
+        pooled_driver = pool.acquire()
+        try:
+            driver = pooled_driver.browser
+            if pooled_driver.usage_count:
+                # don't leak the session of the previous user
+                driver.delete_all_cookies()
+            machine_auth_provider_factory.instance.authenticate_webdriver(driver, user)
+        except BaseException:
+            pool.release(pooled_driver, healthy=False)
+            raise
+        return driver, pooled_driver
+
+    def release(
+        self,
+        driver: WebDriver,
+        pooled_driver: PooledBrowser[WebDriver] | None,
+        healthy: bool,
+    ) -> None:
+        """Give a driver back to the pool, or destroy it if it isn't pooled"""
+        pool = self.get_pool()
+        if pool and pooled_driver:
+            pool.release(pooled_driver, healthy=healthy)
+        else:
+            self.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        try:
+            _ = driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
     @staticmethod
     def destroy(driver: WebDriver, tries: int = 2) -> None:
         """Destroy a driver"""
@@ -593,15 +752,16 @@ class WebDriverSelenium(WebDriverProxy):
         return error_messages
 
     def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:  # noqa: C901
-        driver = self.auth(user)
-        driver.set_window_size(*self._window)
-        driver.get(url)
+        driver, pooled_driver = self.acquire(user)
         img: bytes | None = None
-        selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-        logger.debug("Sleeping for %i seconds", selenium_headstart)
-        sleep(selenium_headstart)
 
         try:
+            driver.set_window_size(*self._window)
+            driver.get(url)
+            selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+            logger.debug("Sleeping for %i seconds", selenium_headstart)
+            sleep(selenium_headstart)
+
             try:
                 # page didn't load
                 logger.debug(
@@ -690,5 +850,5 @@ class WebDriverSelenium(WebDriverProxy):
             )
             raise
         finally:
-            self.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+            self.release(driver, pooled_driver, healthy=img is not None)
         return img
@@ -104,6 +104,14 @@ class SamplesRequestSchema(Schema):
         load_default=None,
     )
     dashboard_id = fields.Integer(required=False, allow_none=True, load_default=None)
+    cursor = fields.String(
+        allow_none=True,
+        load_default=None,
+        metadata={
+            "description": "Paginate with cursors instead of offsets: pass an empty "
+            "cursor for the first page, then the `next_cursor` of the previous page."
+        },
+    )
 
     @pre_load
     def set_default_per_page(
@@ -14,18 +14,27 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import base64
+import binascii
 import logging
-from typing import Any, Iterable, Optional
+from datetime import date, datetime
+from typing import Any, cast, Iterable, Optional
 
+import pandas as pd
 from flask import current_app as app
 
 from superset.commands.dataset.exceptions import DatasetSamplesFailedError
 from superset.common.chart_data import ChartDataResultType
+from superset.common.query_context import QueryContext
 from superset.common.query_context_factory import QueryContextFactory
 from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.constants import CacheRegion
 from superset.daos.datasource import DatasourceDAO
-from superset.utils.core import QueryStatus
+from superset.extensions import cache_manager
+from superset.sql.parse import Table
+from superset.utils import json
+from superset.utils.cache import memoized_func
+from superset.utils.core import FilterOperator, QueryStatus
 from superset.views.datasource.schemas import SamplesPayloadSchema
 
 logger = logging.getLogger(__name__)
@@ -47,6 +56,238 @@ def get_limit_clause(page: Optional[int], per_page: Optional[int]) -> dict[str,
     return {"row_offset": offset, "row_limit": limit}
 
 
+def to_cursor_value(value: Any) -> Any:
+    """
+    Convert a value of a key column to its form in a cursor, and in the filters of
+    the next page. Timestamps are converted to ISO 8601 strings rather than epoch
+    milliseconds, so that their microseconds are kept and rows aren't skipped or
+    repeated.
+    """
+    if isinstance(value, datetime):
+        return None if pd.isna(value) else value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return json.loads(json.dumps(value, default=json.json_int_dttm_ser))
+
+
+def encode_cursor(values: Optional[list[Any]], offset: int) -> str:
+    """
+    Encode the position after a page of samples as an opaque cursor.
+
+    :param values: The values of the key columns in the last row of the page, if the
+        rows are ordered by a unique key
+    :param offset: The number of rows returned so far
+    :returns: The cursor of the next page
+    """
+    cursor = json.dumps({"values": values, "offset": offset})
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decode a cursor returned with a page of samples; an empty cursor is the start.
+
+    :raises DatasetSamplesFailedError: If the cursor is invalid
+    """
+    if not cursor:
+        return {"values": None, "offset": 0}
+
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        values = position["values"]
+        if values is not None and not isinstance(values, list):
+            raise TypeError("Invalid cursor values")
+        return {"values": values, "offset": max(int(position["offset"]), 0)}
+    except (
+        binascii.Error,
+        json.JSONDecodeError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as ex:
+        raise DatasetSamplesFailedError("Invalid cursor") from ex
+
+
+@memoized_func(
+    key="db:{database.id}:catalog:{table.catalog}:schema:{table.schema}"
+    ":table:{table.table}:pk_columns",
+    cache=cache_manager.cache,
+)
+def get_pk_columns(database: Any, table: Table) -> list[str]:
+    """
+    Return the primary key columns of a table, which are cached since they're needed
+    for every page of samples.
+    """
+    pk_constraint = database.get_pk_constraint(table)
+    return pk_constraint.get("constrained_columns") or []
+
+
+def get_key_columns(datasource: Any) -> Optional[list[str]]:
+    """
+    Return the columns rows are ordered by when paginating with a cursor: the first
+    column of the dataset, then the primary key of its table, which makes the order
+    unique. Virtual datasets and tables without a primary key have no unique order.
+
+    :raises DatasetSamplesFailedError: If the dataset has no columns
+    """
+    columns = [
+        column.get("column_name", "")
+        if isinstance(column, dict)
+        else column.column_name
+        for column in datasource.columns
+    ]
+    if not columns:
+        raise DatasetSamplesFailedError()
+
+    if getattr(datasource, "is_virtual", True):
+        return None
+
+    try:
+        pk_columns = get_pk_columns(
+            datasource.database,
+            Table(datasource.table_name, datasource.schema, datasource.catalog),
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to get the primary key of %s", datasource.table_name)
+        return None
+
+    if not pk_columns or any(column not in columns for column in pk_columns):
+        return None
+
+    return [columns[0], *(column for column in pk_columns if column != columns[0])]
+
+
+def get_keyset_clauses(
+    key_columns: Optional[list[str]],
+    position: dict[str, Any],
+    per_page: int,
+) -> list[dict[str, Any]]:
+    """
+    Return the limit, order and filters of the queries for the page after a position,
+    in the order their rows are returned.
+
+    Rows are ordered by their key columns, and the page starts after the key of the
+    last row of the previous page. Since filters can't be ORed, rows with a greater
+    key are split into ranges: eg, after ``(a, b) = (1, 2)``, the rows where
+    ``a = 1 AND b > 2``, then the ones where ``a > 1``. Rows whose first column is NULL
+    can't be compared, so they're returned last, in their own range, whatever the
+    NULL ordering of the database. Without a unique key, the page starts at the
+    offset of the position instead.
+
+    :raises DatasetSamplesFailedError: If the cursor doesn't match the key columns
+    """
+    limit_clause = get_limit_clause(1, per_page)
+    values = position["values"]
+    if key_columns is None:
+        if values is not None:
+            raise DatasetSamplesFailedError("Invalid cursor")
+        return [{**limit_clause, "row_offset": position["offset"], "filters": []}]
+    if values is not None and len(values) != len(key_columns):
+        raise DatasetSamplesFailedError("Invalid cursor")
+
+    order_column = key_columns[0]
+    is_null = {"col": order_column, "op": FilterOperator.IS_NULL}
+    ranges: list[list[dict[str, Any]]] = []
+    if values is None:
+        ranges.append([{"col": order_column, "op": FilterOperator.IS_NOT_NULL}])
+    else:
+        prefix = (
+            is_null
+            if values[0] is None
+            else {"col": order_column, "op": FilterOperator.EQUALS, "val": values[0]}
+        )
+        for index in reversed(range(1, len(key_columns))):
+            ranges.append(
+                [
+                    prefix,
+                    *(
+                        {
+                            "col": key_columns[previous],
+                            "op": FilterOperator.EQUALS,
+                            "val": values[previous],
+                        }
+                        for previous in range(1, index)
+                    ),
+                    {
+                        "col": key_columns[index],
+                        "op": FilterOperator.GREATER_THAN,
+                        "val": values[index],
+                    },
+                ]
+            )
+        if values[0] is not None:
+            ranges.append(
+                [
+                    {
+                        "col": order_column,
+                        "op": FilterOperator.GREATER_THAN,
+                        "val": values[0],
+                    }
+                ]
+            )
+    if values is None or values[0] is not None:
+        ranges.append([is_null])
+
+    orderby = [(column, True) for column in key_columns]
+    return [
+        {**limit_clause, "orderby": orderby, "filters": filters} for filters in ranges
+    ]
+
+
+def paginate_samples(
+    sample_data: dict[str, Any],
+    key_columns: Optional[list[str]],
+    position: dict[str, Any],
+    per_page: int,
+) -> None:
+    """
+    Truncate the rows to a page, and add the cursor of the next page, if any.
+    """
+    rows = sample_data["data"] = sample_data["data"][:per_page]
+    sample_data["rowcount"] = len(rows)
+    sample_data["next_cursor"] = None
+    if len(rows) < per_page:
+        return
+
+    values = (
+        [to_cursor_value(rows[-1].get(column)) for column in key_columns]
+        if key_columns
+        else None
+    )
+    sample_data["next_cursor"] = encode_cursor(values, position["offset"] + len(rows))
+
+
+def get_sample_data(
+    samples_instances: list[QueryContext],
+    key_columns: Optional[list[str]],
+    position: Optional[dict[str, Any]],
+    per_page: int,
+) -> dict[str, Any]:
+    """
+    Return the samples, or with a cursor, the page of rows after the position: the
+    ranges of rows after it are queried in order until the page is full. The payload
+    of a failed query is returned as is.
+    """
+    if position is None:
+        return samples_instances[0].get_payload()["queries"][0]
+
+    sample_data: dict[str, Any] = {}
+    rows: list[Any] = []
+    for samples_instance in samples_instances:
+        range_data = samples_instance.get_payload()["queries"][0]
+        if range_data.get("status") == QueryStatus.FAILED:
+            return range_data
+
+        sample_data = sample_data or range_data
+        rows.extend(range_data["data"])
+        if len(rows) >= per_page:
+            break
+
+    sample_data["data"] = rows
+    paginate_samples(sample_data, key_columns, position, per_page)
+    return sample_data
+
+
 def replace_verbose_with_column(
     filters: list[dict[str, Any]],
     columns: Iterable[Any],
@@ -95,42 +336,68 @@ def get_samples(  # pylint: disable=too-many-arguments
     page: int = 1,
     per_page: int = 1000,
     payload: Optional[SamplesPayloadSchema] = None,
+    cursor: Optional[str] = None,
 ) -> dict[str, Any]:
     datasource = DatasourceDAO.get_datasource(
         datasource_type=datasource_type,
         database_id_or_uuid=str(datasource_id),
     )
 
-    limit_clause = get_limit_clause(page, per_page)
+    limit_clause: dict[str, Any] = get_limit_clause(page, per_page)
+    query: dict[str, Any] = cast(dict[str, Any], payload or {})
+
+    # with a cursor, pages start where the previous one ended instead of at an offset
+    position: Optional[dict[str, Any]] = None
+    key_columns: Optional[list[str]] = None
+    clauses = [limit_clause]
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        key_columns = get_key_columns(datasource)
+        clauses = [
+            {
+                **clause,
+                "filters": [*(query.get("filters") or []), *clause["filters"]],
+            }
+            for clause in get_keyset_clauses(key_columns, position, per_page)
+        ]
 
     # todo(yongjie): Constructing count(*) and samples in the same query_context,
-    if payload is None:
+    if payload is None and position is None:
         # constructing samples query
-        samples_instance = QueryContextFactory().create(
-            datasource={
-                "type": datasource.type,
-                "id": datasource.id,
-            },
-            queries=[limit_clause],
-            result_type=ChartDataResultType.SAMPLES,
-            force=force,
-        )
+        samples_instances = [
+            QueryContextFactory().create(
+                datasource={
+                    "type": datasource.type,
+                    "id": datasource.id,
+                },
+                queries=[limit_clause],
+                result_type=ChartDataResultType.SAMPLES,
+                force=force,
+            )
+        ]
     else:
         # Use column names replacing verbose column names(Label)
-        replace_verbose_with_column(payload.get("filters", []), datasource.columns)
+        if payload:
+            replace_verbose_with_column(payload.get("filters", []), datasource.columns)
 
-        # constructing drill detail query
+        # constructing drill detail query, which is also used for samples with a
+        # cursor since its rows are ordered
         # When query_type == 'samples' the `time filter` will be removed,
         # so it is not applicable drill detail query
-        samples_instance = QueryContextFactory().create(
-            datasource={
-                "type": datasource.type,
-                "id": datasource.id,
-            },
-            queries=[{**payload, **limit_clause}],
-            result_type=ChartDataResultType.DRILL_DETAIL,
-            force=force,
-        )
+        samples_instances = [
+            QueryContextFactory().create(
+                datasource={
+                    "type": datasource.type,
+                    "id": datasource.id,
+                },
+                queries=[{**query, **clause}],
+                # the rows of pages with a cursor are ordered by their key columns
+                form_data={"cursor_pagination": True} if position is not None else None,
+                result_type=ChartDataResultType.DRILL_DETAIL,
+                force=force,
+            )
+            for clause in clauses
+        ]
 
     # constructing count(*) query
     count_star_metric = {
@@ -156,7 +423,8 @@ def get_samples(  # pylint: disable=too-many-arguments
         # Enforce access control before fetching data.
         # This prevents users with "can samples on Datasource" permission from
         # reading samples from datasets they don't have access to.
-        samples_instance.raise_for_access()
+        for samples_instance in samples_instances:
+            samples_instance.raise_for_access()
         count_star_instance.raise_for_access()
 
         count_star_data = count_star_instance.get_payload()["queries"][0]
@@ -164,11 +432,16 @@ def get_samples(  # pylint: disable=too-many-arguments
         if count_star_data.get("status") == QueryStatus.FAILED:
             raise DatasetSamplesFailedError(count_star_data.get("error"))
 
-        sample_data = samples_instance.get_payload()["queries"][0]
+        sample_data = get_sample_data(
+            samples_instances,
+            key_columns,
+            position,
+            per_page,
+        )
 
         if sample_data.get("status") == QueryStatus.FAILED:
             QueryCacheManager.delete(count_star_data.get("cache_key"), CacheRegion.DATA)
-            raise DatasetSamplesFailedError(sample_data.get("error"))
+            raise DatasetSamplesFailedError(sample_data.get("error", ""))
 
         sample_data["page"] = page
         sample_data["per_page"] = per_page
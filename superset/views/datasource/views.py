@@ -226,6 +226,7 @@ class Datasource(BaseSupersetView):
             page=params["page"],
             per_page=params["per_page"],
             payload=payload,
+            cursor=params["cursor"],
         )
         return self.json_response({"result": rv})
 
@@ -343,20 +343,30 @@ def get_dashboard_extra_filters(
     dashboard = db.session.query(Dashboard).filter_by(id=dashboard_id).one_or_none()
 
     # is chart in this dashboard?
-    if (
-        dashboard is None
-        or not dashboard.json_metadata
-        or not dashboard.slices
-        or not any(slc for slc in dashboard.slices if slc.id == slice_id)
-    ):
+    slc = next(
+        (slc for slc in (dashboard.slices if dashboard else []) if slc.id == slice_id),
+        None,
+    )
+    if dashboard is None or not dashboard.json_metadata or slc is None:
         return []
 
+    extra_filters: list[dict[str, Any]] = []
     with contextlib.suppress(json.JSONDecodeError):
-        # does this dashboard have default filters?
         json_metadata = json.loads(dashboard.json_metadata)
+
+        # does this dashboard have native filters with default values?
+        native_filters = json_metadata.get("native_filter_configuration") or []
+        if isinstance(native_filters, list) and slc.datasource_type == "table":
+            extra_filters.extend(
+                build_native_filter_defaults(
+                    native_filters, slice_id, slc.datasource_id
+                )
+            )
+
+        # does this dashboard have default filters?
         default_filters = json.loads(json_metadata.get("default_filters", "null"))
         if not default_filters:
-            return []
+            return extra_filters
 
         # are default filters applicable to the given slice?
         filter_scopes = json_metadata.get("filter_scopes", {})
@@ -367,8 +377,45 @@ def get_dashboard_extra_filters(
             and isinstance(filter_scopes, dict)
             and isinstance(default_filters, dict)
         ):
-            return build_extra_filters(layout, filter_scopes, default_filters, slice_id)
-    return []
+            extra_filters.extend(
+                build_extra_filters(layout, filter_scopes, default_filters, slice_id)
+            )
+    return extra_filters
+
+
+def build_native_filter_defaults(
+    native_filters: list[dict[str, Any]],
+    slice_id: int,
+    dataset_id: Optional[int],
+) -> list[dict[str, Any]]:
+    """
+    Return the filters applied to a chart by the default values of the native filters
+    of a dashboard.
+
+    A native filter applies to the charts in its scope that query the dataset it
+    targets; its default value is stored as the filters of its default data mask.
+    """
+    extra_filters: list[dict[str, Any]] = []
+    for native_filter in native_filters:
+        charts_in_scope = native_filter.get("chartsInScope")
+        if charts_in_scope is not None:
+            in_scope = slice_id in charts_in_scope
+        else:
+            excluded = (native_filter.get("scope") or {}).get("excluded") or []
+            in_scope = slice_id not in excluded
+
+        dataset_ids = {
+            target.get("datasetId") for target in native_filter.get("targets") or []
+        }
+        if not in_scope or dataset_id not in dataset_ids:
+            continue
+
+        extra_form_data = (native_filter.get("defaultDataMask") or {}).get(
+            "extraFormData"
+        ) or {}
+        extra_filters.extend(extra_form_data.get("filters") or [])
+
+    return extra_filters
 
 
 def build_extra_filters(  # pylint: disable=too-many-locals,too-many-nested-blocks  # noqa: C901
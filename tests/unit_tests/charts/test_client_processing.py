@@ -2061,6 +2061,33 @@ COUNT(is_software_dev)
     }
 
 
+def test_apply_client_processing_json_columnar_format():
+    """
+    It should encode columnar results like the chart data API, with big integers
+    converted to strings
+    """
+
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.JSON_COLUMNAR,
+                "data": {
+                    "columns": ["id", "name"],
+                    "data": [[2**60, "a"], [1, "b"]],
+                },
+                "colnames": ["id", "name"],
+                "coltypes": [GenericDataType.NUMERIC, GenericDataType.STRING],
+            }
+        ]
+    }
+    form_data = {"viz_type": "table"}
+
+    assert apply_client_processing(result, form_data)["queries"][0]["data"] == {
+        "columns": ["id", "name"],
+        "data": [[str(2**60), "a"], [1, "b"]],
+    }
+
+
 def test_apply_client_processing_csv_format_simple_table():
     """
     It should be able to process csv results
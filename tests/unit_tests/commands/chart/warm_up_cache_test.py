@@ -488,3 +488,39 @@ def test_validate_with_nonexistent_chart_id(mock_db):
 
     with pytest.raises(WarmUpCacheChartNotFoundError):
         command.validate()
+
+
+@patch("superset.commands.chart.warm_up_cache.get_dashboard_extra_filters")
+@patch("superset.commands.chart.warm_up_cache.ChartDataCommand")
+def test_uses_cache_when_not_forced(
+    mock_chart_data_command, mock_get_dashboard_filters
+):
+    """Test that cached results are reused, and reported, when not forcing"""
+    mock_get_dashboard_filters.return_value = []
+    chart = Slice(id=134, slice_name="Test Chart", viz_type="echarts_timeseries_bar")
+    mock_qc = Mock()
+    mock_qc.queries = [Mock()]
+    mock_qc.force = True
+
+    with patch.object(chart, "get_query_context", return_value=mock_qc):
+        with patch(
+            "superset.commands.chart.warm_up_cache.get_form_data",
+            return_value=[{"viz_type": "echarts_timeseries_bar"}],
+        ):
+            mock_chart_data_command.return_value.run.return_value = {
+                "queries": [
+                    {"error": None, "status": "success", "is_cached": True},
+                    {"error": None, "status": "success", "is_cached": False},
+                ]
+            }
+            command = ChartWarmUpCacheCommand(chart, None, None, force=False)
+            command.run()
+            assert mock_qc.force is False
+            assert command.is_cached is False
+
+            mock_chart_data_command.return_value.run.return_value = {
+                "queries": [{"error": None, "status": "success", "is_cached": True}]
+            }
+            command = ChartWarmUpCacheCommand(chart, None, None, force=False)
+            command.run()
+            assert command.is_cached is True
@@ -20,6 +20,7 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
 from werkzeug.datastructures import FileStorage
 
 from superset.commands.database.exceptions import DatabaseUploadFailed
@@ -1417,3 +1418,180 @@ def test_csv_reader_chunk_concatenation_error_warning(caplog):
             "inconsistent date parsing across chunks" in record.message
             for record in caplog.records
         )
+
+
+def test_csv_reader_file_to_dataframes(mocker: MockerFixture, app_context: None):
+    """
+    Test that a CSV file is read in chunks, cast one after the other, when uploads
+    are streamed.
+    """
+    data = [["name", "value"]] + [[f"name{i}", str(i)] for i in range(2500)]
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 1000},
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(
+            rows_to_read=2200,
+            column_data_types={"value": "float64"},
+        )
+    )
+
+    chunks = list(csv_reader.file_to_dataframes(create_csv_file(data)))
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 200]
+    assert all(chunk["value"].dtype == "float64" for chunk in chunks)
+    assert chunks[-1].iloc[-1].tolist() == ["name2199", 2199.0]
+
+
+def test_csv_reader_file_to_dataframes_not_streaming(
+    mocker: MockerFixture,
+    app_context: None,
+):
+    """
+    Test that a CSV file is read in a single dataframe by default.
+    """
+    data = [["name", "value"]] + [[f"name{i}", str(i)] for i in range(2500)]
+    mocker.patch.dict("flask.current_app.config", {"READ_CSV_CHUNK_SIZE": 1000})
+    csv_reader = CSVReader(options=CSVReaderOptions())
+
+    chunks = list(csv_reader.file_to_dataframes(create_csv_file(data)))
+
+    assert [len(chunk) for chunk in chunks] == [2500]
+
+
+def test_csv_reader_file_to_dataframes_error_line_number(
+    mocker: MockerFixture,
+    app_context: None,
+):
+    """
+    Test that a value that can't be cast is reported with its line in the file,
+    when it's found in a chunk other than the first one.
+    """
+    data = [["value"]] + [[str(i)] for i in range(1500)] + [["invalid"]]
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 1000},
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(column_data_types={"value": "int64"})
+    )
+
+    chunks = csv_reader.file_to_dataframes(create_csv_file(data))
+    assert len(next(chunks)) == 1000
+    with pytest.raises(DatabaseUploadFailed, match="Line 1502: 'invalid'"):
+        next(chunks)
+
+
+def test_csv_reader_read_streaming(mocker: MockerFixture, app_context: None):
+    """
+    Test that the chunks of a CSV file are uploaded as they're read, the first one
+    creating the table and the others appended to it.
+    """
+    data = [["name", "value"]] + [[f"name{i}", str(i)] for i in range(2500)]
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 1000},
+    )
+    database = mocker.MagicMock()
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists="fail"))
+
+    csv_reader.read(create_csv_file(data), database, "table", "schema")
+
+    calls = database.db_engine_spec.df_to_sql.call_args_list
+    assert [len(call.args[2]) for call in calls] == [1000, 1000, 500]
+    assert [call.kwargs["to_sql_kwargs"]["if_exists"] for call in calls] == [
+        "fail",
+        "append",
+        "append",
+    ]
+
+
+def test_csv_reader_read_streaming_replace(mocker: MockerFixture, app_context: None):
+    """
+    Test that a CSV file replacing a table is uploaded at once, so that the table
+    isn't replaced by the first chunk of a file that can't be read.
+    """
+    data = [["name", "value"]] + [[f"name{i}", str(i)] for i in range(2500)]
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 1000},
+    )
+    database = mocker.MagicMock()
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists="replace"))
+
+    csv_reader.read(create_csv_file(data), database, "table", "schema")
+
+    (call,) = database.db_engine_spec.df_to_sql.call_args_list
+    assert len(call.args[2]) == 2500
+    assert call.kwargs["to_sql_kwargs"]["if_exists"] == "replace"
+
+    # the table isn't touched when the file can't be read
+    database.reset_mock()
+    data.append(["name2500", "invalid"])
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(
+            already_exists="replace",
+            column_data_types={"value": "int64"},
+        )
+    )
+    with pytest.raises(DatabaseUploadFailed):
+        csv_reader.read(create_csv_file(data), database, "table", "schema")
+    database.db_engine_spec.df_to_sql.assert_not_called()
+
+
+def test_csv_reader_file_to_dataframes_consistent_types(
+    mocker: MockerFixture,
+    app_context: None,
+):
+    """
+    Test that the types inferred from the first chunk are applied to the others,
+    even when a later chunk would be inferred differently.
+    """
+    data = (
+        [["id", "code", "ratio"]]
+        + [[str(i), f"c{i}", f"{i}.5"] for i in range(1000)]
+        + [["", "007", "1"], ["1001", "008", ""]]
+    )
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 1000},
+    )
+    csv_reader = CSVReader(options=CSVReaderOptions())
+
+    first, second = csv_reader.file_to_dataframes(create_csv_file(data))
+
+    # a blank value would make the later chunk floats, eg, "1001.0" for a BIGINT
+    assert first["id"].dtype == second["id"].dtype == "Int64"
+    assert second["id"].tolist() == [pd.NA, 1001]
+    # numbers in a later chunk of a column of strings keep their leading zeros
+    assert second["code"].tolist() == ["007", "008"]
+    assert first["ratio"].dtype == second["ratio"].dtype == "float64"
+
+
+def test_csv_reader_read_streaming_error(mocker: MockerFixture, app_context: None):
+    """
+    Test that the table created by a streamed upload is dropped when a later chunk
+    can't be read.
+    """
+    data = [["value"]] + [[str(i)] for i in range(1500)] + [["invalid"]]
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 1000},
+    )
+    database = mocker.MagicMock()
+    drop_table = mocker.patch.object(CSVReader, "_drop_table")
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists="fail"))
+
+    with pytest.raises(DatabaseUploadFailed, match="Parsing error"):
+        csv_reader.read(create_csv_file(data), database, "table", "schema")
+
+    database.db_engine_spec.df_to_sql.assert_called_once()
+    drop_table.assert_called_once_with(database, "table", "schema")
+
+    # rows appended to an existing table are kept
+    drop_table.reset_mock()
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists="append"))
+    with pytest.raises(DatabaseUploadFailed, match="Parsing error"):
+        csv_reader.read(create_csv_file(data), database, "table", "schema")
+    drop_table.assert_not_called()
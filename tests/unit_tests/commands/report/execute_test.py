@@ -25,6 +25,7 @@ from pytest_mock import MockerFixture
 
 from superset.app import SupersetApp
 from superset.commands.exceptions import UpdateFailedError
+from superset.commands.report.exceptions import ReportScheduleCsvFailedError
 from superset.commands.report.execute import BaseReportState
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.reports.models import (
@@ -34,7 +35,7 @@ from superset.reports.models import (
     ReportScheduleType,
     ReportSourceFormat,
 )
-from superset.utils.core import HeaderDataType
+from superset.utils.core import GenericDataType, HeaderDataType
 from superset.utils.screenshots import ChartScreenshot
 from tests.integration_tests.conftest import with_feature_flags
 
@@ -509,6 +510,47 @@ def test_screenshot_width_calculation(
                 )
 
 
+def test_get_pdf_with_multiple_tabs(mocker: MockerFixture) -> None:
+    """
+    Test that the tabs of a dashboard are captured together, and added to the PDF
+    as they are taken.
+    """
+    report_schedule = create_report_schedule(mocker)
+    report_schedule.chart = None
+    report_schedule.dashboard = mocker.MagicMock()
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.object(
+        report_state,
+        "get_dashboard_urls",
+        return_value=["http://localhost/tab1", "http://localhost/tab2"],
+    )
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    mocker.patch("superset.commands.report.execute.security_manager")
+    get_screenshots = mocker.patch(
+        "superset.commands.report.execute.BaseScreenshot.get_screenshots",
+        return_value=iter([b"tab1", None, b"tab2"]),
+    )
+    build_pdf = mocker.patch(
+        "superset.commands.report.execute.build_pdf_from_screenshots",
+        side_effect=list,
+    )
+
+    assert report_state._get_pdf() == [b"tab1", b"tab2"]
+    screenshots = get_screenshots.call_args.args[0]
+    assert [screenshot.url for screenshot in screenshots] == [
+        "http://localhost/tab1?standalone=3",
+        "http://localhost/tab2?standalone=3",
+    ]
+    assert not isinstance(build_pdf.call_args.args[0], list)
+
+
 def test_update_recipient_to_slack_v2(mocker: MockerFixture):
     """
     Test converting a Slack recipient to Slack v2 format.
@@ -582,3 +624,146 @@ def test_update_recipient_to_slack_v2_missing_channels(mocker: MockerFixture):
     )
     with pytest.raises(UpdateFailedError):
         mock_cmmd.update_report_schedule_slack_v2()
+
+
+def test_get_csv_data_in_process(mocker: MockerFixture, app: SupersetApp) -> None:
+    """
+    Test that the CSV of a chart is generated in the worker, as the executor,
+    without requesting the chart data API.
+    """
+    report_schedule = create_report_schedule(mocker)
+    report_schedule.chart_id = 1
+    report_schedule.force_screenshot = True
+    report_schedule.chart.query_context = json.dumps({"queries": [{}]})
+    report_schedule.chart.params = json.dumps({"viz_type": "table"})
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_CHART_DATA_IN_PROCESS": True})
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    security_manager = mocker.patch(
+        "superset.commands.report.execute.security_manager",
+        new=mocker.MagicMock(),
+    )
+    security_manager.can_access.return_value = True
+    machine_auth = mocker.patch(
+        "superset.commands.report.execute.machine_auth_provider_factory"
+    )
+    get_chart_csv_data = mocker.patch(
+        "superset.commands.report.execute.get_chart_csv_data"
+    )
+    schema = mocker.patch(
+        "superset.commands.report.execute.ChartDataQueryContextSchema"
+    )
+    command = mocker.patch("superset.commands.report.execute.ChartDataCommand")
+    result = {"queries": [{"data": "a,b\n1,2\n"}]}
+    command.return_value.run.return_value = result
+    apply_client_processing = mocker.patch(
+        "superset.commands.report.execute.apply_client_processing",
+        side_effect=lambda result, form_data, datasource: result,
+    )
+
+    with app.app_context():
+        assert report_state._get_csv_data() == "a,b\n1,2\n".encode("utf-8-sig")
+
+    json_body = schema.return_value.load.call_args.args[0]
+    assert json_body["result_format"] == "csv"
+    assert json_body["result_type"] == "post_processed"
+    assert json_body["force"] is True
+    command.return_value.validate.assert_called_once()
+    apply_client_processing.assert_called_once_with(
+        result,
+        {"viz_type": "table"},
+        schema.return_value.load.return_value.datasource,
+    )
+    machine_auth.instance.get_auth_cookies.assert_not_called()
+    get_chart_csv_data.assert_not_called()
+
+
+def test_get_csv_data_in_process_without_permission(
+    mocker: MockerFixture,
+    app: SupersetApp,
+) -> None:
+    """
+    Test that the CSV of a chart isn't generated when the executor can't export
+    CSV files.
+    """
+    report_schedule = create_report_schedule(mocker)
+    report_schedule.chart_id = 1
+    report_schedule.chart.query_context = json.dumps({"queries": [{}]})
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_CHART_DATA_IN_PROCESS": True})
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    security_manager = mocker.patch(
+        "superset.commands.report.execute.security_manager",
+        new=mocker.MagicMock(),
+    )
+    security_manager.can_access.return_value = False
+    command = mocker.patch("superset.commands.report.execute.ChartDataCommand")
+
+    with app.app_context():
+        with pytest.raises(ReportScheduleCsvFailedError, match="forbidden"):
+            report_state._get_csv_data()
+
+    command.assert_not_called()
+
+
+def test_get_embedded_data_in_process(
+    mocker: MockerFixture,
+    app: SupersetApp,
+) -> None:
+    """
+    Test that the data embedded in a report is built from the query result,
+    without a JSON round trip.
+    """
+    report_schedule = create_report_schedule(mocker)
+    report_schedule.chart_id = 1
+    report_schedule.chart.query_context = json.dumps({"queries": [{}]})
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_CHART_DATA_IN_PROCESS": True})
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    mocker.patch("superset.commands.report.execute.security_manager")
+    schema = mocker.patch(
+        "superset.commands.report.execute.ChartDataQueryContextSchema"
+    )
+    command = mocker.patch("superset.commands.report.execute.ChartDataCommand")
+    command.return_value.run.return_value = {
+        "queries": [
+            {
+                "data": [{"name": "a", "count": 1}, {"name": "b", "count": 2}],
+                "colnames": ["name", "count"],
+                "coltypes": [GenericDataType.STRING, GenericDataType.NUMERIC],
+                "indexnames": [0, 1],
+            }
+        ]
+    }
+    mocker.patch(
+        "superset.commands.report.execute.apply_client_processing",
+        side_effect=lambda result, form_data, datasource: result,
+    )
+
+    with app.app_context():
+        df = report_state._get_embedded_data()
+
+    assert schema.return_value.load.call_args.args[0]["result_format"] == "json"
+    assert df[("name",)].tolist() == ["a", "b"]
+    assert df[("count",)].tolist() == [1, 2]
@@ -0,0 +1,186 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Unit tests for the base streaming CSV export command."""
+
+import csv
+import gzip
+import io
+
+import pyarrow as pa
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.commands.streaming_export.base import (
+    BaseStreamingCSVExportCommand,
+    compress_stream,
+    get_byte_count,
+    get_stream_content_encoding,
+)
+
+
+class StreamingCSVExportCommand(BaseStreamingCSVExportCommand):
+    def _get_sql_and_database(self):
+        return "SELECT 1", None
+
+    def _get_row_limit(self):
+        return None
+
+    def validate(self) -> None:
+        pass
+
+
+def test_get_byte_count() -> None:
+    """Test that byte counts account for multi-byte characters."""
+    assert get_byte_count("a,b\n") == 4
+    assert get_byte_count("é,ü\n") == 6
+
+
+@pytest.mark.parametrize("limit", [None, 3, 4, 100])
+def test_process_rows(mocker: MockerFixture, limit: int | None) -> None:
+    """Test that batches of rows are encoded at once, up to the limit."""
+    result_proxy = mocker.MagicMock()
+    result_proxy.fetchmany.side_effect = [
+        [(1, "a, b"), (2, None)],
+        [(3, 'c "d"'), (4, "é")],
+        [(5, 1.5)],
+        [],
+    ]
+    buffer = io.StringIO()
+    command = StreamingCSVExportCommand(chunk_size=2)
+
+    chunks = list(
+        command._process_rows(
+            result_proxy,
+            csv.writer(buffer, quoting=csv.QUOTE_MINIMAL),
+            buffer,
+            limit,
+        )
+    )
+
+    expected = ['1,"a, b"', "2,", '3,"c ""d"""', "4,é", "5,1.5"][:limit]
+    data = "".join(chunk for chunk, _, _ in chunks)
+    assert data == "".join(f"{line}\r\n" for line in expected)
+    assert chunks[-1][1] == len(expected)
+    assert sum(byte_count for _, _, byte_count in chunks) == len(data.encode("utf-8"))
+
+
+def test_process_rows_flush(mocker: MockerFixture) -> None:
+    """Test that the buffer is flushed between batches once it's large enough."""
+    result_proxy = mocker.MagicMock()
+    result_proxy.fetchmany.side_effect = [
+        [("x" * 40000,)],
+        [("y" * 40000,)],
+        [("z",)],
+        [],
+    ]
+    buffer = io.StringIO()
+    command = StreamingCSVExportCommand(chunk_size=1)
+
+    chunks = list(command._process_rows(result_proxy, csv.writer(buffer), buffer, None))
+
+    assert [(row_count, byte_count) for _, row_count, byte_count in chunks] == [
+        (2, 80004),
+        (3, 3),
+    ]
+
+
+def test_process_rows_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that batches are encoded as blocks by Arrow, or with the csv module when
+    Arrow can't convert them.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_STREAMING_ENCODER": "arrow"},
+    )
+    result_proxy = mocker.MagicMock()
+    result_proxy.fetchmany.side_effect = [
+        [(1, "a, b", True), (2, None, False)],
+        # mixed types
+        [(3, "c", 1.5), (4, "d", "e")],
+        [],
+    ]
+    buffer = io.StringIO()
+    command = StreamingCSVExportCommand(chunk_size=2)
+
+    chunks = list(
+        command._process_rows(
+            result_proxy,
+            csv.writer(buffer, lineterminator="\n"),
+            buffer,
+            None,
+        )
+    )
+
+    assert "".join(chunk for chunk, _, _ in chunks) == (
+        '1,"a, b",true\n2,,false\n3,c,1.5\n4,d,e\n'
+    )
+    assert chunks[-1][1] == 4
+
+
+@pytest.mark.parametrize("content_encoding", ["gzip", "zstd"])
+def test_compress_stream(content_encoding: str) -> None:
+    """Test that streams are compressed chunk by chunk."""
+    chunks = ["col1,col2\r\n", "1,é\r\n" * 1000, "2,b\r\n"]
+
+    compressed = list(compress_stream(iter(chunks), content_encoding))
+
+    # every chunk is flushed as soon as it's compressed
+    assert len(compressed) == len(chunks) + 1
+    assert all(compressed[: len(chunks)])
+    data = b"".join(compressed)
+    if content_encoding == "gzip":
+        decompressed = gzip.decompress(data)
+    else:
+        decompressed = pa.CompressedInputStream(pa.BufferReader(data), "zstd").read()
+    assert decompressed == "".join(chunks).encode("utf-8")
+
+
+def test_compress_stream_unsupported() -> None:
+    """Test that unsupported content encodings are rejected."""
+    with pytest.raises(ValueError, match="Unsupported content encoding: br"):
+        list(compress_stream(iter(["a"]), "br"))
+
+
+@pytest.mark.parametrize(
+    "compression, accept_encoding, expected",
+    [
+        ([], "gzip, deflate, br, zstd", None),
+        (["zstd", "gzip"], "gzip, deflate, br, zstd", "zstd"),
+        (["zstd", "gzip"], "gzip, deflate", "gzip"),
+        (["gzip"], "br", None),
+        (["gzip"], "", None),
+    ],
+)
+def test_get_stream_content_encoding(
+    app_context: None,
+    mocker: MockerFixture,
+    compression: list[str],
+    accept_encoding: str,
+    expected: str | None,
+) -> None:
+    """Test that the preferred compression accepted by the client is picked."""
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CSV_STREAMING_COMPRESSION": compression},
+    )
+
+    with current_app.test_request_context(
+        headers={"Accept-Encoding": accept_encoding},
+    ):
+        assert get_stream_content_encoding() == expected
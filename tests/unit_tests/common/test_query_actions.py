@@ -0,0 +1,55 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.query_actions import _get_drill_detail
+from superset.common.query_object import QueryObject
+
+
+@pytest.mark.parametrize(
+    "form_data, expected",
+    [
+        (None, [("name", True)]),
+        ({"slice_id": 1}, [("name", True)]),
+        ({"cursor_pagination": True}, [("name", True), ("id", True)]),
+    ],
+)
+def test_get_drill_detail_orderby(
+    mocker: MockerFixture,
+    form_data: dict[str, Any] | None,
+    expected: list[tuple[str, bool]],
+) -> None:
+    """
+    Test that drill detail rows are ordered by the first column, unless samples are
+    paginated with a cursor.
+    """
+    get_full = mocker.patch("superset.common.query_actions._get_full")
+    datasource = MagicMock()
+    datasource.columns = [MagicMock(column_name="name"), MagicMock(column_name="id")]
+    query_context = MagicMock(datasource=datasource, form_data=form_data)
+    query_obj = QueryObject(
+        datasource=datasource,
+        orderby=[("name", True), ("id", True)],
+    )
+
+    _get_drill_detail(query_context, query_obj)
+
+    assert get_full.call_args.args[1].orderby == expected
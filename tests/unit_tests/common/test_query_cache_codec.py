@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import date, datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from superset.common.utils.query_cache_codec import (
+    ArrowQueryCacheCodec,
+    CODEC_KEY,
+    decode_cache_value,
+    encode_cache_value,
+)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": [1, 2], "b": ["x", None], "c": [1.5, None]}),
+        pd.DataFrame({"a": pd.Series([1, None], dtype=object)}),
+        pd.DataFrame({"a": [Decimal("1.10"), None], "b": [date(2024, 1, 1), None]}),
+        pd.DataFrame(
+            {"a": [1, 2]},
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-02"], name="__timestamp"),
+        ),
+        pd.DataFrame(
+            [[1, 2]],
+            columns=pd.MultiIndex.from_tuples([("a", "x"), ("a", "y")]),
+        ),
+        pd.DataFrame(),
+    ],
+)
+def test_arrow_codec_roundtrip(df: pd.DataFrame) -> None:
+    """
+    Test that dataframes are read back unchanged by the Arrow codec.
+    """
+    codec = ArrowQueryCacheCodec()
+    payload = codec.encode_df(df)
+
+    assert isinstance(payload, bytes)
+    assert_frame_equal(codec.decode_df(payload), df)
+
+
+def test_encode_cache_value(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the dataframe is encoded with the configured codec, and timed.
+    """
+    stats_logger = mocker.patch.dict(
+        "flask.current_app.config",
+        {
+            "STATS_LOGGER": mocker.MagicMock(),
+            "DATA_CACHE_CODEC": "arrow",
+        },
+    )["STATS_LOGGER"]
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    value = encode_cache_value({"df": df, "query": "SELECT 1"})
+
+    assert value[CODEC_KEY] == "arrow"
+    assert value["query"] == "SELECT 1"
+    assert isinstance(value["df"], bytes)
+    stats_logger.timing.assert_called_once()
+    assert stats_logger.timing.call_args[0][0] == "data_cache.arrow.encode"
+    stats_logger.gauge.assert_called_once_with(
+        "data_cache.arrow.payload_bytes",
+        len(value["df"]),
+    )
+
+    decoded = decode_cache_value(value)
+    assert_frame_equal(decoded["df"], df)
+    assert stats_logger.timing.call_args[0][0] == "data_cache.arrow.decode"
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"a": [1, "b"]}),
+        pd.DataFrame({"a": pd.Series([datetime(2024, 1, 1), None], dtype=object)}),
+    ],
+)
+def test_encode_cache_value_fallback(
+    app_context: None,
+    mocker: MockerFixture,
+    df: pd.DataFrame,
+) -> None:
+    """
+    Test that dataframes that can't be stored as Arrow are stored as is.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_CODEC": "arrow"})
+    value = encode_cache_value({"df": df})
+
+    assert value[CODEC_KEY] == "pickle"
+    assert value["df"] is df
+
+
+def test_decode_cache_value_codec(app_context: None) -> None:
+    """
+    Test that values are decoded with the codec they were written with.
+    """
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    # written with the Arrow codec
+    value = {"df": ArrowQueryCacheCodec().encode_df(df), CODEC_KEY: "arrow"}
+    assert_frame_equal(decode_cache_value(value)["df"], df)
+
+    # written before codecs were introduced
+    assert decode_cache_value({"df": df})["df"] is df
+
+
+def test_encode_cache_value_default(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that dataframes are stored as is by default, and that the Arrow compression
+    can be configured.
+    """
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    value = encode_cache_value({"df": df})
+    assert value[CODEC_KEY] == "pickle"
+    assert value["df"] is df
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATA_CACHE_CODEC": "arrow", "DATA_CACHE_ARROW_COMPRESSION": "lz4"},
+    )
+    encode_df = mocker.spy(ArrowQueryCacheCodec, "encode_df")
+    value = encode_cache_value({"df": df})
+    assert value[CODEC_KEY] == "arrow"
+    assert encode_df.call_args.args[0].compression == "lz4"
+    assert_frame_equal(decode_cache_value(value)["df"], df)
@@ -0,0 +1,113 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pandas as pd
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def data_cache(mocker: MockerFixture) -> dict[str, dict]:
+    """
+    Replace the data cache with a dictionary.
+    """
+    store: dict[str, dict] = {}
+    cache = mocker.MagicMock()
+    cache.get.side_effect = store.get
+    cache.set.side_effect = lambda key, value, timeout: store.__setitem__(key, value)
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    return store
+
+
+def test_stale_while_revalidate(
+    app_context: None,
+    mocker: MockerFixture,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that values are kept past their timeout and flagged as stale.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_STALE_TIMEOUT": 600})
+    set_and_log_cache = mocker.patch(
+        "superset.common.utils.query_cache_manager.set_and_log_cache",
+        side_effect=lambda cache, key, value, timeout, uid: cache.set(
+            key, {**value, "dttm": "2024-01-01T00:00:00"}, timeout
+        ),
+    )
+    query_result = QueryResult(
+        df=pd.DataFrame({"a": [1]}),
+        query="SELECT 1 AS a",
+        duration=0,
+        status=QueryStatus.SUCCESS,
+    )
+
+    with freeze_time("2024-01-01 00:00:00"):
+        QueryCacheManager().set_query_result(
+            key="key",
+            query_result=query_result,
+            timeout=60,
+            region=CacheRegion.DATA,
+        )
+    assert set_and_log_cache.call_args[0][3] == 660
+
+    with freeze_time("2024-01-01 00:00:59"):
+        cache = QueryCacheManager.get("key", CacheRegion.DATA)
+        assert cache.is_loaded
+        assert not cache.is_stale
+
+    with freeze_time("2024-01-01 00:01:00"):
+        cache = QueryCacheManager.get("key", CacheRegion.DATA)
+        assert cache.is_loaded
+        assert cache.is_stale
+        assert cache.df.equals(query_result.df)
+
+
+def test_stale_while_revalidate_disabled(
+    app_context: None,
+    mocker: MockerFixture,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that the timeout is unchanged when stale values are not served.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_STALE_TIMEOUT": 0})
+    set_and_log_cache = mocker.patch(
+        "superset.common.utils.query_cache_manager.set_and_log_cache",
+    )
+
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=QueryResult(
+            df=pd.DataFrame({"a": [1]}),
+            query="SELECT 1 AS a",
+            duration=0,
+            status=QueryStatus.SUCCESS,
+        ),
+        timeout=60,
+        region=CacheRegion.DATA,
+    )
+
+    assert set_and_log_cache.call_args[0][3] == 60
+    assert "stale_after" not in set_and_log_cache.call_args[0][2]
@@ -1311,3 +1311,250 @@ def test_force_cached_normalizes_totals_query_row_limit():
 
     assert captured_limits == [None], "Totals query should be normalized before caching"
     mock_query_context.get_query_result.assert_not_called()
+
+
+def test_get_single_flight_query_result_leader(processor):
+    """
+    Test that the first request runs the query while holding the lock.
+    """
+    cache = MagicMock(is_loaded=False)
+    query_obj = MagicMock()
+
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_data_cache_manager,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch.object(processor, "set_query_result") as mock_set_query_result,
+    ):
+        data_cache = mock_data_cache_manager.data_cache
+        data_cache.add.return_value = True
+        data_cache.get.side_effect = lambda key: data_cache.add.call_args.args[1]
+        mock_cache_manager.get.return_value = cache
+
+        result = processor.get_single_flight_query_result(query_obj, "key")
+
+    assert result is cache
+    mock_set_query_result.assert_called_once_with(cache, query_obj, "key", False)
+    lock_key = data_cache.add.call_args.args[0]
+    assert lock_key == "chart_data_query_lock_key"
+    data_cache.delete.assert_called_once_with(lock_key)
+
+
+def test_get_single_flight_query_result_leader_expired(processor):
+    """
+    Test that a lock which expired while the query ran, and was then acquired by
+    another request, isn't released.
+    """
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_data_cache_manager,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch.object(processor, "set_query_result"),
+    ):
+        mock_data_cache_manager.data_cache.add.return_value = True
+        mock_data_cache_manager.data_cache.get.return_value = "other"
+        mock_cache_manager.get.return_value = MagicMock(is_loaded=False)
+
+        processor.get_single_flight_query_result(MagicMock(), "key")
+
+    mock_data_cache_manager.data_cache.get.assert_called_once_with(
+        "chart_data_query_lock_key"
+    )
+    mock_data_cache_manager.data_cache.delete.assert_not_called()
+
+
+def test_get_single_flight_query_result_leader_error(processor):
+    """
+    Test that the lock is released when the query fails.
+    """
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_data_cache_manager,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch.object(
+            processor,
+            "set_query_result",
+            side_effect=ValueError("Query failed"),
+        ),
+    ):
+        data_cache = mock_data_cache_manager.data_cache
+        data_cache.add.return_value = True
+        data_cache.get.side_effect = lambda key: data_cache.add.call_args.args[1]
+        mock_cache_manager.get.return_value = MagicMock(is_loaded=False)
+
+        with pytest.raises(ValueError, match="Query failed"):
+            processor.get_single_flight_query_result(MagicMock(), "key")
+
+    mock_data_cache_manager.data_cache.delete.assert_called_once_with(
+        "chart_data_query_lock_key"
+    )
+
+
+def test_get_single_flight_query_result_follower(processor):
+    """
+    Test that concurrent requests wait for the result of the first one.
+    """
+    pending = MagicMock(is_loaded=False)
+    cache = MagicMock(is_loaded=True)
+
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_data_cache_manager,
+        patch("superset.common.query_context_processor.time.sleep") as mock_sleep,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch.object(processor, "set_query_result") as mock_set_query_result,
+    ):
+        mock_data_cache_manager.data_cache.add.return_value = False
+        mock_data_cache_manager.data_cache.has.return_value = True
+        mock_cache_manager.get.side_effect = [pending, pending, cache]
+
+        result = processor.get_single_flight_query_result(MagicMock(), "key")
+
+    assert result is cache
+    assert mock_sleep.call_count == 2
+    mock_set_query_result.assert_not_called()
+    mock_data_cache_manager.data_cache.delete.assert_not_called()
+
+
+def test_get_single_flight_query_result_lock_released(processor):
+    """
+    Test that waiting requests run the query if the lock is released without result.
+    """
+    cache = MagicMock(is_loaded=False)
+    query_obj = MagicMock()
+
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_data_cache_manager,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch.object(processor, "set_query_result") as mock_set_query_result,
+    ):
+        mock_data_cache_manager.data_cache.add.return_value = False
+        mock_data_cache_manager.data_cache.has.return_value = False
+        mock_cache_manager.get.return_value = cache
+
+        result = processor.get_single_flight_query_result(query_obj, "key")
+
+    assert result is cache
+    mock_set_query_result.assert_called_once_with(cache, query_obj, "key", False)
+    mock_data_cache_manager.data_cache.delete.assert_not_called()
+
+
+def test_revalidate(processor, mock_query_context):
+    """
+    Test that the refresh of stale results is scheduled only once.
+    """
+    mock_query_context.cache_values = {"queries": [{"metrics": ["count"]}]}
+    mock_query_context.form_data = {"slice_id": 1}
+    mock_query_context.custom_cache_timeout = None
+
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_cache_manager,
+        patch(
+            "superset.common.query_context_processor.security_manager",
+            new_callable=MagicMock,
+        ) as mock_security_manager,
+        patch("superset.common.query_context_processor.get_user_id", return_value=1),
+        patch(
+            "superset.tasks.async_queries.refresh_chart_data_cache"
+        ) as mock_refresh_chart_data_cache,
+    ):
+        mock_security_manager.get_current_guest_user_if_guest.return_value = None
+        mock_cache_manager.data_cache.add.side_effect = [True, False]
+
+        processor.revalidate()
+        processor.revalidate()
+
+    mock_refresh_chart_data_cache.delay.assert_called_once()
+    job_metadata, form_data, lock_key = (
+        mock_refresh_chart_data_cache.delay.call_args.args
+    )
+    assert job_metadata == {"user_id": 1}
+    assert form_data == {
+        "queries": [{"metrics": ["count"]}],
+        "form_data": {"slice_id": 1},
+        "custom_cache_timeout": None,
+    }
+    assert lock_key == mock_cache_manager.data_cache.add.call_args.args[0]
+
+
+def test_get_data_json_columnar(processor, mock_query_context):
+    """
+    Test that the columnar JSON format returns the column names and the rows.
+    """
+    df = pd.DataFrame(
+        {"ds": pd.to_datetime(["1970-01-01", None]), "col1": [1.5, np.nan]}
+    )
+    mock_query_context.result_format = ChartDataResultFormat.JSON_COLUMNAR
+
+    result = processor.get_data(df, [GenericDataType.TEMPORAL, GenericDataType.NUMERIC])
+
+    assert result == {
+        "columns": ["ds", "col1"],
+        "data": [[0.0, 1.5], [None, None]],
+    }
+
+
+def test_get_payload_concurrent(processor, mock_query_context):
+    """
+    Test that queries running in other threads get copies of the datasource and the
+    query context, bound to the database session of their thread.
+    """
+    mock_query_context.queries = [MagicMock(post_processing=[]) for _ in range(3)]
+    mock_query_context.cache_values = {"queries": [{}, {}, {}]}
+    captured: list[tuple[Any, Any, Any]] = []
+
+    def get_query_results(result_type, query_context, query_obj, force_cached):
+        captured.append((query_context, query_context.datasource, query_obj))
+        return {"data": len(captured)}
+
+    with (
+        patch.dict(
+            "flask.current_app.config",
+            {"CHART_DATA_MAX_WORKERS": 2},
+        ),
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=get_query_results,
+        ),
+        patch(
+            "superset.common.query_context_processor.merge_in_session",
+            side_effect=lambda value: ("merged", value),
+        ),
+    ):
+        payload = processor.get_payload()
+
+    assert len(payload["queries"]) == 3
+    first, *others = captured
+    assert first == (
+        mock_query_context,
+        mock_query_context.datasource,
+        mock_query_context.queries[0],
+    )
+    for query_context, datasource, query_obj in others:
+        assert query_context is not mock_query_context
+        assert datasource == ("merged", mock_query_context.datasource)
+        assert query_context.slice_ == ("merged", mock_query_context.slice_)
+        assert all(query_obj is not query for query in mock_query_context.queries)
+        assert query_obj.datasource[0] == "merged"
+    # the query objects of the request aren't modified
+    assert not any(
+        isinstance(query.datasource, tuple) for query in mock_query_context.queries
+    )
@@ -0,0 +1,215 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.query_object import QueryObject
+from superset.common.utils.query_result_cache import QueryResultCache
+from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def datasource() -> MagicMock:
+    datasource = MagicMock()
+    datasource.uid = "1__table"
+    datasource.cache_timeout = None
+    datasource.changed_on = datetime(2024, 1, 1)
+    datasource.get_extra_cache_keys.return_value = []
+    datasource.database.extra = "{}"
+    datasource.database.impersonate_user = False
+    return datasource
+
+
+@pytest.fixture
+def data_cache(mocker: MockerFixture) -> dict[str, dict]:
+    """
+    Replace the data cache with a dictionary.
+    """
+    store: dict[str, dict] = {}
+    cache = mocker.MagicMock()
+    cache.get.side_effect = store.get
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch(
+        "superset.common.utils.query_cache_manager.set_and_log_cache",
+        side_effect=lambda cache, key, value, timeout, uid: store.__setitem__(
+            key, {**value, "dttm": "2024-01-01T00:00:00"}
+        ),
+    )
+    mocker.patch(
+        "superset.common.utils.query_result_cache.security_manager.get_rls_cache_key",
+        return_value=[],
+    )
+    return store
+
+
+def get_query_object(datasource: MagicMock, **kwargs: Any) -> QueryObject:
+    return QueryObject(
+        datasource=datasource,
+        columns=["gender"],
+        metrics=["count"],
+        row_limit=kwargs.pop("row_limit", 100),
+        **kwargs,
+    )
+
+
+def test_from_query_object_disabled(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+) -> None:
+    """
+    Test that query results aren't cached before post-processing by default.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATA_CACHE_QUERY_RESULTS_ENABLED": False},
+    )
+
+    assert (
+        QueryResultCache.from_query_object(datasource, get_query_object(datasource))
+        is None
+    )
+
+
+def test_query_result_cache(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that the result of a query is reused when only its post-processing changes.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATA_CACHE_QUERY_RESULTS_ENABLED": True},
+    )
+    df = pd.DataFrame({"gender": ["boy", "girl"], "count": [1, 2]})
+
+    result_cache = QueryResultCache.from_query_object(
+        datasource,
+        get_query_object(datasource),
+    )
+    assert result_cache.get_query_result() is None
+    result_cache.set_query_result(
+        QueryResult(
+            df=df,
+            query="SELECT ...",
+            duration=timedelta(seconds=1),
+            applied_filter_columns=["gender"],
+        )
+    )
+    assert len(data_cache) == 1
+
+    result = QueryResultCache.from_query_object(
+        datasource,
+        get_query_object(
+            datasource,
+            post_processing=[
+                {"operation": "sort", "options": {"by": {"count": False}}},
+            ],
+            time_offsets=["1 year ago"],
+        ),
+    ).get_query_result()
+    assert result.query == "SELECT ..."
+    assert result.applied_filter_columns == ["gender"]
+    assert_frame_equal(result.df, df)
+
+    # the row limit changes the query
+    assert (
+        QueryResultCache.from_query_object(
+            datasource,
+            get_query_object(datasource, row_limit=10),
+        ).get_query_result()
+        is None
+    )
+
+
+def test_query_result_cache_failed(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that failed queries aren't cached.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATA_CACHE_QUERY_RESULTS_ENABLED": True},
+    )
+
+    QueryResultCache.from_query_object(
+        datasource,
+        get_query_object(datasource),
+    ).set_query_result(
+        QueryResult(
+            df=pd.DataFrame(),
+            query="SELECT ...",
+            duration=timedelta(0),
+            status=QueryStatus.FAILED,
+        )
+    )
+    assert data_cache == {}
+
+
+def test_query_result_cache_timeout(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that results are cached with the timeout of the query context, and not at
+    all when caching is disabled.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATA_CACHE_QUERY_RESULTS_ENABLED": True},
+    )
+    set_and_log_cache = mocker.patch(
+        "superset.common.utils.query_cache_manager.set_and_log_cache",
+    )
+
+    QueryResultCache.from_query_object(
+        datasource,
+        get_query_object(datasource),
+        600,
+    ).set_query_result(
+        QueryResult(df=pd.DataFrame(), query="SELECT ...", duration=timedelta(0)),
+    )
+    assert set_and_log_cache.call_args.args[3] == 600
+
+    assert (
+        QueryResultCache.from_query_object(
+            datasource,
+            get_query_object(datasource),
+            CACHE_DISABLED_TIMEOUT,
+        )
+        is None
+    )
@@ -0,0 +1,473 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from superset.common.query_object import QueryObject
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.query_rollup import (
+    get_filter_mask,
+    get_rollup_aggregate,
+    QueryRollup,
+)
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+SUM_METRIC = {
+    "expressionType": "SIMPLE",
+    "aggregate": "SUM",
+    "column": {"column_name": "num"},
+    "label": "SUM(num)",
+}
+MAX_METRIC = {
+    "expressionType": "SIMPLE",
+    "aggregate": "MAX",
+    "column": {"column_name": "num"},
+    "label": "MAX(num)",
+}
+SQL_METRIC = {
+    "expressionType": "SQL",
+    "sqlExpression": "SUM(num) / COUNT(*)",
+    "label": "ratio",
+}
+
+
+@pytest.fixture
+def datasource() -> MagicMock:
+    datasource = MagicMock()
+    datasource.uid = "1__table"
+    datasource.sql = None
+    datasource.offset = 0
+    datasource.cache_timeout = None
+    datasource.changed_on = datetime(2024, 1, 1)
+    datasource.metrics = [
+        MagicMock(metric_name="count", metric_type="count"),
+        MagicMock(metric_name="ratio", metric_type=None),
+    ]
+    datasource.get_extra_cache_keys.return_value = []
+    datasource.database.extra = "{}"
+    datasource.database.impersonate_user = False
+    return datasource
+
+
+@pytest.fixture
+def data_cache(mocker: MockerFixture) -> dict[str, dict]:
+    """
+    Replace the data cache with a dictionary.
+    """
+    store: dict[str, dict] = {}
+    cache = mocker.MagicMock()
+    cache.get.side_effect = store.get
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch(
+        "superset.common.utils.query_cache_manager.set_and_log_cache",
+        side_effect=lambda cache, key, value, timeout, uid: store.__setitem__(
+            key, {**value, "dttm": "2024-01-01T00:00:00"}
+        ),
+    )
+    mocker.patch(
+        "superset.common.utils.query_rollup.security_manager.get_rls_cache_key",
+        return_value=[],
+    )
+    return store
+
+
+def get_query_object(datasource: MagicMock, time_grain: str, **kwargs: Any):
+    return QueryObject(
+        datasource=datasource,
+        columns=[
+            {
+                "columnType": "BASE_AXIS",
+                "sqlExpression": "ds",
+                "label": "ds",
+                "timeGrain": time_grain,
+                "expressionType": "SQL",
+            },
+            "gender",
+        ],
+        metrics=kwargs.pop("metrics", ["count", SUM_METRIC, MAX_METRIC]),
+        time_range="2024-01-01 : 2024-03-01",
+        **kwargs,
+    )
+
+
+def set_query_result(
+    datasource: MagicMock,
+    query_object: QueryObject,
+    df: pd.DataFrame,
+    **kwargs: Any,
+) -> None:
+    """
+    Store the result of a query in the data cache, like the chart data API does.
+    """
+    QueryCacheManager().set_query_result(
+        key=query_object.cache_key(
+            datasource=datasource.uid,
+            extra_cache_keys=[],
+            rls=[],
+            changed_on=datasource.changed_on,
+        ),
+        query_result=QueryResult(
+            df=df,
+            query="SELECT ...",
+            duration=timedelta(0),
+            **kwargs,
+        ),
+        region=CacheRegion.DATA,
+    )
+
+
+def test_get_rollup_aggregate(datasource: MagicMock) -> None:
+    """
+    Test that metrics are additive depending on their aggregate or metric type.
+    """
+    assert get_rollup_aggregate("count", datasource) == "sum"
+    assert get_rollup_aggregate(SUM_METRIC, datasource) == "sum"
+    assert get_rollup_aggregate(MAX_METRIC, datasource) == "max"
+    assert (
+        get_rollup_aggregate(
+            {**SUM_METRIC, "aggregate": "COUNT_DISTINCT"},
+            datasource,
+        )
+        is None
+    )
+    assert get_rollup_aggregate(SQL_METRIC, datasource) is None
+    assert get_rollup_aggregate("ratio", datasource) is None
+    assert get_rollup_aggregate("missing", datasource) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"metrics": ["count", SQL_METRIC]},
+        {"metrics": ["ratio"]},
+        {"extras": {"having": "COUNT(*) > 10"}},
+        {"row_offset": 10},
+    ],
+)
+def test_from_query_object_not_eligible(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    kwargs: dict[str, Any],
+) -> None:
+    """
+    Test that queries whose results can't be rolled up are skipped.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": True})
+
+    assert (
+        QueryRollup.from_query_object(
+            datasource,
+            get_query_object(datasource, "P1M", **kwargs),
+        )
+        is None
+    )
+    assert QueryRollup.from_query_object(
+        datasource,
+        get_query_object(datasource, "P1M"),
+    )
+
+
+def test_from_query_object_disabled(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+) -> None:
+    """
+    Test that rollups are disabled by default.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": False})
+    assert (
+        QueryRollup.from_query_object(
+            datasource,
+            get_query_object(datasource, "P1M"),
+        )
+        is None
+    )
+
+
+def test_roll_up(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that a monthly query is answered from the cached daily result.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": True})
+    daily = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(
+                ["2024-01-01", "2024-01-15", "2024-02-01", "2024-01-02", "2024-02-03"]
+            ),
+            "gender": ["boy", "boy", "boy", "girl", "girl"],
+            "count": [1, 2, 3, 4, 5],
+            "SUM(num)": [10.0, np.nan, 30.0, np.nan, 50.0],
+            "MAX(num)": [10.0, 20.0, np.nan, 40.0, 50.0],
+        }
+    )
+
+    # nothing is cached yet
+    monthly_rollup = QueryRollup.from_query_object(
+        datasource,
+        get_query_object(datasource, "P1M", orderby=[("count", False)]),
+    )
+    assert monthly_rollup.get_query_result() is None
+
+    # the result of the daily query, cached by the chart data API
+    set_query_result(
+        datasource,
+        get_query_object(datasource, "P1D", orderby=[("count", False)]),
+        daily,
+        applied_filter_columns=["gender"],
+    )
+
+    result = monthly_rollup.get_query_result()
+
+    # rollups don't store anything themselves
+    assert len(data_cache) == 1
+
+    assert result.query == "SELECT ..."
+    assert result.applied_filter_columns == ["gender"]
+    assert result.derived_from == {
+        "time_grain": "P1D",
+        "cached_dttm": "2024-01-01T00:00:00",
+    }
+    assert_frame_equal(
+        result.df,
+        pd.DataFrame(
+            {
+                "ds": pd.to_datetime(
+                    ["2024-02-01", "2024-01-01", "2024-01-01", "2024-02-01"]
+                ),
+                "gender": ["girl", "girl", "boy", "boy"],
+                "count": [5, 4, 3, 3],
+                "SUM(num)": [50.0, np.nan, 10.0, 30.0],
+                "MAX(num)": [50.0, 40.0, 20.0, np.nan],
+            }
+        ),
+    )
+
+
+def test_roll_up_truncated(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that results truncated by their row limit are not rolled up.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": True})
+    daily = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            "gender": ["boy", "boy"],
+            "count": [1, 2],
+            "SUM(num)": [10, 20],
+            "MAX(num)": [10, 20],
+        }
+    )
+    set_query_result(
+        datasource,
+        get_query_object(datasource, "P1D", row_limit=2),
+        daily,
+    )
+
+    monthly_rollup = QueryRollup.from_query_object(
+        datasource,
+        get_query_object(datasource, "P1M", row_limit=2),
+    )
+    assert monthly_rollup.get_query_result() is None
+
+
+def test_roll_up_missing_filters(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that filters missing from the finer query are applied to its rows.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": True})
+    daily = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "gender": ["boy", "girl", None],
+            "count": [1, 2, 3],
+            "SUM(num)": [10, 20, 30],
+            "MAX(num)": [10, 20, 30],
+        }
+    )
+    set_query_result(
+        datasource,
+        get_query_object(datasource, "P1D"),
+        daily,
+        applied_filter_columns=[],
+    )
+
+    monthly_rollup = QueryRollup.from_query_object(
+        datasource,
+        get_query_object(
+            datasource,
+            "P1M",
+            filters=[{"col": "gender", "op": "!=", "val": "girl"}],
+        ),
+    )
+    result = monthly_rollup.get_query_result()
+
+    assert result.applied_filter_columns == ["gender"]
+    assert_frame_equal(
+        result.df,
+        pd.DataFrame(
+            {
+                "ds": pd.to_datetime(["2024-01-01"]),
+                "gender": ["boy"],
+                "count": [1],
+                "SUM(num)": [10],
+                "MAX(num)": [10],
+            }
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        # not a dimension of the query
+        [{"col": "state", "op": "==", "val": "CA"}],
+        # compared to a value of another type
+        [{"col": "gender", "op": "==", "val": 1}],
+        # strings are ordered by the collation of the database
+        [{"col": "gender", "op": ">", "val": "boy"}],
+        [{"col": "gender", "op": "LIKE", "val": "b%"}],
+    ],
+)
+def test_roll_up_other_filters(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+    filters: list[dict[str, Any]],
+) -> None:
+    """
+    Test that results of queries missing filters that can't be applied again are not
+    rolled up.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": True})
+    daily = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            "gender": ["boy", "boy"],
+            "count": [1, 2],
+            "SUM(num)": [10, 20],
+            "MAX(num)": [10, 20],
+        }
+    )
+    set_query_result(datasource, get_query_object(datasource, "P1D"), daily)
+
+    monthly_rollup = QueryRollup.from_query_object(
+        datasource,
+        get_query_object(datasource, "P1M", filters=filters),
+    )
+    assert monthly_rollup.get_query_result() is None
+
+
+def test_roll_up_virtual_dataset(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: MagicMock,
+    data_cache: dict[str, dict],
+) -> None:
+    """
+    Test that filters are never applied again for virtual datasets.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_ROLLUP_ENABLED": True})
+    datasource.sql = "SELECT * FROM t WHERE {{ filter_values('gender') }}"
+    daily = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            "gender": ["boy", "girl"],
+            "count": [1, 2],
+            "SUM(num)": [10, 20],
+            "MAX(num)": [10, 20],
+        }
+    )
+    set_query_result(datasource, get_query_object(datasource, "P1D"), daily)
+
+    monthly_rollup = QueryRollup.from_query_object(
+        datasource,
+        get_query_object(
+            datasource,
+            "P1M",
+            filters=[{"col": "gender", "op": "==", "val": "boy"}],
+        ),
+    )
+    assert monthly_rollup.get_query_result() is None
+
+
+@pytest.mark.parametrize(
+    "filter_, expected",
+    [
+        ({"col": "name", "op": "==", "val": "a"}, [True, False, False]),
+        ({"col": "name", "op": "!=", "val": "a"}, [False, True, False]),
+        ({"col": "name", "op": "NOT IN", "val": ["b"]}, [True, False, False]),
+        ({"col": "name", "op": "IS NULL"}, [False, False, True]),
+        ({"col": "num", "op": ">=", "val": 2}, [False, True, False]),
+        ({"col": "num", "op": "IN", "val": [1, 3.5]}, [True, False, False]),
+        ({"col": "flag", "op": "==", "val": True}, [True, False, True]),
+        ({"col": "num", "op": "==", "val": "1"}, None),
+        ({"col": "name", "op": "<", "val": "b"}, None),
+        ({"col": "name", "op": "IN", "val": []}, None),
+        ({"col": "name", "op": "IN", "val": ["a", None]}, None),
+        ({"col": "ds", "op": "==", "val": "2024-01-01"}, None),
+        ({"col": "missing", "op": "==", "val": "a"}, None),
+    ],
+)
+def test_get_filter_mask(
+    filter_: dict[str, Any],
+    expected: list[bool] | None,
+) -> None:
+    """
+    Test that filters are applied like the database would, or not at all.
+    """
+    df = pd.DataFrame(
+        {
+            "name": ["a", "b", None],
+            "num": [1.0, 2.0, np.nan],
+            "flag": [True, False, True],
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+        }
+    )
+    mask = get_filter_mask(df, filter_)
+    if expected is None:
+        assert mask is None
+    else:
+        assert mask.tolist() == expected
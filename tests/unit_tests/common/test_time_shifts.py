@@ -14,13 +14,15 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from pandas import DataFrame, Series, Timestamp
+import numpy as np
+from pandas import DataFrame, date_range, Series, Timestamp
 from pandas.testing import assert_frame_equal
 from pytest import fixture, mark  # noqa: PT013
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
 from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.utils.dataframe_utils import get_time_grain_join_keys
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import TimeGrain
 from superset.models.helpers import ExploreMixin
@@ -209,3 +211,109 @@ def test_join_offset_dfs_with_month_granularity():
     )
 
     assert_frame_equal(expected, result)
+
+
+@mark.parametrize(
+    "time_grain",
+    [
+        TimeGrain.DAY,
+        TimeGrain.WEEK,
+        TimeGrain.WEEK_STARTING_SUNDAY,
+        TimeGrain.MONTH,
+        TimeGrain.QUARTER,
+        TimeGrain.YEAR,
+    ],
+)
+def test_get_time_grain_join_keys(time_grain: str):
+    """
+    Test that the vectorized join keys group values like the join column does.
+    """
+    df = DataFrame({"ds": date_range("2019-12-20", "2022-01-10", freq="D")})
+    for time_offset in (None, "1 year ago", "2 weeks later"):
+        keys = get_time_grain_join_keys(df["ds"], time_grain, time_offset)
+        query_context_processor.add_offset_join_column(
+            df,
+            "join_column",
+            time_grain,
+            time_offset,
+        )
+        # each key matches a single join column value, and vice versa
+        assert (
+            DataFrame({"key": keys, "join_column": df["join_column"]})
+            .drop_duplicates()
+            .shape[0]
+            == keys.nunique()
+            == df["join_column"].nunique()
+        )
+        df = df.drop(columns=["join_column"])
+
+
+def test_join_offset_dfs_with_datetime_offsets():
+    """
+    Test that offsets are joined on the time grain and the other join keys, and that
+    empty offsets are joined as nulls.
+    """
+    df = DataFrame(
+        {
+            "ds": [Timestamp("2021-01-01")] * 2 + [Timestamp("2021-02-01")] * 2,
+            "gender": ["boy", "girl", "boy", "girl"],
+            "count": [1, 2, 3, 4],
+        }
+    )
+    offset_dfs = {
+        "1 month ago": DataFrame(
+            {
+                "ds": [Timestamp("2021-01-15"), Timestamp("2020-12-15")],
+                "gender": ["girl", "boy"],
+                "count__1 month ago": [5, 6],
+            }
+        ),
+        "1 year ago": DataFrame(
+            {"ds": [np.nan], "gender": [np.nan], "count__1 year ago": [np.nan]}
+        ),
+    }
+
+    expected = DataFrame(
+        {
+            "ds": [Timestamp("2021-01-01")] * 2 + [Timestamp("2021-02-01")] * 2,
+            "gender": ["boy", "girl", "boy", "girl"],
+            "count": [1, 2, 3, 4],
+            "count__1 month ago": [6, None, None, 5],
+            "count__1 year ago": [None, None, None, None],
+        }
+    )
+
+    result = query_context_processor.join_offset_dfs(
+        df, offset_dfs, TimeGrain.MONTH, ["ds", "gender"]
+    )
+
+    assert_frame_equal(expected, result, check_dtype=False)
+
+
+def test_join_offset_dfs_with_duplicate_datetime_offsets():
+    """
+    Test that offsets with several rows per join key are still merged.
+    """
+    df = DataFrame({"ds": [Timestamp("2021-02-01")], "count": [1]})
+    offset_dfs = {
+        "1 month ago": DataFrame(
+            {
+                "ds": [Timestamp("2021-01-01"), Timestamp("2021-01-15")],
+                "count__1 month ago": [5, 6],
+            }
+        ),
+    }
+
+    expected = DataFrame(
+        {
+            "ds": [Timestamp("2021-02-01")] * 2,
+            "count": [1, 1],
+            "count__1 month ago": [5, 6],
+        }
+    )
+
+    result = query_context_processor.join_offset_dfs(
+        df, offset_dfs, TimeGrain.MONTH, ["ds"]
+    )
+
+    assert_frame_equal(expected, result)
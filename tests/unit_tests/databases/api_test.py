@@ -2274,3 +2274,27 @@ def test_schemas_with_oauth2(
             }
         ]
     }
+
+
+def test_delete_partitions_cache(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that the cached latest partitions of a database can be invalidated.
+    """
+    from superset.databases.api import DatabaseRestApi
+
+    database = mocker.MagicMock()
+    datamodel = mocker.patch.object(DatabaseRestApi, "datamodel")
+    datamodel.get.return_value = database
+    invalidate_partitions = mocker.patch("superset.databases.api.invalidate_partitions")
+
+    response = client.delete("/api/v1/database/1/partitions_cache/")
+    assert response.status_code == 200
+    invalidate_partitions.assert_called_once_with(database)
+
+    datamodel.get.return_value = None
+    response = client.delete("/api/v1/database/2/partitions_cache/")
+    assert response.status_code == 404
@@ -16,13 +16,17 @@
 # under the License.
 # pylint: disable=unused-argument, import-outside-toplevel
 from datetime import datetime
+from decimal import Decimal
 
+import numpy as np
+import pandas as pd
 import pytest
 from pandas import Timestamp
 from pandas._libs.tslibs import NaT
 
-from superset.dataframe import df_to_records
+from superset.dataframe import df_to_columnar, df_to_records
 from superset.superset_typing import DbapiDescription
+from superset.utils import json
 
 
 def test_df_to_records() -> None:
@@ -158,6 +162,85 @@ def test_js_max_int() -> None:
     ]
 
 
+def test_js_max_int_nullable() -> None:
+    from superset.db_engine_specs import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, 1239162456494753670), (2, None)]
+    cursor_descr: DbapiDescription = [
+        ("a", "int", None, None, None, None, False),
+        ("b", "int", None, None, None, None, False),
+    ]
+    results = SupersetResultSet(data, cursor_descr, BaseEngineSpec)
+    df = results.to_pandas_df()
+
+    assert df_to_records(df) == [
+        {"a": 1, "b": "1239162456494753670"},
+        {"a": 2, "b": None},
+    ]
+
+
+def test_df_to_columnar() -> None:
+    """
+    Test that the columnar payload encodes like the records of the dataframe.
+    """
+    df = pd.DataFrame(
+        {
+            "ts": pd.to_datetime(["2023-01-06 20:50:31.749", None]),
+            "tz": pd.to_datetime(["2023-01-06 20:50:31", None]).tz_localize(
+                "America/New_York"
+            ),
+            "int": [1, 2],
+            "float": [1.5, np.nan],
+            "str": ["a", None],
+            "obj": [Decimal("1.1"), None],
+            "bool": [True, False],
+        }
+    )
+
+    payload = df_to_columnar(df)
+
+    assert payload == {
+        "columns": ["ts", "tz", "int", "float", "str", "obj", "bool"],
+        "data": [
+            [1673038231749.0, 1673038231000.0, 1, 1.5, "a", Decimal("1.1"), True],
+            [None, None, 2, None, None, None, False],
+        ],
+    }
+    records = json.loads(
+        json.dumps(df.to_dict(orient="records"), default=json.json_int_dttm_ser)
+    )
+    assert json.loads(json.dumps(payload["data"], default=json.json_int_dttm_ser)) == [
+        list(record.values()) for record in records
+    ]
+
+
+def test_df_to_columnar_big_integers() -> None:
+    """
+    Test that integers larger than JS_MAX_INTEGER are encoded as strings.
+    """
+    df = pd.DataFrame(
+        {
+            "a": [2**60, 1],
+            "b": [-(2**63), 1],
+            "c": pd.array([2**60, None], dtype="Int64"),
+            "d": [2**70, "x"],
+            "e": [1, 2],
+        }
+    )
+
+    assert df_to_columnar(df) == {
+        "columns": ["a", "b", "c", "d", "e"],
+        "data": [
+            [str(2**60), str(-(2**63)), str(2**60), str(2**70), 1],
+            [1, 1, None, "x", 2],
+        ],
+    }
+    assert df_to_records(df) == [
+        dict(zip(df.columns, row, strict=True)) for row in df_to_columnar(df)["data"]
+    ]
+
+
 @pytest.mark.parametrize(
     "input_, expected",
     [
@@ -163,3 +163,33 @@ def test_column_type_recognition() -> None:
     col_spec = DuckDBEngineSpec.get_column_spec("TINYINT")
     # TINYINT matches the pattern "^int" so it should be recognized
     assert col_spec is None, "TINYINT doesn't match any patterns"
+
+
+def test_fetch_arrow() -> None:
+    """
+    Test that results are fetched natively as Arrow and keep the description.
+    """
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    engine = create_engine("duckdb:///:memory:")
+    connection = engine.raw_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT 1 AS a, 'x' AS b, [1, 2] AS c")
+    description = cursor.description
+
+    table = DuckDBEngineSpec.fetch_arrow(cursor)
+    assert cursor.description == description
+
+    result_set = SupersetResultSet(table, description, DuckDBEngineSpec)
+    assert result_set.to_pandas_df().to_dict(orient="records") == [
+        {"a": 1, "b": "x", "c": "[1, 2]"},
+    ]
+    assert [column["type"] for column in result_set.columns] == [
+        "INT",
+        "STRING",
+        "STRING",
+    ]
+    connection.close()
@@ -0,0 +1,154 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name
+
+from unittest.mock import MagicMock
+
+import pytest
+from cachelib import SimpleCache
+from flask_caching.backends import NullCache
+from pytest_mock import MockerFixture
+
+from superset.db_engine_specs.partition_cache import (
+    get_cached_partition,
+    invalidate_partitions,
+    LOCK_PREFIX,
+)
+from superset.sql.parse import Table
+
+
+@pytest.fixture
+def data_cache(mocker: MockerFixture) -> MagicMock:
+    """
+    Replace the data cache with an in-memory cache.
+    """
+    cache = SimpleCache()
+    data_cache = mocker.MagicMock(wraps=cache)
+    data_cache.cache = cache
+    mocker.patch(
+        "superset.db_engine_specs.partition_cache.cache_manager",
+        data_cache=data_cache,
+    )
+    return data_cache
+
+
+def test_get_cached_partition(
+    app_context: None,
+    mocker: MockerFixture,
+    data_cache: MagicMock,
+) -> None:
+    """
+    Test that the latest partition of a table is looked up once until invalidated.
+    """
+    database = mocker.MagicMock(id=1, partition_cache_timeout=60)
+    get_partition = mocker.MagicMock(return_value=(["ds"], None))
+
+    for _ in range(2):
+        assert get_cached_partition(
+            database,
+            Table("table", "schema"),
+            get_partition,
+            show_first=True,
+        ) == (["ds"], None)
+    get_partition.assert_called_once()
+
+    # the lock is taken and released in the data cache
+    data_cache.delete.assert_called_once()
+    lock_key = data_cache.delete.call_args.args[0]
+    assert lock_key.startswith(LOCK_PREFIX)
+    assert not data_cache.has(lock_key)
+
+    # other tables and arguments are cached separately
+    get_cached_partition(database, Table("other", "schema"), get_partition)
+    get_cached_partition(database, Table("table", "schema"), get_partition)
+    assert get_partition.call_count == 3
+
+    invalidate_partitions(database)
+    get_cached_partition(
+        database,
+        Table("table", "schema"),
+        get_partition,
+        show_first=True,
+    )
+    assert get_partition.call_count == 4
+
+
+@pytest.mark.parametrize(
+    "database_id,timeout,cache",
+    [
+        (1, None, SimpleCache()),
+        (None, 60, SimpleCache()),
+        (1, 60, NullCache()),
+    ],
+)
+def test_get_cached_partition_disabled(
+    app_context: None,
+    mocker: MockerFixture,
+    data_cache: MagicMock,
+    database_id: int | None,
+    timeout: int | None,
+    cache: SimpleCache | NullCache,
+) -> None:
+    """
+    Test that partitions aren't cached without a timeout, database ID or data cache.
+    """
+    data_cache.cache = cache
+    database = mocker.MagicMock(id=database_id, partition_cache_timeout=timeout)
+    get_partition = mocker.MagicMock(return_value="2024-01-01")
+
+    for _ in range(2):
+        assert (
+            get_cached_partition(database, Table("table"), get_partition)
+            == "2024-01-01"
+        )
+    assert get_partition.call_count == 2
+    data_cache.delete.assert_not_called()
+
+
+def test_get_cached_partition_in_flight(
+    app_context: None,
+    mocker: MockerFixture,
+    data_cache: MagicMock,
+) -> None:
+    """
+    Test that concurrent lookups wait for the partition being looked up.
+    """
+    mocker.patch("superset.db_engine_specs.partition_cache.time.sleep")
+    cache = data_cache.cache
+
+    # another worker holds the lock
+    data_cache.add.side_effect = lambda key, *args, **kwargs: (
+        not key.startswith(LOCK_PREFIX) and cache.add(key, *args, **kwargs)
+    )
+    data_cache.has.return_value = True
+    database = mocker.MagicMock(id=1, partition_cache_timeout=60)
+    get_partition = mocker.MagicMock(return_value="2024-01-01")
+
+    # the partition shows up in the cache while waiting
+    original_get = data_cache.get.side_effect
+    data_cache.get.side_effect = [None, None, None, ("2024-01-02",)]
+    assert get_cached_partition(database, Table("table"), get_partition) == "2024-01-02"
+    get_partition.assert_not_called()
+
+    # the lock is released without a partition
+    data_cache.get.side_effect = original_get
+    data_cache.has.return_value = False
+    assert get_cached_partition(database, Table("table"), get_partition) == (
+        "2024-01-01"
+    )
+    get_partition.assert_called_once()
+    data_cache.delete.assert_not_called()
@@ -21,11 +21,17 @@ from typing import Any, Optional
 import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy import column, types
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.engine.url import make_url
 
-from superset.db_engine_specs.postgres import PostgresEngineSpec as spec  # noqa: N813
+from superset.db_engine_specs.cockroachdb import CockroachDbEngineSpec
+from superset.db_engine_specs.postgres import (
+    copy_from_stdin,
+    PostgresEngineSpec,
+    PostgresEngineSpec as spec,  # noqa: N813
+)
 from superset.exceptions import SupersetSecurityException
 from superset.sql.parse import Table
 from superset.utils.core import GenericDataType
@@ -280,3 +286,53 @@ SELECT * \nFROM my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+@pytest.mark.parametrize(
+    "engine_spec,driver,expected",
+    [
+        (spec, "psycopg2", copy_from_stdin),
+        (spec, "pg8000", "multi"),
+        (CockroachDbEngineSpec, "psycopg2", "multi"),
+    ],
+)
+def test_get_to_sql_method(
+    mocker: MockerFixture,
+    engine_spec: type[PostgresEngineSpec],
+    driver: str,
+    expected: Any,
+) -> None:
+    """
+    Test that files are uploaded with `COPY` to Postgres with psycopg2 only.
+    """
+    engine = mocker.MagicMock()
+    engine.dialect.driver = driver
+
+    assert engine_spec.get_to_sql_method(engine) == expected
+
+
+def test_copy_from_stdin(mocker: MockerFixture) -> None:
+    """
+    Test that rows are sent as CSV to `COPY ... FROM STDIN`.
+    """
+    table = mocker.MagicMock()
+    table.schema = "my_schema"
+    table.name = "my table"
+    connection = mocker.MagicMock()
+    connection.dialect = postgresql.dialect()
+    cursor = connection.connection.cursor.return_value.__enter__.return_value
+    cursor.rowcount = 2
+
+    rows = copy_from_stdin(
+        table,
+        connection,
+        ["name", "value"],
+        iter([("a", 1.5), ("b, c", None)]),
+    )
+
+    assert rows == 2
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql == (
+        'COPY my_schema."my table" (name, value) FROM STDIN WITH (FORMAT csv)'
+    )
+    assert buffer.read() == 'a,1.5\r\n"b, c",\r\n'
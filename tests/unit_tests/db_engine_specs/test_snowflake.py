@@ -438,3 +438,68 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+class NotSupportedError(Exception):
+    """Stand-in for the error raised by the connector for non-Arrow results"""
+
+
+@pytest.fixture
+def snowflake_errors(mocker: MockerFixture) -> None:
+    errors = mocker.MagicMock(NotSupportedError=NotSupportedError)
+    mocker.patch.dict(
+        "sys.modules",
+        {
+            "snowflake": mocker.MagicMock(),
+            "snowflake.connector": mocker.MagicMock(errors=errors),
+            "snowflake.connector.errors": errors,
+        },
+    )
+
+
+def test_fetch_arrow(mocker: MockerFixture, snowflake_errors: None) -> None:
+    """
+    Test that results are fetched as an Arrow table, in batches until the limit is
+    reached when there's a limit.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+
+    table = pa.table({"a": [1, 2, 3]})
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_all.return_value = table
+    assert SnowflakeEngineSpec.fetch_arrow(cursor) == table
+
+    fetched = []
+
+    def fetch_arrow_batches():
+        for batch in (pa.table({"a": [1, 2]}), pa.table({"a": [3, 4]}), None):
+            fetched.append(batch)
+            yield batch
+
+    cursor.fetch_arrow_batches.side_effect = fetch_arrow_batches
+    result = SnowflakeEngineSpec.fetch_arrow(cursor, limit=3)
+    assert result is not None
+    assert result.column("a").to_pylist() == [1, 2, 3]
+    assert len(fetched) == 2
+
+    cursor.fetch_arrow_batches.side_effect = lambda: iter([])
+    assert SnowflakeEngineSpec.fetch_arrow(cursor, limit=3) is None
+
+
+def test_fetch_arrow_not_supported(
+    mocker: MockerFixture,
+    snowflake_errors: None,
+) -> None:
+    """
+    Test that results that aren't in the Arrow format are left to ``fetch_data``.
+    """
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_all.side_effect = NotSupportedError()
+    cursor.fetch_arrow_batches.side_effect = NotSupportedError()
+
+    assert SnowflakeEngineSpec.fetch_arrow(cursor) is None
+    assert SnowflakeEngineSpec.fetch_arrow(cursor, limit=10) is None
@@ -17,6 +17,7 @@
 # pylint: disable=invalid-name, unused-argument
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
@@ -27,7 +28,7 @@ from freezegun import freeze_time
 from jinja2 import DebugUndefined
 from jinja2.sandbox import SandboxedEnvironment
 from pytest_mock import MockerFixture
-from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.dialects.postgresql import dialect
 
 from superset.commands.dataset.exceptions import DatasetNotFoundError
@@ -42,6 +43,7 @@ from superset.jinja_context import (
     dataset_macro,
     ExtraCache,
     get_template_processor,
+    JinjaTemplateProcessor,
     metric_macro,
     safe_proxy,
     TimeFilter,
@@ -1562,9 +1564,9 @@ def test_jinja2_undefined_error_handling(mocker: MockerFixture) -> None:
     processor = BaseTemplateProcessor(database=database)
     template = "SELECT * FROM table"
 
-    # Mock the Environment.from_string to raise UndefinedError
+    # Mock the template compilation to raise UndefinedError
     with patch.object(
-        processor.env, "from_string", side_effect=UndefinedError("Variable not defined")
+        processor, "get_template", side_effect=UndefinedError("Variable not defined")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1595,9 +1597,9 @@ def test_jinja2_security_error_handling(mocker: MockerFixture) -> None:
     processor = BaseTemplateProcessor(database=database)
     template = "SELECT * FROM table"
 
-    # Mock the Environment.from_string to raise SecurityError
+    # Mock the template compilation to raise SecurityError
     with patch.object(
-        processor.env, "from_string", side_effect=SecurityError("Access denied")
+        processor, "get_template", side_effect=SecurityError("Access denied")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1626,9 +1628,9 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
     processor = BaseTemplateProcessor(database=database)
     template = "SELECT * FROM table"
 
-    # Mock the Environment.from_string to raise MemoryError (server error)
+    # Mock the template compilation to raise MemoryError (server error)
     with patch.object(
-        processor.env, "from_string", side_effect=MemoryError("Out of memory")
+        processor, "get_template", side_effect=MemoryError("Out of memory")
     ):
         with pytest.raises(SupersetTemplateException) as exc_info:
             processor.process_template(template)
@@ -1693,3 +1695,49 @@ def test_undefined_template_variable_not_function(mocker: MockerFixture) -> None
     template = "SELECT {{ undefined_variable.some_method() }}"
     with pytest.raises(UndefinedError):
         processor.process_template(template)
+
+
+def test_compiled_template_cache(mocker: MockerFixture) -> None:
+    """
+    Test that templates are compiled once per processor class and dialect.
+    """
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(
+        current_app.config,
+        {"JINJA_TEMPLATE_CACHE_SIZE": 2, "STATS_LOGGER": stats_logger},
+    )
+    mocker.patch("superset.jinja_context._compiled_templates", OrderedDict())
+    mysql_database = mocker.MagicMock()
+    mysql_database.get_dialect.return_value = mysql.dialect()
+    sqlite_database = mocker.MagicMock()
+    sqlite_database.get_dialect.return_value = sqlite.dialect()
+    sql = "SELECT * FROM t WHERE a IN {{ ['a\\\\b'] | where_in }}"
+
+    processor = JinjaTemplateProcessor(database=mysql_database)
+    compile_ = mocker.spy(processor.env, "compile")
+    assert processor.process_template(sql) == "SELECT * FROM t WHERE a IN ('a\\\\b')"
+    assert compile_.call_count == 1
+
+    processor = JinjaTemplateProcessor(database=mysql_database)
+    compile_ = mocker.spy(processor.env, "compile")
+    assert processor.process_template(sql) == "SELECT * FROM t WHERE a IN ('a\\\\b')"
+    assert compile_.call_count == 0
+    stats_logger.incr.assert_has_calls(
+        [
+            mocker.call("jinja_template_cache.miss"),
+            mocker.call("jinja_template_cache.hit"),
+        ]
+    )
+
+    # filters with constant arguments are evaluated at compile time
+    processor = JinjaTemplateProcessor(database=sqlite_database)
+    compile_ = mocker.spy(processor.env, "compile")
+    assert processor.process_template(sql) == "SELECT * FROM t WHERE a IN ('a\\b')"
+    assert compile_.call_count == 1
+
+    # the least recently used template is evicted
+    processor.process_template("SELECT 1")
+    processor = JinjaTemplateProcessor(database=mysql_database)
+    compile_ = mocker.spy(processor.env, "compile")
+    processor.process_template(sql)
+    assert compile_.call_count == 1
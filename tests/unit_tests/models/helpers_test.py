@@ -20,7 +20,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
@@ -1703,3 +1703,126 @@ def test_adhoc_column_with_spaces_in_full_query(database: Database) -> None:
     # Verify SELECT and FROM clauses are present
     assert "SELECT" in sql
     assert "FROM" in sql
+
+
+def test_processing_time_offsets_concurrent(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the queries of the time offsets run concurrently, and that results are
+    joined in the order of the offsets.
+    """
+    import threading
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    import pandas as pd
+
+    from superset.common.query_object import QueryObject
+    from superset.models.helpers import ExploreMixin, QueryResult
+
+    mocker.patch.dict("flask.current_app.config", {"CHART_DATA_MAX_WORKERS": 2})
+    datasource = MagicMock()
+    for name in (
+        "processing_time_offsets",
+        "is_valid_date",
+        "is_valid_date_range",
+        "get_offset_custom_or_inherit",
+    ):
+        setattr(datasource, name, getattr(ExploreMixin, name).__get__(datasource))
+    datasource.get_time_grain = ExploreMixin.get_time_grain
+    datasource.normalize_df.side_effect = lambda df, query_object: df
+    datasource.join_offset_dfs.side_effect = lambda df, offset_dfs, *args: pd.concat(
+        [df, *offset_dfs.values()],
+        axis=1,
+    )
+
+    # each query waits for the other one, so they fail unless run concurrently
+    barrier = threading.Barrier(2, timeout=5)
+
+    def query(query_obj: dict[str, Any]) -> QueryResult:
+        barrier.wait()
+        year = query_obj["from_dttm"].year
+        return QueryResult(
+            df=pd.DataFrame({"count": [year]}),
+            query=f"SELECT {year}",
+            duration=timedelta(0),
+        )
+
+    datasource.query.side_effect = query
+    query_object = QueryObject(
+        datasource=datasource,
+        columns=[],
+        metrics=["count"],
+        time_range="2024-01-01 : 2024-02-01",
+        time_offsets=["1 year ago", "2 years ago"],
+    )
+
+    result = datasource.processing_time_offsets(
+        pd.DataFrame({"count": [10]}),
+        query_object,
+    )
+
+    assert result["queries"] == ["SELECT 2023", "SELECT 2022"]
+    assert result["cache_keys"] == [None, None]
+    assert result["df"].to_dict(orient="records") == [
+        {"count": 10, "count__1 year ago": 2023, "count__2 years ago": 2022},
+    ]
+
+
+def test_processing_time_offsets_cache_codec(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the results of the time offsets are cached with the data cache codec.
+    """
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    import pandas as pd
+
+    from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_codec import CODEC_KEY, decode_cache_value
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.models.helpers import ExploreMixin, QueryResult
+
+    mocker.patch.dict("flask.current_app.config", {"DATA_CACHE_CODEC": "arrow"})
+    cache_set = mocker.patch.object(QueryCacheManager, "set")
+    datasource = MagicMock()
+    for name in (
+        "processing_time_offsets",
+        "is_valid_date",
+        "is_valid_date_range",
+        "get_offset_custom_or_inherit",
+    ):
+        setattr(datasource, name, getattr(ExploreMixin, name).__get__(datasource))
+    datasource.get_time_grain = ExploreMixin.get_time_grain
+    datasource.normalize_df.side_effect = lambda df, query_object: df
+    datasource.query.return_value = QueryResult(
+        df=pd.DataFrame({"count": [2023]}),
+        query="SELECT 2023",
+        duration=timedelta(0),
+    )
+    query_object = QueryObject(
+        datasource=datasource,
+        columns=[],
+        metrics=["count"],
+        time_range="2024-01-01 : 2024-02-01",
+        time_offsets=["1 year ago"],
+    )
+
+    datasource.processing_time_offsets(
+        pd.DataFrame({"count": [10]}),
+        query_object,
+        cache_key_fn=lambda *args: "key",
+        cache_timeout_fn=lambda: 60,
+    )
+
+    value = cache_set.call_args.kwargs["value"]
+    assert value[CODEC_KEY] == "arrow"
+    assert isinstance(value["df"], bytes)
+    assert decode_cache_value(value)["df"].to_dict(orient="records") == [
+        {"count__1 year ago": 2023},
+    ]
@@ -0,0 +1,236 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import warnings
+from typing import Any
+
+import pytest
+from pandas.errors import SettingWithCopyWarning
+from pandas.testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing as pp
+from superset.utils.pandas_postprocessing.pipeline import (
+    FusedPostProcessingStep,
+    PostProcessingPipeline,
+)
+from tests.unit_tests.fixtures.dataframes import single_metric_df
+
+POST_PROCESSING: list[dict[str, Any]] = [
+    {
+        "operation": "pivot",
+        "options": {
+            "index": ["dttm"],
+            "columns": ["country"],
+            "aggregates": {"sum_metric": {"operator": "sum"}},
+        },
+    },
+    {"operation": "flatten"},
+    {
+        "operation": "rolling",
+        "options": {
+            "rolling_type": "sum",
+            "window": 2,
+            "min_periods": 0,
+            "columns": {"sum_metric, UK": "sum_metric, UK"},
+        },
+    },
+    {
+        "operation": "rename",
+        "options": {"columns": {"sum_metric, UK": "UK"}},
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "post_processing,error",
+    [
+        ([{"options": {}}], "`operation` property of post processing object"),
+        ([{"operation": "unknown"}], "Unsupported post processing operation"),
+        ([{"operation": "escape_separator"}], "Unsupported post processing"),
+        ([{"operation": "sort", "options": {"foo": "bar"}}], "Invalid options"),
+    ],
+)
+def test_from_post_processing_invalid(
+    mocker: MockerFixture,
+    post_processing: list[dict[str, Any]],
+    error: str,
+) -> None:
+    """
+    Test that every operation is validated before any of them runs.
+    """
+    pivot = mocker.patch.object(pp, "pivot")
+
+    with pytest.raises(InvalidPostProcessingError, match=error):
+        PostProcessingPipeline.from_post_processing(
+            [POST_PROCESSING[0], *post_processing]
+        )
+    pivot.assert_not_called()
+
+
+def test_run(app_context: None) -> None:
+    """
+    Test that the pipeline matches running the operations one after another,
+    without modifying the dataframe it's given.
+    """
+    df = single_metric_df.copy()
+    expected = df
+    for post_process in POST_PROCESSING:
+        expected = getattr(pp, post_process["operation"])(
+            expected,
+            **post_process.get("options", {}),
+        )
+
+    result = PostProcessingPipeline.from_post_processing(POST_PROCESSING).run(df)
+
+    assert_frame_equal(result, expected)
+    assert result.columns.tolist() == ["dttm", "UK", "sum_metric, US"]
+    assert_frame_equal(df, single_metric_df)
+
+
+def test_run_inplace(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that operations modify the result of the previous operation in place, but
+    not the dataframe returned by the query nor a shallow copy of it.
+    """
+    log_context = mocker.patch(
+        "superset.utils.pandas_postprocessing.pipeline.event_logger.log_context"
+    )
+    df = single_metric_df.copy()
+    rolling = {
+        "operation": "rolling",
+        "options": {
+            "rolling_type": "sum",
+            "window": 2,
+            "min_periods": 0,
+            "columns": {"sum_metric": "sum_metric"},
+        },
+    }
+    PostProcessingPipeline.from_post_processing(
+        [
+            {"operation": "select", "options": {"columns": ["dttm", "sum_metric"]}},
+            rolling,
+            {"operation": "rename", "options": {"columns": {"sum_metric": "total"}}},
+        ]
+    ).run(df)
+    assert_frame_equal(df, single_metric_df)
+
+    logged = [call.args[0] for call in log_context.call_args_list]
+    assert logged == [
+        "post_processing.select",
+        "post_processing.rolling+rename",
+    ]
+    log = log_context.return_value.__enter__.return_value
+    assert [call.kwargs["inplace"] for call in log.call_args_list] == [
+        False,
+        False,
+    ]
+
+
+def test_run_slice(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the slice returned by a rolling window with `min_periods` isn't
+    modified in place by the next operation.
+    """
+    log_context = mocker.patch(
+        "superset.utils.pandas_postprocessing.pipeline.event_logger.log_context"
+    )
+    post_processing: list[dict[str, Any]] = [
+        *POST_PROCESSING[:2],
+        {
+            "operation": "rolling",
+            "options": {
+                "rolling_type": "sum",
+                "window": 2,
+                "min_periods": 2,
+                "columns": {"sum_metric, UK": "sum_metric, UK"},
+            },
+        },
+        {
+            "operation": "cum",
+            "options": {"operator": "sum", "columns": {"sum_metric, US": "US"}},
+        },
+    ]
+    expected = single_metric_df
+    for post_process in post_processing:
+        expected = getattr(pp, post_process["operation"])(
+            expected,
+            **post_process.get("options", {}),
+        )
+
+    pipeline = PostProcessingPipeline.from_post_processing(post_processing)
+    assert [step.returns_view for step in pipeline.steps] == [False, True, False]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SettingWithCopyWarning)
+        result = pipeline.run(single_metric_df.copy())
+
+    assert_frame_equal(result, expected)
+    log = log_context.return_value.__enter__.return_value
+    assert [call.kwargs["inplace"] for call in log.call_args_list] == [
+        False,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "renames,folded",
+    [
+        ({"sum_metric_avg": "avg"}, True),
+        ({"sum_metric_avg": "avg", "dttm": "time"}, False),
+        ({"sum_metric_avg": "sum_metric"}, False),
+        ({"sum_metric_avg": "country"}, False),
+    ],
+)
+def test_run_rolling_rename(
+    app_context: None,
+    renames: dict[str, str],
+    folded: bool,
+) -> None:
+    """
+    Test that a rename of the columns added by a rolling window is folded into the
+    window, and that other renames run after it.
+    """
+    df = single_metric_df.copy()
+    rolling = {
+        "rolling_type": "mean",
+        "window": 2,
+        "min_periods": 1,
+        "columns": {"sum_metric": "sum_metric_avg"},
+    }
+    rename = {"columns": renames}
+    try:
+        expected = pp.rename(pp.rolling(df, **rolling), **rename)
+    except InvalidPostProcessingError:
+        expected = None
+
+    pipeline = PostProcessingPipeline.from_post_processing(
+        [
+            {"operation": "rolling", "options": rolling},
+            {"operation": "rename", "options": rename},
+        ]
+    )
+    (step,) = pipeline.steps
+    assert isinstance(step, FusedPostProcessingStep)
+    assert (step.fold(df) is not None) == folded
+
+    if expected is None:
+        with pytest.raises(InvalidPostProcessingError):
+            pipeline.run(df)
+    else:
+        assert_frame_equal(pipeline.run(df), expected)
+    assert_frame_equal(df, single_metric_df)
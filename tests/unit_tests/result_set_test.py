@@ -21,11 +21,16 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
 from superset.db_engine_specs.base import BaseEngineSpec
-from superset.result_set import stringify_values, SupersetResultSet
+from superset.result_set import (
+    stringify_column,
+    stringify_values,
+    SupersetResultSet,
+)
 from superset.superset_typing import DbapiResult
 
 
@@ -185,3 +190,114 @@ def test_get_column_description_from_empty_data_using_cursor_description(
     )
     assert any(col.get("column_name") == "__time" for col in result_set.columns)
     logger.exception.assert_not_called()
+
+
+def test_build_arrow_array_type_hint() -> None:
+    """
+    Test that type hints are used only when the values have the expected type.
+    """
+    assert (
+        SupersetResultSet.build_arrow_array(
+            ["a", None],
+            (pa.string(), str),
+        ).type
+        == pa.string()
+    )
+    assert (
+        SupersetResultSet.build_arrow_array(
+            [b"a", None],
+            (pa.string(), str),
+        ).type
+        == pa.binary()
+    )
+    assert (
+        SupersetResultSet.build_arrow_array(
+            [1, 2],
+            (pa.bool_(), bool),
+        ).type
+        == pa.int64()
+    )
+    assert (
+        SupersetResultSet.build_arrow_array(
+            [None, None],
+            (pa.string(), str),
+        ).type
+        == pa.null()
+    )
+
+
+def test_build_arrow_array_stringifies_failing_columns() -> None:
+    """
+    Test that only columns that can't be converted are serialized as strings.
+    """
+    data = [
+        (1, "a", [1, 2], {"a": 1}),
+        (2, "b", None, 3),
+        (3, None, None, None),
+    ]
+    description = [
+        ("id", "INT"),
+        ("name", "VARCHAR"),
+        ("array", "ARRAY"),
+        ("mixed", None),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.schema.types == [
+        pa.int64(),
+        pa.string(),
+        pa.string(),
+        pa.string(),
+    ]
+    assert result_set.pa_table.to_pydict() == {
+        "id": [1, 2, 3],
+        "name": ["a", "b", None],
+        "array": ["[1, 2]", None, None],
+        "mixed": ["{'a': 1}", "3", None],
+    }
+
+
+def test_stringify_column() -> None:
+    """
+    Test that null values are preserved when serializing a column.
+    """
+    assert stringify_column([None, [1], pd.NA, None, {"a": None}]).to_pylist() == [
+        None,
+        "[1]",
+        None,
+        None,
+        "{'a': None}",
+    ]
+    assert stringify_column([]).to_pylist() == []
+
+
+def test_arrow_table() -> None:
+    """
+    Test building a result set from a table fetched natively as Arrow.
+    """
+    table = pa.table(
+        {
+            "a": [1, 2],
+            "a_dup": pa.array(["x", "y"]).dictionary_encode(),
+            "nested": [[1], None],
+        }
+    )
+    description = [("a", "INT"), ("a", "VARCHAR"), ("nested", "ARRAY")]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.column_names == ["a", "a__1", "nested"]
+    assert result_set.pa_table.schema.types == [pa.int64(), pa.string(), pa.string()]
+    assert result_set.pa_table.to_pydict() == {
+        "a": [1, 2],
+        "a__1": ["x", "y"],
+        "nested": ["[1]", None],
+    }
+    assert [column["type"] for column in result_set.columns] == [
+        "INT",
+        "VARCHAR",
+        "ARRAY",
+    ]
+
+    # falls back to the table schema if the description doesn't match
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)  # type: ignore
+    assert result_set.pa_table.column_names == ["a", "a_dup", "nested"]
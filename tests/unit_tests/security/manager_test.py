@@ -20,8 +20,11 @@
 import json  # noqa: TID251
 
 import pytest
+from cachelib import SimpleCache
+from flask import g
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import Database, SqlaTable
@@ -30,6 +33,7 @@ from superset.extensions import appbuilder
 from superset.models.slice import Slice
 from superset.security.manager import (
     query_context_modified,
+    RLSFilterClause,
     SupersetSecurityManager,
 )
 from superset.sql.parse import Table
@@ -1186,3 +1190,330 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_cached_per_request(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the RLS filters of a set of roles and a table are queried once per
+    request.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    query_rls_filters = mocker.patch.object(
+        sm,
+        "_query_rls_filters",
+        return_value=[
+            RLSFilterClause(2, None, "b = 2"),
+            RLSFilterClause(1, "a", "a = 1"),
+        ],
+    )
+    mocker.patch.object(
+        sm,
+        "get_user_roles",
+        return_value=[Role(id=2, name="b"), Role(id=1, name="a")],
+    )
+    table = SqlaTable(id=1, table_name="t")
+
+    with override_user(User(id=1, username="test")):
+        assert [f.id for f in sm.get_rls_sorted(table)] == [1, 2]
+        assert [f.id for f in sm.get_rls_filters(table)] == [2, 1]
+        assert sm.get_rls_cache_key(table) == ["a = 1-a", "b = 2-"]
+
+    query_rls_filters.assert_called_once_with((1, 2), 1)
+
+
+def test_get_rls_filters_cached_across_requests(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the RLS filters are cached across requests until they're invalidated.
+    """
+    mocker.patch.dict("flask.current_app.config", {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    mocker.patch("superset.extensions.cache_manager._cache", SimpleCache())
+    sm = SupersetSecurityManager(appbuilder)
+    query_rls_filters = mocker.patch.object(
+        sm,
+        "_query_rls_filters",
+        return_value=[RLSFilterClause(1, None, "a = 1")],
+    )
+    mocker.patch.object(sm, "get_user_roles", return_value=[Role(id=1, name="a")])
+    table = SqlaTable(id=1, table_name="t")
+
+    with override_user(User(id=1, username="test")):
+        assert sm.get_rls_filters(table) == [RLSFilterClause(1, None, "a = 1")]
+        g.pop("_rls_filters")  # new request
+        assert sm.get_rls_filters(table) == [RLSFilterClause(1, None, "a = 1")]
+        assert query_rls_filters.call_count == 1
+
+        sm.invalidate_rls_filters()
+        assert sm.get_rls_filters(table) == [RLSFilterClause(1, None, "a = 1")]
+        assert query_rls_filters.call_count == 2
+
+
+def test_rls_filters_invalidated_on_commit(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the cached RLS filters are invalidated when changes to the filters or
+    their roles are committed.
+    """
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    invalidate_rls_filters = mocker.patch.object(
+        SupersetSecurityManager, "invalidate_rls_filters"
+    )
+    role = Role(name="a")
+    table = SqlaTable(
+        table_name="t",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="f",
+        filter_type="Regular",
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add(rls_filter)
+    session.commit()
+    invalidate_rls_filters.assert_called_once()
+
+    rls_filter.roles = []
+    session.flush()
+    session.rollback()
+    session.commit()
+    invalidate_rls_filters.assert_called_once()
+
+    role.row_level_security_filters.remove(rls_filter)
+    session.commit()
+    assert invalidate_rls_filters.call_count == 2
+
+
+@pytest.mark.parametrize("model", ["role", "table"])
+def test_rls_filters_invalidated_on_delete(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+    model: str,
+) -> None:
+    """
+    Test that the cached RLS filters are invalidated when a role or table of a filter
+    is deleted, along with its association to the filter.
+    """
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    role = Role(name="a")
+    table = SqlaTable(
+        table_name="t",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    session.add(
+        RowLevelSecurityFilter(
+            name="f",
+            filter_type="Regular",
+            clause="a = 1",
+            roles=[role],
+            tables=[table],
+        )
+    )
+    session.commit()
+    session.expire_all()
+
+    invalidate_rls_filters = mocker.patch.object(
+        SupersetSecurityManager, "invalidate_rls_filters"
+    )
+    session.delete(role if model == "role" else table)
+    session.commit()
+    invalidate_rls_filters.assert_called_once()
+
+
+def test_permission_index(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that permissions are checked against the cached index of the permissions of
+    the user roles, which is invalidated when the roles are changed.
+    """
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        ViewMenu,
+    )
+
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"PERMISSION_INDEX_CACHE_TIMEOUT": 60},
+    )
+    mocker.patch("superset.extensions.cache_manager._cache", SimpleCache())
+    sm = SupersetSecurityManager(appbuilder)
+    query_permission_index = mocker.spy(sm, "_query_permission_index")
+
+    datasource_access = Permission(name="datasource_access")
+    schema_access = Permission(name="schema_access")
+    role_a = Role(
+        name="a",
+        permissions=[
+            PermissionView(
+                permission=datasource_access,
+                view_menu=ViewMenu(name="[db].[t1](id:1)"),
+            ),
+            PermissionView(
+                permission=schema_access,
+                view_menu=ViewMenu(name="[db].[public]"),
+            ),
+        ],
+    )
+    role_b = Role(
+        name="b",
+        permissions=[
+            PermissionView(
+                permission=datasource_access,
+                view_menu=ViewMenu(name="[db].[t2](id:2)"),
+            ),
+        ],
+    )
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        email="adoe@example.org",
+        username="adoe",
+        roles=[role_a, role_b],
+    )
+    session.add(user)
+    session.commit()
+
+    with override_user(user):
+        assert sm.user_view_menu_names("datasource_access") == {
+            "[db].[t1](id:1)",
+            "[db].[t2](id:2)",
+        }
+        assert sm.can_access("schema_access", "[db].[public]")
+        assert not sm.can_access("schema_access", "[db].[private]")
+        assert not sm.can_access("database_access", "[db].(id:1)")
+        query_permission_index.assert_called_once()
+
+        # the index is shared across requests
+        g.pop("_permission_indexes")
+        assert sm.can_access("datasource_access", "[db].[t2](id:2)")
+        query_permission_index.assert_called_once()
+
+        role_b.permissions = []
+        session.commit()
+        assert not sm.can_access("datasource_access", "[db].[t2](id:2)")
+        assert query_permission_index.call_count == 2
+
+
+def test_permission_index_datasource_access(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that access to datasources is checked against the cached permission index,
+    which is invalidated when a dataset is renamed, but not on other changes.
+    """
+    from flask_appbuilder.security.sqla.models import Permission, PermissionView
+
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"PERMISSION_INDEX_CACHE_TIMEOUT": 60},
+    )
+    sm = SupersetSecurityManager(appbuilder)
+    query_permission_index = mocker.spy(sm, "_query_permission_index")
+    invalidate_permission_indexes = mocker.spy(
+        SupersetSecurityManager,
+        "invalidate_permission_indexes",
+    )
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    # load the engine specs, which are memoized in the cache
+    assert database.db_engine_spec
+    mocker.patch("superset.extensions.cache_manager._cache", SimpleCache())
+    t1 = SqlaTable(table_name="t1", schema="public", database=database)
+    t2 = SqlaTable(table_name="t2", schema="public", database=database)
+    session.add_all([t1, t2])
+    session.commit()
+
+    role = Role(
+        name="a",
+        permissions=[
+            session.query(PermissionView)
+            .join(Permission)
+            .filter(Permission.name == "datasource_access")
+            .filter(PermissionView.view_menu.has(name=t1.perm))
+            .one()
+        ],
+    )
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        email="adoe@example.org",
+        username="adoe",
+        roles=[role],
+    )
+    session.add(user)
+    session.commit()
+    invalidate_permission_indexes.reset_mock()
+
+    with override_user(user):
+        assert sm.can_access_datasource(t1)
+        assert not sm.can_access_datasource(t2)
+        sm.raise_for_access(datasource=t1)
+        with pytest.raises(SupersetSecurityException):
+            sm.raise_for_access(datasource=t2)
+        query_permission_index.assert_called_once()
+
+        t1.description = "The first table"
+        session.commit()
+        invalidate_permission_indexes.assert_not_called()
+
+        t1.table_name = "t3"
+        session.commit()
+        invalidate_permission_indexes.assert_called_once()
+        assert sm.can_access_datasource(t1)
+        assert query_permission_index.call_count == 2
+
+
+def test_permission_index_disabled(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that permissions are queried when the permission index is disabled.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    query_permission_index = mocker.patch.object(sm, "_query_permission_index")
+    exist_permission_on_roles = mocker.patch.object(
+        sm,
+        "exist_permission_on_roles",
+        return_value=True,
+    )
+
+    with override_user(User(id=1, username="test", roles=[Role(id=1, name="a")])):
+        assert sm.can_access("datasource_access", "[db].[t1](id:1)")
+
+    exist_permission_on_roles.assert_called_once_with(
+        "[db].[t1](id:1)",
+        "datasource_access",
+        [1],
+    )
+    query_permission_index.assert_not_called()
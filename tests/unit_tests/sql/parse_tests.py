@@ -18,6 +18,7 @@
 
 
 import pytest
+import sqlglot
 from pytest_mock import MockerFixture
 from sqlglot import Dialects, exp, parse_one
 
@@ -3070,3 +3071,36 @@ def test_backtick_invalid_sql_still_fails() -> None:
     sql = "SELECT * FROM `table` WHERE"
     with pytest.raises(SupersetParseError):
         SQLScript(sql, "base")
+
+
+def test_parse_cache(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that parsed scripts are cached, and that callers get copies of the ASTs.
+    """
+    parse = mocker.spy(sqlglot, "parse")
+    stats_logger = mocker.patch.dict(
+        "flask.current_app.config",
+        {"STATS_LOGGER": mocker.MagicMock()},
+    )["STATS_LOGGER"]
+    sql = "SELECT * FROM parse_cache_table"
+
+    statement = SQLStatement(sql, "postgresql")
+    statement.set_limit_value(10)
+    assert statement.format() == "SELECT\n  *\nFROM parse_cache_table\nLIMIT 10"
+
+    # the cached AST was not modified, and whitespace is ignored
+    statement = SQLStatement(f"  {sql}\n", "postgresql")
+    assert statement.format() == "SELECT\n  *\nFROM parse_cache_table"
+    assert statement.tables == {Table("parse_cache_table")}
+
+    # the engine is part of the key
+    SQLStatement(sql, "mysql")
+
+    assert parse.call_count == 2
+    stats_logger.incr.assert_has_calls(
+        [
+            mocker.call("sql_parse_cache.miss"),
+            mocker.call("sql_parse_cache.hit"),
+            mocker.call("sql_parse_cache.miss"),
+        ]
+    )
@@ -20,6 +20,7 @@ import json  # noqa: TID251
 from unittest.mock import MagicMock
 from uuid import UUID
 
+import pyarrow as pa
 import pytest
 from freezegun import freeze_time
 from pytest_mock import MockerFixture
@@ -51,6 +52,7 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
+    db_engine_spec.fetch_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
@@ -66,6 +68,29 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_query_arrow(mocker: MockerFixture, app: None) -> None:
+    """
+    Test `execute_sql_statement` when the engine spec fetches Arrow tables.
+    """
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT 42 AS answer"
+
+    query.limit = 1
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.fetch_arrow.return_value = pa.table({"answer": [42, 43]})
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_query(query, cursor=cursor, log_params={})
+
+    db_engine_spec.fetch_data.assert_not_called()
+    table = SupersetResultSet.call_args[0][0]
+    assert table.to_pydict() == {"answer": [42]}
+
+
 @with_config(
     {
         "SQLLAB_PAYLOAD_MAX_MB": 50,
@@ -149,3 +149,28 @@ def test_load_chart_data_into_cache_with_superset_errors_exception(
     assert errors[1]["message"] == "Table not found"
     assert errors[1]["error_type"] == SupersetErrorType.TABLE_DOES_NOT_EXIST_ERROR
     assert errors[1]["level"] == ErrorLevel.WARNING
+
+
+@mock.patch("superset.tasks.async_queries.cache_manager")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand")
+def test_refresh_chart_data_cache(
+    mock_command_cls,
+    mock_query_context_schema_cls,
+    mock_security_manager,
+    mock_cache_manager,
+):
+    """Test that stale chart data is re-queried and the refresh lock released"""
+    from superset.tasks.async_queries import refresh_chart_data_cache
+
+    mock_security_manager.get_user_by_id.return_value = mock.MagicMock()
+    mock_query_context_schema = mock_query_context_schema_cls.return_value
+
+    refresh_chart_data_cache({"user_id": 1}, {"queries": []}, "lock-key")
+
+    mock_query_context_schema.load.assert_called_once_with(
+        {"queries": [], "force": True}
+    )
+    mock_command_cls.return_value.run.assert_called_once_with()
+    mock_cache_manager.data_cache.delete.assert_called_once_with("lock-key")
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+from pytest_mock import MockerFixture
+
+from superset.tasks.cache import CacheWarmupTask
+
+
+def get_tasks(chart_ids: list[int]) -> list[CacheWarmupTask]:
+    return [
+        {"payload": {"chart_id": chart_id, "dashboard_id": 1}, "username": "admin"}
+        for chart_id in chart_ids
+    ]
+
+
+def test_warm_up_charts(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that charts are warmed up in the worker, grouped by database, and that
+    cache hits, misses and errors are reported.
+    """
+    from superset.tasks.cache import warm_up_charts
+
+    charts = [
+        mocker.MagicMock(id=chart_id, datasource=mocker.MagicMock(database_id=db_id))
+        for chart_id, db_id in [(1, 1), (2, 1), (3, 2), (4, 2)]
+    ]
+    db = mocker.patch("superset.tasks.cache.db")
+    db.session.query.return_value.filter.return_value = charts
+    mocker.patch("superset.tasks.cache.security_manager")
+    map_in_app_context = mocker.patch(
+        "superset.tasks.cache.map_in_app_context",
+        side_effect=lambda func, items, max_workers: [func(item) for item in items],
+    )
+
+    def command(chart_id: int, *args: Any, **kwargs: Any) -> Any:
+        assert kwargs == {"force": False}
+        command = mocker.MagicMock(is_cached=chart_id == 1)
+        if chart_id == 4:
+            command.run.side_effect = Exception("Error")
+        else:
+            command.run.return_value = {
+                "chart_id": chart_id,
+                "viz_error": "Error" if chart_id == 3 else None,
+                "viz_status": None,
+            }
+        return command
+
+    mocker.patch("superset.tasks.cache.ChartWarmUpCacheCommand", side_effect=command)
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {
+            "STATS_LOGGER": stats_logger,
+            "CACHE_WARMUP_MAX_DATABASES": 2,
+            "CACHE_WARMUP_MAX_WORKERS_PER_DATABASE": 3,
+        },
+    )
+
+    assert warm_up_charts(get_tasks([1, 2, 3, 4])) == {
+        "hits": [{"chart_id": 1, "dashboard_id": 1}],
+        "misses": [{"chart_id": 2, "dashboard_id": 1}],
+        "errors": [
+            {"chart_id": 3, "dashboard_id": 1},
+            {"chart_id": 4, "dashboard_id": 1},
+        ],
+    }
+
+    # databases are warmed up concurrently, and so are the charts of each of them
+    assert [call.args[2] for call in map_in_app_context.call_args_list] == [2, 3, 3]
+    assert [len(call.args[1]) for call in map_in_app_context.call_args_list] == [
+        2,
+        2,
+        2,
+    ]
+    assert [call.args[0] for call in stats_logger.incr.call_args_list] == [
+        "cache_warmup.hits",
+        "cache_warmup.misses",
+        "cache_warmup.errors",
+        "cache_warmup.errors",
+    ]
+
+
+def test_cache_warmup_in_process(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the cache warmup task runs the queries in the worker instead of
+    scheduling requests to the web server, when configured to.
+    """
+    from superset.tasks.cache import cache_warmup
+
+    mocker.patch(
+        "superset.tasks.cache.DummyStrategy.get_tasks",
+        return_value=[
+            *get_tasks([1]),
+            {"payload": {"chart_id": 2}, "username": None},
+        ],
+    )
+    warm_up_charts = mocker.patch(
+        "superset.tasks.cache.warm_up_charts",
+        return_value={
+            "hits": [{"chart_id": 1, "dashboard_id": 1}],
+            "misses": [],
+            "errors": [],
+        },
+    )
+    fetch_url = mocker.patch("superset.tasks.cache.fetch_url")
+    mocker.patch.dict("flask.current_app.config", {"CACHE_WARMUP_IN_PROCESS": True})
+
+    assert cache_warmup.run("dummy") == {
+        "hits": ['{"chart_id": 1, "dashboard_id": 1}'],
+        "misses": [],
+        "errors": [],
+    }
+    warm_up_charts.assert_called_once_with(get_tasks([1]))
+    fetch_url.delay.assert_not_called()
@@ -0,0 +1,176 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from typing import Any
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.utils.browser_pool import (
+    BrowserPool,
+    close_expired_browsers,
+    get_browser_pool,
+    shutdown_browser_pools,
+)
+
+
+@pytest.fixture
+def pool(mocker: MockerFixture, app_context: None) -> BrowserPool[Any]:
+    mocker.patch.dict("flask.current_app.config", {"STATS_LOGGER": mocker.MagicMock()})
+    return BrowserPool(
+        create=mocker.MagicMock(side_effect=lambda: mocker.MagicMock()),
+        destroy=mocker.MagicMock(),
+        health_check=mocker.MagicMock(return_value=True),
+        semaphore=threading.BoundedSemaphore(2),
+        max_usage_count=2,
+        health_check_interval=0,
+    )
+
+
+def test_reuse_browser(pool: BrowserPool[Any]) -> None:
+    """
+    Test that browsers are reused, and closed after a number of captures.
+    """
+    with pool.get_browser() as first:
+        pass
+    with pool.get_browser() as second:
+        pass
+    with pool.get_browser() as third:
+        pass
+
+    assert first is second
+    assert third is not first
+    pool._destroy.assert_called_once_with(first.browser)
+    assert pool._create.call_count == 2
+
+
+def test_close_failed_browser(pool: BrowserPool[Any]) -> None:
+    """
+    Test that a browser is closed when a capture fails or when it fails its health
+    check, and that the browsers in use are given back.
+    """
+    with pytest.raises(ValueError, match="Capture failed"):
+        with pool.get_browser() as failed:
+            raise ValueError("Capture failed")
+    pool._destroy.assert_called_once_with(failed.browser)
+
+    with pool.get_browser() as unhealthy:
+        pass
+    pool._health_check.return_value = False
+    with pool.get_browser() as healthy:
+        pass
+    assert healthy is not unhealthy
+    assert pool._destroy.call_count == 2
+
+    # every browser was given back
+    assert pool._semaphore.acquire(blocking=False)
+    assert pool._semaphore.acquire(blocking=False)
+
+
+def test_memory_exceeded(mocker: MockerFixture, pool: BrowserPool[Any]) -> None:
+    """
+    Test that browsers are recycled when the browsers of the worker use too much
+    memory.
+    """
+    get_browsers_memory = mocker.patch(
+        "superset.utils.browser_pool.get_browsers_memory",
+        return_value=200 * 2**20,
+    )
+    pool.max_memory_mb = 100
+    with pool.get_browser() as first:
+        pass
+    pool._destroy.assert_called_once_with(first.browser)
+
+    get_browsers_memory.return_value = None
+    with pool.get_browser() as second:
+        pass
+    with pool.get_browser() as third:
+        pass
+    assert second is third
+
+
+def test_close_expired(mocker: MockerFixture, pool: BrowserPool[Any]) -> None:
+    """
+    Test that idle browsers are closed once expired, when a browser is given back or
+    by the periodic check, and not only when a browser is taken from the pool.
+    """
+    now = time.time()
+    mock_time = mocker.patch("superset.utils.browser_pool.time.time", return_value=now)
+    pool.max_usage_count = 50
+    with pool.get_browser() as first:
+        with pool.get_browser() as second:
+            pass
+
+    mock_time.return_value = now + 200
+    with pool.get_browser() as third:
+        mock_time.return_value = now + 400
+    assert third is first
+    pool._destroy.assert_called_once_with(second.browser)
+
+    mock_time.return_value = now + 800
+    pool.close_expired()
+    assert pool._destroy.call_count == 2
+    assert pool._idle == []
+
+
+def test_get_browser_pool(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that browsers are only pooled when enabled, with a pool per thread.
+    """
+    create, destroy, health_check = (mocker.MagicMock() for _ in range(3))
+    assert get_browser_pool("test", create, destroy, health_check) is None
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {
+            "STATS_LOGGER": mocker.MagicMock(),
+            "WEBDRIVER_POOL": {"ENABLED": True, "MAX_USAGE_COUNT": 10},
+        },
+    )
+    pool = get_browser_pool("test", create, destroy, health_check)
+    assert pool is not None
+    assert pool.max_usage_count == 10
+    assert get_browser_pool("test", create, destroy, health_check) is pool
+
+    flask_app = current_app._get_current_object()
+    other_thread_pools = []
+
+    def get_other_thread_pool() -> None:
+        with flask_app.app_context():
+            other_thread_pools.append(
+                get_browser_pool("test", create, destroy, health_check)
+            )
+
+    thread = threading.Thread(target=get_other_thread_pool)
+    thread.start()
+    thread.join()
+    assert other_thread_pools[0] is not pool
+
+    with pool.get_browser():
+        pass
+    close_expired_browsers()
+    destroy.assert_not_called()
+    pool.max_usage_count = 1
+    close_expired_browsers()
+    destroy.assert_called_once_with(create.return_value)
+
+    with pool.get_browser():
+        pass
+    shutdown_browser_pools()
+    assert destroy.call_count == 2
@@ -16,6 +16,9 @@
 # under the License.
 
 
+from io import BytesIO
+from zipfile import ZipFile
+
 import pandas as pd
 import pyarrow as pa
 import pytest  # noqa: F401
@@ -24,7 +27,9 @@ from pandas.api.types import is_datetime64_any_dtype
 from superset.utils import csv, json
 from superset.utils.core import GenericDataType
 from superset.utils.csv import (
+    build_chart_dataframe,
     df_to_escaped_csv,
+    get_chart_csv_content,
     get_chart_dataframe,
 )
 
@@ -317,3 +322,45 @@ def test_get_chart_dataframe_preserves_na_string_values(
     last_name_values = df[("last_name",)].values
     assert last_name_values[0] == "Smith"
     assert last_name_values[1] == "NA"
+
+
+def test_get_chart_csv_content(app_context: None) -> None:
+    """
+    Test that the CSV of a single query is encoded, and that the CSV of several
+    queries is bundled in a zip file, as returned by the chart data API.
+    """
+    assert get_chart_csv_content([]) is None
+    assert get_chart_csv_content([{"data": ""}]) is None
+    assert get_chart_csv_content([{"data": "a,b\n1,2\n"}]) == "a,b\n1,2\n".encode(
+        "utf-8-sig"
+    )
+
+    content = get_chart_csv_content([{"data": "a\n1\n"}, {"data": "b\n2\n"}])
+    assert content is not None
+    with ZipFile(BytesIO(content)) as bundle:
+        assert bundle.namelist() == ["query_1.csv", "query_2.csv"]
+        assert bundle.read("query_2.csv") == "b\n2\n".encode("utf-8-sig")
+
+
+def test_build_chart_dataframe_from_query_result() -> None:
+    """
+    Test that a dataframe is built from a query result that wasn't serialized to
+    JSON, with timestamps and hierarchical columns as tuples.
+    """
+    df = build_chart_dataframe(
+        {
+            "data": {
+                "date": {0: pd.Timestamp("2023-01-01"), 1: pd.Timestamp("2023-01-02")},
+                "metric": {0: 1, 1: 2},
+            },
+            "colnames": ["date", ("metric",)],
+            "coltypes": [GenericDataType.TEMPORAL, GenericDataType.NUMERIC],
+            "indexnames": [0, 1],
+        }
+    )
+    assert df is not None
+
+    expected_columns = pd.MultiIndex.from_tuples([("date",), ("metric",)])
+    pd.testing.assert_index_equal(df.columns, expected_columns)
+    assert is_datetime64_any_dtype(df[("date",)])
+    assert df[("metric",)].tolist() == [1, 2]
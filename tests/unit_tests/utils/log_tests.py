@@ -14,9 +14,13 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
+from typing import Any
 
+from pytest_mock import MockerFixture
+from sqlalchemy.exc import OperationalError
 
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import get_logger_from_status, QueuedDBEventLogger
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +39,111 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def log_events(event_logger: QueuedDBEventLogger, action: str, count: int) -> None:
+    event_logger.log(
+        1,
+        action,
+        dashboard_id=None,
+        duration_ms=10,
+        slice_id=None,
+        referrer=None,
+        records=[{"slice_id": idx} for idx in range(count)],
+    )
+
+
+def test_queued_db_event_logger(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that logs are inserted in batches by the background writer.
+    """
+    db = mocker.patch("superset.db")
+    connection = db.engine.begin.return_value.__enter__.return_value
+    event_logger = QueuedDBEventLogger(batch_size=2, flush_interval=0.1)
+
+    log_events(event_logger, "log", 3)
+    event_logger.flush()
+
+    rows = [row for call in connection.execute.call_args_list for row in call.args[1]]
+    assert [row["slice_id"] for row in rows] == [0, 1, 2]
+    assert {row["action"] for row in rows} == {"log"}
+    assert all(len(call.args[1]) <= 2 for call in connection.execute.call_args_list)
+    assert event_logger.dropped == 0
+
+
+def test_queued_db_event_logger_drops_logs_when_full(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that logs are dropped and counted when the writer can't keep up, and that
+    the writer keeps running after an insert fails.
+    """
+    incr = mocker.patch("superset.utils.log.stats_logger_manager").instance.incr
+    db = mocker.patch("superset.db")
+    inserting = threading.Event()
+    resume = threading.Event()
+
+    def begin() -> Any:
+        inserting.set()
+        resume.wait()
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    db.engine.begin.side_effect = begin
+    event_logger = QueuedDBEventLogger(max_queue_size=1, flush_interval=0)
+
+    log_events(event_logger, "blocked", 1)
+    inserting.wait()
+    log_events(event_logger, "queued", 2)
+    assert event_logger.dropped == 1
+    incr.assert_any_call("event_logger.dropped")
+
+    db.engine.begin.side_effect = None
+    resume.set()
+    event_logger.flush()
+
+    incr.assert_any_call("event_logger.failed")
+    connection = db.engine.begin.return_value.__enter__.return_value
+    rows = connection.execute.call_args.args[1]
+    assert [row["action"] for row in rows] == ["queued"]
+
+
+def test_queued_db_event_logger_flush_timeout(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the logs are flushed for up to the exit timeout at exit, and that the
+    writer keeps running after an insert fails with any error.
+    """
+    logger = mocker.patch("superset.utils.log.logger")
+    db = mocker.patch("superset.db")
+    inserting = threading.Event()
+    resume = threading.Event()
+
+    def begin() -> Any:
+        inserting.set()
+        resume.wait()
+        raise ValueError("unexpected")
+
+    db.engine.begin.side_effect = begin
+    event_logger = QueuedDBEventLogger(flush_interval=0, exit_timeout=0.1)
+
+    log_events(event_logger, "blocked", 1)
+    inserting.wait()
+    assert not event_logger.flush(timeout=0.1)
+    event_logger._flush_at_exit()
+    logger.warning.assert_called_once_with(
+        "QueuedDBEventLogger exited before logging %i event(s)", 1
+    )
+
+    db.engine.begin.side_effect = None
+    resume.set()
+    assert event_logger.flush(timeout=5)
+    logger.exception.assert_called_once()
+
+    log_events(event_logger, "queued", 1)
+    assert event_logger.flush()
+    connection = db.engine.begin.return_value.__enter__.return_value
+    rows = connection.execute.call_args.args[1]
+    assert [row["action"] for row in rows] == ["queued"]
@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from io import BytesIO
+
+import pytest
+from PIL import Image, PdfParser
+
+from superset.commands.report.exceptions import ReportSchedulePdfFailedError
+from superset.utils.pdf import build_pdf_from_screenshots
+
+
+def get_png(color: str, mode: str = "RGB") -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, (40, 20), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_build_pdf_from_screenshots() -> None:
+    """
+    Test that a page is added for each screenshot, as the screenshots are taken.
+    """
+    taken = []
+
+    def take_screenshots() -> Iterator[bytes]:
+        for color in ["red", "green", "blue"]:
+            taken.append(color)
+            yield get_png(color, mode="RGBA" if color == "green" else "RGB")
+
+    pdf = build_pdf_from_screenshots(take_screenshots())
+
+    assert pdf.startswith(b"%PDF")
+    assert taken == ["red", "green", "blue"]
+    assert len(PdfParser.PdfParser(buf=pdf).pages) == 3
+
+
+def test_build_pdf_from_screenshots_error() -> None:
+    """
+    Test that invalid or missing screenshots raise an error.
+    """
+    with pytest.raises(ReportSchedulePdfFailedError, match="no screenshots"):
+        build_pdf_from_screenshots([])
+
+    with pytest.raises(ReportSchedulePdfFailedError, match="Failed converting"):
+        build_pdf_from_screenshots([get_png("red"), b"not an image"])
@@ -74,6 +74,26 @@ def test_get_screenshot(mocker: MockerFixture, screenshot_obj):
     assert screenshot_data == fake_bytes
 
 
+def test_get_screenshots(mocker: MockerFixture, mock_user):
+    """Several screenshots should be taken in a single webdriver session"""
+    driver = mocker.patch(BASE_SCREENSHOT_PATH + ".driver")
+    driver.return_value.get_screenshots.return_value = iter([b"first", None])
+    screenshots = [
+        BaseScreenshot("http://example.com/1", "digest"),
+        BaseScreenshot("http://example.com/2", "digest"),
+    ]
+
+    images = BaseScreenshot.get_screenshots(screenshots, mock_user)
+
+    assert next(images) == b"first"
+    assert screenshots[0].screenshot == b"first"
+    assert list(images) == [None]
+    driver.return_value.get_screenshots.assert_called_once_with(
+        ["http://example.com/1", "http://example.com/2"], "", mock_user
+    )
+    driver.return_value.get_screenshot.assert_not_called()
+
+
 def test_get_cache_key(app_context, screenshot_obj):
     """Test get_cache_key method"""
     expected_cache_key = hash_from_dict(
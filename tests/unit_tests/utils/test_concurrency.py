@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+
+import pytest
+import sqlalchemy as sa
+from flask import current_app, g, request
+from flask_appbuilder.security.sqla.models import Role, User
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from superset import db
+from superset.utils.concurrency import map_in_app_context, merge_in_session
+
+
+def test_map_in_app_context_serial(app_context: None) -> None:
+    """
+    Test that calls run in the current thread when a single worker is allowed.
+    """
+    thread_ids = map_in_app_context(lambda _: threading.get_ident(), [1, 2, 3], 1)
+
+    assert thread_ids == [threading.get_ident()] * 3
+
+
+def test_map_in_app_context_order(app_context: None) -> None:
+    """
+    Test that calls run in other threads, and results are returned in order.
+    """
+
+    def func(item: int) -> tuple[int, int]:
+        # the first items finish last
+        time.sleep(0.01 * (3 - item))
+        return item * 2, threading.get_ident()
+
+    results = map_in_app_context(func, [1, 2, 3], 3)
+
+    assert [value for value, _ in results] == [2, 4, 6]
+    assert threading.get_ident() not in {thread_id for _, thread_id in results}
+
+
+def test_map_in_app_context_g(app_context: None) -> None:
+    """
+    Test that the app context and the attributes of `g` are available in threads.
+    """
+    g.user = "admin"
+
+    results = map_in_app_context(
+        lambda _: (current_app.name, g.user),
+        [1, 2],
+        2,
+    )
+
+    assert results == [(current_app.name, "admin")] * 2
+
+
+def test_map_in_app_context_request(app_context: None) -> None:
+    """
+    Test that the request context is copied to each thread.
+    """
+    with current_app.test_request_context("/?foo=bar"):
+        g.user = "admin"
+        results = map_in_app_context(
+            lambda _: (request.args["foo"], g.user),
+            [1, 2, 3],
+            2,
+        )
+
+    assert results == [("bar", "admin")] * 3
+
+
+def test_map_in_app_context_exception(app_context: None) -> None:
+    """
+    Test that exceptions raised in threads are re-raised.
+    """
+
+    def func(item: int) -> int:
+        if item == 2:
+            raise ValueError("Invalid item")
+        return item
+
+    with pytest.raises(ValueError, match="Invalid item"):
+        map_in_app_context(func, [1, 2, 3], 2)
+
+
+def test_map_in_app_context_orm(app_context: None) -> None:
+    """
+    Test that ORM instances in `g` are copied to the database session of each thread,
+    with the attributes already loaded.
+    """
+    role = Role(id=1, name="Admin")
+    make_transient_to_detached(role)
+    user = User(id=1, username="admin")
+    make_transient_to_detached(user)
+    set_committed_value(user, "roles", [role])
+    user = db.session.merge(user, load=False)
+    g.user = user
+
+    def func(_: int) -> tuple[User, str, list[str], bool]:
+        return (
+            g.user,
+            g.user.username,
+            [role.name for role in g.user.roles],
+            sa.inspect(g.user).session is db.session(),
+        )
+
+    results = map_in_app_context(func, [1, 2], 2)
+
+    for thread_user, username, roles, in_thread_session in results:
+        assert thread_user is not user
+        assert (username, roles, in_thread_session) == ("admin", ["Admin"], True)
+    assert results[0][0] is not results[1][0]
+
+
+def test_merge_in_session(app_context: None) -> None:
+    """
+    Test that values other than persistent ORM instances are returned as is.
+    """
+    user = User(username="admin")
+
+    assert merge_in_session(user) is user
+    assert merge_in_session(None) is None
+    assert merge_in_session("admin") == "admin"
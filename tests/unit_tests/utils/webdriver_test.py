@@ -693,3 +693,105 @@ class TestWebDriverPlaywrightErrorHandling:
         assert result is None
         # Should log timeout for element wait
         assert mock_logger.exception.call_count >= 1
+
+
+class TestWebDriverSeleniumPool:
+    """Test WebDriverSelenium with pooled drivers."""
+
+    @patch("superset.utils.webdriver.machine_auth_provider_factory")
+    @patch("superset.utils.webdriver.get_browser_pool")
+    def test_acquire_clears_cookies_of_reused_driver(
+        self, mock_get_browser_pool, mock_auth_factory
+    ):
+        """Test that a reused driver is authenticated again without old cookies."""
+        mock_user = MagicMock()
+        pool = mock_get_browser_pool.return_value
+        pool.acquire.return_value.usage_count = 0
+
+        driver = WebDriverSelenium("chrome")
+        web_driver, pooled_driver = driver.acquire(mock_user)
+        assert pooled_driver is pool.acquire.return_value
+        web_driver.delete_all_cookies.assert_not_called()
+
+        pool.acquire.return_value.usage_count = 1
+        web_driver, _ = driver.acquire(mock_user)
+        web_driver.delete_all_cookies.assert_called_once()
+        mock_auth_factory.instance.authenticate_webdriver.assert_called_with(
+            web_driver, mock_user
+        )
+
+        driver.release(web_driver, pooled_driver, healthy=False)
+        pool.release.assert_called_once_with(pooled_driver, healthy=False)
+
+    @patch("superset.utils.webdriver.get_browser_pool", return_value=None)
+    def test_release_destroys_unpooled_driver(self, mock_get_browser_pool):
+        """Test that drivers are destroyed when they aren't pooled."""
+        mock_driver = MagicMock()
+        with patch("superset.utils.webdriver.app") as mock_app:
+            mock_app.config = {
+                "SCREENSHOT_LOCATE_WAIT": 10,
+                "SCREENSHOT_LOAD_WAIT": 10,
+                "SCREENSHOT_SELENIUM_RETRIES": 1,
+            }
+            driver = WebDriverSelenium("chrome")
+            driver.release(mock_driver, None, healthy=True)
+
+        mock_driver.quit.assert_called_once()
+
+
+class TestWebDriverPlaywrightMultiplePages:
+    """Test WebDriverPlaywright rendering several urls concurrently."""
+
+    @patch("superset.utils.webdriver.PLAYWRIGHT_AVAILABLE", True)
+    @patch("superset.utils.webdriver.sync_playwright")
+    @patch("superset.utils.webdriver.app")
+    def test_get_screenshots_renders_pages_concurrently(
+        self, mock_app, mock_sync_playwright
+    ):
+        """Test that pages are opened ahead, up to the limit, in a single context."""
+        mock_app.config = {
+            "WEBDRIVER_OPTION_ARGS": [],
+            "WEBDRIVER_WINDOW": {"pixel_density": 1},
+            "SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT": 30000,
+            "SCREENSHOT_PLAYWRIGHT_WAIT_EVENT": "load",
+            "SCREENSHOT_PLAYWRIGHT_MAX_PAGES": 2,
+            "SCREENSHOT_SELENIUM_HEADSTART": 0,
+            "SCREENSHOT_SELENIUM_ANIMATION_WAIT": 0,
+            "SCREENSHOT_REPLACE_UNEXPECTED_ERRORS": False,
+            "SCREENSHOT_TILED_ENABLED": False,
+            "SCREENSHOT_LOCATE_WAIT": 10,
+            "SCREENSHOT_LOAD_WAIT": 10,
+        }
+        mock_playwright = mock_sync_playwright.return_value.__enter__.return_value
+        mock_browser = mock_playwright.chromium.launch.return_value
+        mock_context = mock_browser.new_context.return_value
+        opened = []
+
+        def new_page():
+            page = MagicMock()
+            page.screenshot.return_value = f"page {len(opened)}".encode()
+            opened.append(page)
+            return page
+
+        mock_context.new_page.side_effect = new_page
+
+        with patch.object(WebDriverPlaywright, "auth"):
+            driver = WebDriverPlaywright("chrome")
+            images = driver.get_screenshots(
+                [
+                    "http://example.com/1",
+                    "http://example.com/2",
+                    "http://example.com/3",
+                ],
+                "standalone",
+                MagicMock(),
+            )
+            # the second page is loading while the first one is captured
+            assert next(images) == b"page 0"
+            assert len(opened) == 2
+            opened[0].close.assert_called_once()
+            assert list(images) == [b"page 1", b"page 2"]
+
+        mock_browser.new_context.assert_called_once()
+        mock_context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
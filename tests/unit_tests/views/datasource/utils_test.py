@@ -16,8 +16,10 @@
 # under the License.
 """Tests for superset.views.datasource.utils module."""
 
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
 
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -215,3 +217,259 @@ def test_get_samples_count_star_access_denied(mock_get_limit_clause: MagicMock):
         mock_samples_context.raise_for_access.assert_called_once()
         # Verify count context was also checked
         mock_count_context.raise_for_access.assert_called_once()
+
+
+def test_decode_cursor() -> None:
+    """
+    Test that cursors round-trip, and that invalid cursors are rejected.
+    """
+    from superset.commands.dataset.exceptions import DatasetSamplesFailedError
+    from superset.views.datasource.utils import decode_cursor, encode_cursor
+
+    assert decode_cursor("") == {"values": None, "offset": 0}
+    assert decode_cursor(encode_cursor(["b", 2], 10)) == {
+        "values": ["b", 2],
+        "offset": 10,
+    }
+    assert decode_cursor(encode_cursor(None, 10)) == {"values": None, "offset": 10}
+
+    for cursor in ("invalid", encode_cursor(["b", 2], 10)[:-4], encode_cursor("b", 1)):
+        with pytest.raises(DatasetSamplesFailedError):
+            decode_cursor(cursor)
+
+
+def test_get_key_columns(app_context: None) -> None:
+    """
+    Test that rows are ordered by the first column then the primary key, and only
+    when the table has a primary key.
+    """
+    from superset.views.datasource.utils import get_key_columns
+
+    datasource = MagicMock(is_virtual=False)
+    datasource.columns = [
+        MagicMock(column_name="name"),
+        MagicMock(column_name="id"),
+        MagicMock(column_name="ds"),
+    ]
+    get_pk_constraint = datasource.database.get_pk_constraint
+
+    get_pk_constraint.return_value = {"constrained_columns": ["ds", "id"]}
+    assert get_key_columns(datasource) == ["name", "ds", "id"]
+
+    get_pk_constraint.return_value = {"constrained_columns": ["name"]}
+    assert get_key_columns(datasource) == ["name"]
+
+    # no primary key, or one that isn't part of the dataset
+    for pk_constraint in ({}, {"constrained_columns": ["other"]}):
+        get_pk_constraint.return_value = pk_constraint
+        assert get_key_columns(datasource) is None
+
+    get_pk_constraint.side_effect = Exception("Not supported")
+    assert get_key_columns(datasource) is None
+
+    datasource.is_virtual = True
+    assert get_key_columns(datasource) is None
+
+
+def test_get_key_columns_cached(app_context: None) -> None:
+    """
+    Test that the primary key of a table is read from the cache when it's there.
+    """
+    from superset.extensions import cache_manager
+    from superset.views.datasource.utils import get_key_columns
+
+    datasource = MagicMock(
+        is_virtual=False,
+        table_name="t",
+        schema="public",
+        catalog=None,
+    )
+    datasource.database.id = 1
+    datasource.columns = [MagicMock(column_name="name"), MagicMock(column_name="id")]
+
+    with patch.object(cache_manager.cache, "get", return_value=["id"]) as get:
+        assert get_key_columns(datasource) == ["name", "id"]
+
+    get.assert_called_once_with("db:1:catalog:None:schema:public:table:t:pk_columns")
+    datasource.database.get_pk_constraint.assert_not_called()
+
+
+def test_get_keyset_clauses(app_context: None) -> None:
+    """
+    Test that the rows after a position are split into ranges, with the rows whose
+    order column is NULL last.
+    """
+    from superset.commands.dataset.exceptions import DatasetSamplesFailedError
+    from superset.views.datasource.utils import get_keyset_clauses
+
+    orderby = [("name", True), ("a", True), ("b", True)]
+    is_null = {"col": "name", "op": "IS NULL"}
+
+    # first page
+    assert get_keyset_clauses(
+        ["name", "a", "b"],
+        {"values": None, "offset": 0},
+        per_page=5,
+    ) == [
+        {
+            "row_offset": 0,
+            "row_limit": 5,
+            "orderby": orderby,
+            "filters": [{"col": "name", "op": "IS NOT NULL"}],
+        },
+        {"row_offset": 0, "row_limit": 5, "orderby": orderby, "filters": [is_null]},
+    ]
+
+    # (name, a, b) > ("x", 1, 2)
+    assert [
+        clause["filters"]
+        for clause in get_keyset_clauses(
+            ["name", "a", "b"],
+            {"values": ["x", 1, 2], "offset": 5},
+            per_page=5,
+        )
+    ] == [
+        [
+            {"col": "name", "op": "==", "val": "x"},
+            {"col": "a", "op": "==", "val": 1},
+            {"col": "b", "op": ">", "val": 2},
+        ],
+        [{"col": "name", "op": "==", "val": "x"}, {"col": "a", "op": ">", "val": 1}],
+        [{"col": "name", "op": ">", "val": "x"}],
+        [is_null],
+    ]
+
+    # the previous page ended in the rows whose order column is NULL
+    assert [
+        clause["filters"]
+        for clause in get_keyset_clauses(
+            ["name", "a", "b"],
+            {"values": [None, 1, 2], "offset": 5},
+            per_page=5,
+        )
+    ] == [
+        [
+            is_null,
+            {"col": "a", "op": "==", "val": 1},
+            {"col": "b", "op": ">", "val": 2},
+        ],
+        [is_null, {"col": "a", "op": ">", "val": 1}],
+    ]
+
+    # without a unique key, pages start at their offset
+    assert get_keyset_clauses(None, {"values": None, "offset": 10}, per_page=5) == [
+        {"row_offset": 10, "row_limit": 5, "filters": []}
+    ]
+
+    for key_columns in (None, ["name"]):
+        with pytest.raises(DatasetSamplesFailedError):
+            get_keyset_clauses(
+                key_columns,
+                {"values": ["x", 1], "offset": 5},
+                per_page=5,
+            )
+
+
+def test_paginate_samples() -> None:
+    """
+    Test that the next cursor holds the key of the last row of a full page.
+    """
+    from superset.views.datasource.utils import decode_cursor, paginate_samples
+
+    rows = [{"name": name, "id": index} for index, name in enumerate("abbcc")]
+    sample_data = {"data": rows}
+    paginate_samples(sample_data, ["name", "id"], decode_cursor(""), per_page=4)
+    assert sample_data["data"] == rows[:4]
+    assert sample_data["rowcount"] == 4
+    assert decode_cursor(sample_data["next_cursor"]) == {
+        "values": ["c", 3],
+        "offset": 4,
+    }
+
+    # timestamps keep their microseconds
+    sample_data = {"data": [{"ds": pd.Timestamp("2024-01-01 00:00:00.000123")}]}
+    paginate_samples(sample_data, ["ds"], decode_cursor(""), per_page=1)
+    assert decode_cursor(sample_data["next_cursor"]) == {
+        "values": ["2024-01-01 00:00:00.000123"],
+        "offset": 1,
+    }
+
+    # without a unique key, the cursor only holds the offset
+    sample_data = {"data": rows}
+    paginate_samples(sample_data, None, {"values": None, "offset": 4}, per_page=4)
+    assert decode_cursor(sample_data["next_cursor"]) == {"values": None, "offset": 8}
+
+    # the last page has no cursor
+    sample_data = {"data": rows[4:]}
+    paginate_samples(sample_data, ["name", "id"], {"values": None, "offset": 4}, 4)
+    assert sample_data["rowcount"] == 1
+    assert sample_data["next_cursor"] is None
+
+
+def test_get_samples_cursor(app_context: None) -> None:
+    """
+    Test that the ranges of rows after a cursor are queried until the page is full.
+    """
+    from superset.views.datasource.utils import (
+        decode_cursor,
+        encode_cursor,
+        get_samples,
+    )
+
+    datasource = MagicMock(type="table", id=1, is_virtual=False)
+    datasource.columns = [MagicMock(column_name="name"), MagicMock(column_name="id")]
+    datasource.database.get_pk_constraint.return_value = {"constrained_columns": ["id"]}
+
+    def get_context(rows: list[dict[str, Any]]) -> MagicMock:
+        context = MagicMock()
+        context.get_payload.return_value = {"queries": [{"data": rows}]}
+        return context
+
+    same_name = get_context([{"name": "x", "id": 3}])
+    greater_name = get_context([{"name": "y", "id": 1}, {"name": "z", "id": 2}])
+    null_name = get_context([{"name": None, "id": 4}])
+    count = MagicMock()
+    count.get_payload.return_value = {"queries": [{"data": [{"COUNT(*)": 10}]}]}
+
+    with (
+        patch(
+            "superset.views.datasource.utils.DatasourceDAO.get_datasource",
+            return_value=datasource,
+        ),
+        patch("superset.views.datasource.utils.QueryContextFactory") as factory,
+    ):
+        factory.return_value.create.side_effect = [
+            same_name,
+            greater_name,
+            null_name,
+            count,
+        ]
+
+        result = get_samples(
+            "table",
+            1,
+            per_page=3,
+            payload={"filters": [{"col": "id", "op": "!=", "val": 5}]},
+            cursor=encode_cursor(["x", 2], 3),
+        )
+
+    assert result["data"] == [
+        {"name": "x", "id": 3},
+        {"name": "y", "id": 1},
+        {"name": "z", "id": 2},
+    ]
+    assert decode_cursor(result["next_cursor"]) == {"values": ["z", 2], "offset": 6}
+    null_name.get_payload.assert_not_called()
+
+    queries = [
+        call.kwargs["queries"][0] for call in factory.return_value.create.call_args_list
+    ]
+    assert queries[0]["orderby"] == [("name", True), ("id", True)]
+    assert factory.return_value.create.call_args_list[0].kwargs["form_data"] == {
+        "cursor_pagination": True
+    }
+    assert queries[0]["filters"] == [
+        {"col": "id", "op": "!=", "val": 5},
+        {"col": "name", "op": "==", "val": "x"},
+        {"col": "id", "op": ">", "val": 2},
+    ]
@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+from superset.views.utils import build_native_filter_defaults
+
+
+def native_filter(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "id": "NATIVE_FILTER-1",
+        "targets": [{"datasetId": 1, "column": {"name": "country"}}],
+        "defaultDataMask": {
+            "extraFormData": {
+                "filters": [{"col": "country", "op": "IN", "val": ["US"]}]
+            },
+        },
+        "scope": {"rootPath": ["ROOT_ID"], "excluded": []},
+        **kwargs,
+    }
+
+
+def test_build_native_filter_defaults() -> None:
+    """
+    Test that the defaults of native filters apply to the charts in their scope
+    that query the dataset they target.
+    """
+    default = [{"col": "country", "op": "IN", "val": ["US"]}]
+
+    assert build_native_filter_defaults([native_filter()], 10, 1) == default
+    assert build_native_filter_defaults([native_filter()], 10, 2) == []
+    assert (
+        build_native_filter_defaults(
+            [native_filter(scope={"rootPath": ["ROOT_ID"], "excluded": [10]})], 10, 1
+        )
+        == []
+    )
+    assert build_native_filter_defaults(
+        [native_filter(chartsInScope=[10, 11])], 10, 1
+    ) == (default)
+    assert (
+        build_native_filter_defaults([native_filter(chartsInScope=[11])], 10, 1) == []
+    )
+    assert (
+        build_native_filter_defaults([native_filter(defaultDataMask={})], 10, 1) == []
+    )